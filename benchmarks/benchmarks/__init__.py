@@ -0,0 +1,5 @@
+"""Benchmarks for FURY, run with airspeed velocity (asv).
+
+Run ``asv run`` from the ``benchmarks`` directory, or ``asv dev`` to run
+them once against the current checkout.
+"""
@@ -0,0 +1,72 @@
+"""Benchmarks for keyframe lookup and interpolation."""
+
+import numpy as np
+
+from fury import actor
+from fury.animation import Animation, BatchAnimation
+from fury.animation.interpolator import (
+    cubic_bezier_interpolator,
+    linear_interpolator,
+    spline_interpolator,
+)
+
+
+class BenchInterpolators:
+    params = [10, 5_000]
+    param_names = ["n_keyframes"]
+
+    def setup(self, n_keyframes):
+        rng = np.random.default_rng(42)
+        self.keyframes = {
+            float(t): {"value": rng.random(3)} for t in range(n_keyframes)
+        }
+        self.linear = linear_interpolator(self.keyframes)
+        self.bezier = cubic_bezier_interpolator(self.keyframes)
+        self.spline = spline_interpolator(self.keyframes, degree=3)
+        # Playback: small steps, mostly inside the same keyframe interval.
+        self.frames = np.linspace(0, n_keyframes - 1, 1_000)
+
+    def time_linear_per_frame(self, n_keyframes):
+        for t in self.frames:
+            self.linear(t)
+
+    def time_bezier_per_frame(self, n_keyframes):
+        for t in self.frames:
+            self.bezier(t)
+
+    def time_spline_per_frame(self, n_keyframes):
+        for t in self.frames:
+            self.spline(t)
+
+    def time_linear_curve(self, n_keyframes):
+        self.linear(self.frames)
+
+    def time_spline_curve(self, n_keyframes):
+        self.spline(self.frames)
+
+
+class BenchBatchAnimation:
+    params = [100, 2_000]
+    param_names = ["n_instances"]
+
+    def setup(self, n_instances):
+        rng = np.random.default_rng(42)
+        centers = rng.random((n_instances, 3))
+        self.batch = BatchAnimation(actor.box(centers), centers)
+        self.animations = []
+        for t in range(3):
+            self.batch.set_position(t, rng.random((n_instances, 3)))
+            self.batch.set_rotation(t, rng.random((n_instances, 3)) * 90)
+        for center in centers:
+            anim = Animation(actor.box(center[None]))
+            for t in range(3):
+                anim.set_position(t, rng.random(3))
+                anim.set_rotation(t, rng.random(3) * 90)
+            self.animations.append(anim)
+
+    def time_batch_update(self, n_instances):
+        self.batch.update_animation(time=1.5)
+
+    def time_per_animation_update(self, n_instances):
+        for anim in self.animations:
+            anim.update_animation(time=1.5)
@@ -0,0 +1,28 @@
+"""Benchmarks for extracting the surfaces of a parcellation."""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from fury import actor
+
+
+class BenchContourFromLabel:
+    params = [[20, 180], [1, 4]]
+    param_names = ["n_labels", "n_workers"]
+    timeout = 300
+
+    def setup(self, n_labels, n_workers):
+        rng = np.random.default_rng(42)
+        shape = (128, 128, 96)
+        seeds = rng.random((n_labels, 3)) * shape
+        voxels = np.indices(shape).reshape(3, -1).T
+        labels = cKDTree(seeds).query(voxels)[1] + 1
+        self.data = labels.reshape(shape).astype(np.int32)
+        self.data[:10] = 0
+        self.affine = np.diag([1.0, 1.0, 1.2, 1.0])
+
+    def time_contour_from_label(self, n_labels, n_workers):
+        surface = actor.contour_from_label(
+            self.data, affine=self.affine, n_workers=n_workers
+        )
+        surface.GetMapper().Update()
@@ -0,0 +1,44 @@
+"""Benchmarks for the per-call overhead of FURY decorators."""
+
+import numpy as np
+
+from fury.animation.helpers import get_next_timestamp, get_previous_timestamp
+from fury.decorators import warn_on_args_to_kwargs
+from fury.utils import numpy_to_vtk_cells
+
+
+def _func(a, b, *, c, d=4, e=5):
+    return a
+
+
+_decorated = warn_on_args_to_kwargs()(_func)
+
+
+class BenchWarnOnArgsToKwargs:
+    def setup(self):
+        self.timestamps = np.linspace(0, 10, 5)
+
+    def time_undecorated(self):
+        for _ in range(1000):
+            _func(1, 2, c=3)
+
+    def time_decorated_kwargs(self):
+        for _ in range(1000):
+            _decorated(1, 2, c=3)
+
+    def time_decorated_positional(self):
+        for _ in range(1000):
+            _decorated(1, 2, 3)
+
+    def time_get_previous_timestamp(self):
+        for t in range(1000):
+            get_previous_timestamp(self.timestamps, t % 10, include_last=True)
+
+    def time_get_next_timestamp(self):
+        for t in range(1000):
+            get_next_timestamp(self.timestamps, t % 10, include_first=True)
+
+    def time_numpy_to_vtk_cells(self):
+        triangles = np.array([[0, 1, 2]])
+        for _ in range(1000):
+            numpy_to_vtk_cells(triangles, is_coords=False)
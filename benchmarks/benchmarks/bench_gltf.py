@@ -0,0 +1,111 @@
+"""Benchmarks for the glTF importer and exporter."""
+
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from fury.gltf import export_scene, glTF
+
+
+def _per_vertex_skinning(gltf_obj, vertices, joint_matrices, actor_index=0):
+    """Reference implementation looping over the vertices in Python."""
+    clone = np.copy(vertices)
+    weights = gltf_obj.weights_0[actor_index]
+    joints = gltf_obj.joints_0[actor_index]
+    for i, xyz in enumerate(clone):
+        a_joint = [gltf_obj.bones[j] for j in joints[i]]
+        a_weight = weights[i]
+        skin_mat = sum(w * joint_matrices[j] for w, j in zip(a_weight, a_joint))
+        clone[i] = np.dot(skin_mat, np.append(xyz, [1.0]))[:3]
+    return clone
+
+
+class BenchSkinning:
+    params = [1_000, 50_000]
+    param_names = ["n_vertices"]
+
+    def setup(self, n_vertices):
+        rng = np.random.default_rng(42)
+        n_bones = 32
+        self.gltf_obj = glTF.__new__(glTF)
+        self.gltf_obj.bones = list(range(n_bones))
+        self.gltf_obj.joints_0 = [
+            rng.integers(0, n_bones, (n_vertices, 4)).astype(np.uint16)
+        ]
+        weights = rng.random((n_vertices, 4)).astype(np.float32)
+        self.gltf_obj.weights_0 = [weights / weights.sum(axis=1, keepdims=True)]
+        self.joint_matrices = {}
+        for bone in self.gltf_obj.bones:
+            self.joint_matrices[bone] = np.identity(4)
+            self.joint_matrices[bone][:3] = rng.random((3, 4))
+        self.vertices = rng.random((n_vertices, 3)).astype(np.float32)
+        self.out = np.empty_like(self.vertices)
+        self.transform_mat = np.identity(4)
+
+    def time_skin_vertices(self, n_vertices):
+        bone_matrices = self.gltf_obj.get_bone_matrices(self.joint_matrices)
+        self.gltf_obj.skin_vertices(
+            self.vertices,
+            bone_matrices,
+            transform_mat=self.transform_mat,
+            out=self.out,
+        )
+
+    def time_per_vertex_skinning(self, n_vertices):
+        _per_vertex_skinning(self.gltf_obj, self.vertices, self.joint_matrices)
+
+
+class BenchLoad:
+    params = [
+        ("Duck", "glTF"),
+        ("CesiumMilkTruck", "glTF-Embedded"),
+        ("CesiumMan", "glTF-Binary"),
+    ]
+    param_names = ["model"]
+    timeout = 300
+
+    def setup_cache(self):
+        from fury.data import fetch_gltf
+
+        for name, mode in self.params:
+            fetch_gltf(name=name, mode=mode)
+
+    def setup(self, model):
+        from fury.data import read_viz_gltf
+
+        self.fname = read_viz_gltf(model[0], mode=model[1])
+
+    def time_load(self, model):
+        glTF(self.fname)
+
+    def peakmem_load(self, model):
+        glTF(self.fname)
+
+
+class BenchExport:
+    params = [[100, 1_000, 10_000], [".gltf", ".glb"]]
+    param_names = ["n_actors", "extension"]
+    timeout = 600
+
+    def setup(self, n_actors, extension):
+        from fury import actor, window
+
+        rng = np.random.default_rng(42)
+        self.scene = window.Scene()
+        for i in range(n_actors):
+            if i % 2:
+                glyph = actor.box(np.zeros((1, 3)), colors=(1, 0, 0))
+            else:
+                glyph = actor.sphere(np.zeros((1, 3)), colors=(0, 1, 0))
+            glyph.SetPosition(*rng.random(3) * 100)
+            self.scene.add(glyph)
+        self.tmpdir = TemporaryDirectory()
+
+    def teardown(self, n_actors, extension):
+        self.tmpdir.cleanup()
+
+    def time_export_scene(self, n_actors, extension):
+        export_scene(
+            self.scene, filename=os.path.join(self.tmpdir.name, "s" + extension)
+        )
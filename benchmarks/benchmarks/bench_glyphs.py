@@ -0,0 +1,69 @@
+"""Benchmarks comparing instanced and expanded glyph actors.
+
+The rendering benchmarks need an OpenGL context, offscreen Mesa is enough
+(e.g. ``VTK_DEFAULT_OPENGL_WINDOW=vtkOSOpenGLRenderWindow``).
+"""
+
+import numpy as np
+
+from fury import actor, window
+from fury.lib import RenderWindow
+
+
+def _glyph_actor(mode, centers, directions, colors, scales):
+    if mode == "instanced":
+        return actor.instanced_glyphs(
+            centers,
+            geometry="box",
+            directions=directions,
+            colors=colors,
+            scales=scales,
+        )
+    return actor.box(centers, directions=directions, colors=colors, scales=scales)
+
+
+class BenchGlyphs:
+    params = [[10_000, 100_000, 1_000_000], ["instanced", "expanded"]]
+    param_names = ["n_glyphs", "mode"]
+    timeout = 300
+
+    def setup(self, n_glyphs, mode):
+        rng = np.random.default_rng(42)
+        self.centers = rng.random((n_glyphs, 3)) * 100
+        self.directions = rng.random((n_glyphs, 3)) - 0.5
+        self.colors = rng.random((n_glyphs, 3))
+        self.scales = rng.random(n_glyphs)
+
+    def time_create(self, n_glyphs, mode):
+        _glyph_actor(mode, self.centers, self.directions, self.colors, self.scales)
+
+    def peakmem_create(self, n_glyphs, mode):
+        _glyph_actor(mode, self.centers, self.directions, self.colors, self.scales)
+
+
+class BenchGlyphsRender:
+    params = BenchGlyphs.params
+    param_names = BenchGlyphs.param_names
+    timeout = 300
+
+    def setup(self, n_glyphs, mode):
+        BenchGlyphs.setup(self, n_glyphs, mode)
+        self.glyph_actor = _glyph_actor(
+            mode, self.centers, self.directions, self.colors, self.scales
+        )
+        self.scene = window.Scene()
+        self.scene.add(self.glyph_actor)
+        self.scene.reset_camera()
+        self.render_window = RenderWindow()
+        self.render_window.SetOffScreenRendering(True)
+        self.render_window.SetSize(800, 600)
+        self.render_window.AddRenderer(self.scene)
+        # The first frame uploads the geometry to the GPU.
+        self.render_window.Render()
+
+    def teardown(self, n_glyphs, mode):
+        self.render_window.Finalize()
+
+    def time_render_frame(self, n_glyphs, mode):
+        self.scene.azimuth(1)
+        self.render_window.Render()
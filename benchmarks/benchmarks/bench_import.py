@@ -0,0 +1,10 @@
+"""Benchmarks for the startup time of FURY modules."""
+
+
+class BenchImport:
+    params = ["fury", "fury.actor", "fury.window", "fury.ui"]
+    param_names = ["module"]
+
+    def timeraw_import(self, module):
+        # timeraw_ benchmarks run in a fresh interpreter, so nothing is cached.
+        return f"import {module}"
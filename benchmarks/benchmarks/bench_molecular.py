@@ -0,0 +1,109 @@
+"""Benchmarks for the molecular representations of large proteins."""
+
+import os
+import tempfile
+
+import numpy as np
+
+from fury import molecular
+
+# Backbone and side chain atoms of a residue, with their atomic numbers
+_RESIDUE_ATOMS = ["N", "CA", "C", "O", "CB", "CG", "CD", "NE"]
+_RESIDUE_ELEMENTS = [7, 6, 6, 8, 6, 6, 6, 7]
+
+
+def synthetic_protein(n_atoms, *, residues_per_chain=500, structure_length=10):
+    """Build a protein made of straight chains of identical residues.
+
+    Every other run of `structure_length` residues is a helix or a sheet.
+    """
+    n_residues = n_atoms // len(_RESIDUE_ATOMS)
+    n_atoms = n_residues * len(_RESIDUE_ATOMS)
+    residue_ids = np.arange(n_residues)
+    chain_ids = residue_ids // residues_per_chain
+    residue_seq = residue_ids % residues_per_chain + 1
+
+    rng = np.random.default_rng(42)
+    coords = np.repeat(
+        np.column_stack([3.8 * residue_seq, 10.0 * chain_ids, np.zeros(n_residues)]),
+        len(_RESIDUE_ATOMS),
+        axis=0,
+    )
+    coords += rng.random((n_atoms, 3))
+
+    starts = np.arange(1, residues_per_chain, 2 * structure_length)
+    chains = np.unique(chain_ids)
+    ranges = np.zeros((len(chains) * len(starts), 4), dtype=int)
+    ranges[:, 0] = np.repeat(chains, len(starts))
+    ranges[:, 1] = np.tile(starts, len(chains))
+    ranges[:, 2] = ranges[:, 0]
+    ranges[:, 3] = ranges[:, 1] + structure_length - 1
+
+    return molecular.Molecule(
+        atomic_numbers=np.tile(_RESIDUE_ELEMENTS, n_residues),
+        coords=coords,
+        atom_names=np.tile(_RESIDUE_ATOMS, n_residues),
+        model=np.ones(n_atoms, dtype=int),
+        residue_seq=np.repeat(residue_seq, len(_RESIDUE_ATOMS)),
+        chain=np.repeat(chain_ids + ord("A"), len(_RESIDUE_ATOMS)),
+        sheet=ranges[1::2],
+        helix=ranges[::2],
+        is_hetatm=np.zeros(n_atoms, dtype=bool),
+    )
+
+
+class BenchRibbon:
+    params = [10_000, 1_000_000]
+    param_names = ["n_atoms"]
+    timeout = 600
+
+    def setup(self, n_atoms):
+        self.molecule = synthetic_protein(n_atoms)
+
+    def time_ribbon(self, n_atoms):
+        molecular.ribbon(self.molecule)
+
+
+class BenchComputeBonding:
+    params = [[10_000, 500_000], [False, True]]
+    param_names = ["n_atoms", "periodic"]
+    timeout = 600
+
+    def setup(self, n_atoms, periodic):
+        protein = synthetic_protein(n_atoms)
+        self.atomic_numbers = molecular.get_all_atomic_numbers(protein)
+        self.coords = molecular.get_all_atomic_positions(protein)
+        self.box = self.coords.max(axis=0) + 1 if periodic else None
+
+    def time_compute_bonding(self, n_atoms, periodic):
+        molecule = molecular.Molecule(
+            atomic_numbers=self.atomic_numbers, coords=self.coords
+        )
+        molecular.compute_bonding(molecule, box=self.box)
+
+
+class BenchTrajectory:
+    params = [100_000]
+    param_names = ["n_atoms"]
+    n_frames = 50
+
+    def setup(self, n_atoms):
+        self.molecule = synthetic_protein(n_atoms)
+        self.actor = molecular.sphere_cpk(self.molecule)
+        coords = molecular.get_all_atomic_positions(self.molecule)
+        rng = np.random.default_rng(0)
+        frames = coords + rng.normal(0, 0.1, (self.n_frames, *coords.shape))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tmpdir.name, "trajectory.npy")
+        np.save(self.fname, frames.astype(np.float32))
+
+    def teardown(self, n_atoms):
+        self.tmpdir.cleanup()
+
+    def time_play(self, n_atoms):
+        trajectory = molecular.Trajectory(
+            self.molecule, self.fname, actors=self.actor, loop=False
+        )
+        for frame in range(self.n_frames):
+            trajectory.set_frame(frame)
+        trajectory.close()
@@ -0,0 +1,51 @@
+"""Benchmarks for scrolling through the slices of an ODF field."""
+
+import numpy as np
+
+from fury import actor
+
+
+class BenchOdfSlicer:
+    params = [0, 8]
+    param_names = ["cache_size"]
+
+    def setup(self, cache_size):
+        rng = np.random.default_rng(42)
+        n_coeffs = 45
+        self.odfs = rng.random((60, 60, 40, n_coeffs))
+        self.B = rng.random((n_coeffs, 100))
+        self.odf_actor = actor.odf_slicer(
+            self.odfs, B_matrix=self.B, cache_size=cache_size
+        )
+
+    def time_scroll_back_and_forth(self, cache_size):
+        for z in [18, 19, 20, 21, 20, 19, 18, 19, 20, 21]:
+            self.odf_actor.display(z=z)
+
+
+class BenchOdfSlicerBuild:
+    params = ([None, 2**26], [1, 4])
+    param_names = ["memory_budget", "n_workers"]
+
+    def setup(self, memory_budget, n_workers):
+        rng = np.random.default_rng(42)
+        n_coeffs = 45
+        self.odfs = rng.random((60, 60, 40, n_coeffs))
+        self.B = rng.random((n_coeffs, 100))
+
+    def _build(self, memory_budget, n_workers):
+        odf_actor = actor.odf_slicer(
+            self.odfs,
+            B_matrix=self.B,
+            mask=np.ones(self.odfs.shape[:3], dtype=bool),
+            colormap="plasma",
+            memory_budget=memory_budget,
+            n_workers=n_workers,
+        )
+        odf_actor.display_extent(0, 59, 0, 59, 0, 39)
+
+    def time_build(self, memory_budget, n_workers):
+        self._build(memory_budget, n_workers)
+
+    def peakmem_build(self, memory_budget, n_workers):
+        self._build(memory_budget, n_workers)
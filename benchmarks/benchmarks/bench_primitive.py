@@ -0,0 +1,42 @@
+"""Benchmarks for repeating primitives at many glyph positions."""
+
+import numpy as np
+
+import fury.primitive as fp
+
+
+class BenchRepeatPrimitive:
+    params = [[1_000, 10_000, 100_000, 1_000_000], ["per_instance", "single"]]
+    param_names = ["n_instances", "directions"]
+    timeout = 120
+
+    def setup(self, n_instances, directions):
+        rng = np.random.default_rng(42)
+        self.vertices, self.faces = fp.prim_box()
+        self.centers = rng.random((n_instances, 3)) * 100
+        self.colors = rng.random((n_instances, 3))
+        self.scales = rng.random(n_instances)
+        if directions == "single":
+            self.directions = (0, 1, 0)
+        else:
+            self.directions = rng.random((n_instances, 3)) - 0.5
+
+    def time_repeat_primitive(self, n_instances, directions):
+        fp.repeat_primitive(
+            self.vertices,
+            self.faces,
+            self.centers,
+            directions=self.directions,
+            colors=self.colors,
+            scales=self.scales,
+        )
+
+    def peakmem_repeat_primitive(self, n_instances, directions):
+        fp.repeat_primitive(
+            self.vertices,
+            self.faces,
+            self.centers,
+            directions=self.directions,
+            colors=self.colors,
+            scales=self.scales,
+        )
@@ -0,0 +1,34 @@
+"""Benchmarks for writing rendered frames into the stream buffers."""
+
+import numpy as np
+
+from fury.stream.tools import RawArrayImageBufferManager
+
+
+class BenchWriteFrames:
+    params = [False, True]
+    param_names = ["skip_unchanged"]
+
+    def setup(self, skip_unchanged):
+        self.width, self.height = 1920, 1080
+        self.img_manager = RawArrayImageBufferManager(
+            max_window_size=(self.width, self.height), skip_unchanged=skip_unchanged
+        )
+        rng = np.random.default_rng(42)
+        frame = rng.integers(0, 255, size=(self.height, self.width, 3), dtype=np.uint8)
+        # Only a small widget changes between frames.
+        self.frames = []
+        for i in range(10):
+            frame = frame.copy()
+            frame[20:50, 20 + i : 120 + i] = 255 * (i % 2)
+            self.frames.append(frame.ravel())
+        for frame in self.frames[:2]:
+            self.img_manager.write_into(self.width, self.height, frame)
+
+    def time_write_changed(self, skip_unchanged):
+        for frame in self.frames:
+            self.img_manager.write_into(self.width, self.height, frame)
+
+    def time_write_unchanged(self, skip_unchanged):
+        for _ in range(10):
+            self.img_manager.write_into(self.width, self.height, self.frames[-1])
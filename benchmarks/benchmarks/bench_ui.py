@@ -0,0 +1,33 @@
+"""Benchmarks for UI elements holding many items."""
+
+from fury import ui, window
+
+
+class BenchListBox:
+    params = [1_000, 100_000]
+    param_names = ["n_values"]
+
+    def setup(self, n_values):
+        values = [f"bundle_{i:06d}_arcuate_fasciculus.trk" for i in range(n_values)]
+        self.listbox = ui.ListBox2D(values=values, size=(300, 600))
+        self.show_manager = window.ShowManager(size=(600, 600))
+        self.show_manager.scene.add(self.listbox)
+        # Select the first half of the values.
+        self.listbox.select(self.listbox.slots[0])
+        self.listbox.view_offset = n_values // 2
+        self.listbox.update()
+        self.listbox.select(self.listbox.slots[0], range_select=True)
+
+    def time_scroll(self, n_values):
+        for _ in range(100):
+            self.listbox.view_offset += 1
+            self.listbox.update()
+
+    def time_select(self, n_values):
+        for slot in self.listbox.slots:
+            self.listbox.select(slot, multiselect=True)
+
+    def time_range_select(self, n_values):
+        self.listbox.view_offset = n_values - self.listbox.nb_slots
+        self.listbox.update()
+        self.listbox.select(self.listbox.slots[-1], range_select=True)
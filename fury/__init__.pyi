@@ -264,6 +264,7 @@ from .material import (
 from .molecular import (
     Molecule as Molecule,
     PTable as PTable,
+    Trajectory as Trajectory,
     add_atom as add_atom,
     add_bond as add_bond,
     ball_stick as ball_stick,
@@ -1,5 +1,6 @@
 """Module that provide actors to render."""
 
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 import os
 import warnings
@@ -7,6 +8,7 @@ import warnings
 import numpy as np
 
 from fury import layout as lyt
+from fury.actors.glyph import InstancedGlyphActor
 from fury.actors.odf import sh_odf
 from fury.actors.odf_slicer import OdfSlicerActor
 from fury.actors.peak import PeakActor
@@ -22,7 +24,6 @@ from fury.lib import (
     VTK_UNSIGNED_CHAR,
     Actor,
     ArrowSource,
-    Assembly,
     ButterflySubdivisionFilter,
     CellArray,
     CellPicker,
@@ -77,11 +78,14 @@ from fury.utils import (
     color_check,
     fix_winding_order,
     get_actor_from_primitive,
+    get_polydata_triangles,
+    get_polydata_vertices,
     lines_to_vtk_polydata,
     numpy_to_vtk_colors,
     repeat_sources,
     rgb_to_vtk,
     set_input,
+    set_polydata_colors,
     set_polydata_primitives_count,
     set_polydata_triangles,
     set_polydata_vertices,
@@ -552,8 +556,42 @@ def contour_from_roi(data, *, affine=None, color=None, opacity=1):
     return skin_actor
 
 
+def _contour_label(roi, origin):
+    """Extract the surface of a binary sub-volume.
+
+    Parameters
+    ----------
+    roi : ndarray, shape (X, Y, Z)
+        Binary sub-volume of a label.
+    origin : sequence of int
+        Voxel coordinates of the first voxel of `roi`.
+
+    Returns
+    -------
+    vertices : ndarray, shape (N, 3)
+        Surface vertices in voxel coordinates.
+    triangles : ndarray, shape (M, 3)
+        Surface triangles.
+
+    """
+    # Same isovalue as contour_from_roi on a volume scaled to [0, 255]
+    vol = np.ravel(roi.astype(np.uint8) * 255, order="F")
+
+    im = ImageData()
+    im.SetDimensions(*roi.shape)
+    im.SetOrigin(*origin)
+    im.GetPointData().SetScalars(numpy_support.numpy_to_vtk(vol, deep=0))
+
+    extractor = ContourFilter()
+    extractor.SetInputData(im)
+    extractor.SetValue(0, 1)
+    extractor.Update()
+    surface = extractor.GetOutput()
+    return get_polydata_vertices(surface), get_polydata_triangles(surface)
+
+
 @warn_on_args_to_kwargs()
-def contour_from_label(data, *, affine=None, color=None):
+def contour_from_label(data, *, affine=None, color=None, n_workers=1):
     """Generate surface actor from a labeled Array.
 
     The color and opacity of individual surfaces can be customized.
@@ -569,40 +607,98 @@ def contour_from_label(data, *, affine=None, color=None):
         RGB/RGBA values in [0,1]. Default is None.
         If None then random colors are used.
         Alpha channel is set to 1 by default.
+    n_workers : int, optional
+        Number of processes extracting the surfaces of the labels.
 
     Returns
     -------
-    contour_assembly : vtkAssembly
-        Array surface object displayed in space
-        coordinates as calculated by the affine parameter
-        in the order of their roi ids.
+    contour_actor : Actor
+        Surfaces of all the labels, displayed in space coordinates as
+        calculated by the affine parameter. The label of each triangle is
+        stored in the "labels" cell data array, in the order of their roi ids.
+
+    Notes
+    -----
+    The bounding boxes of all the labels are computed in a single pass over
+    `data`, each surface is then extracted from its own sub-volume only.
 
     """
-    unique_roi_id = np.delete(np.unique(data), 0)
+    if data.ndim != 3:
+        raise ValueError("Only 3D arrays are currently supported.")
 
-    nb_surfaces = len(unique_roi_id)
+    unique_roi_id, labels = np.unique(data, return_inverse=True)
+    labels = labels.reshape(data.shape)
+    # The first value is the background
+    unique_roi_id = unique_roi_id[1:]
 
-    unique_roi_surfaces = Assembly()
+    nb_surfaces = len(unique_roi_id)
 
     if color is None:
         color = np.random.rand(nb_surfaces, 3)
     elif color.shape != (nb_surfaces, 3) and color.shape != (nb_surfaces, 4):
         raise ValueError("Incorrect color array shape")
 
-    if color.shape == (nb_surfaces, 4):
-        opacity = color[:, -1]
-        color = color[:, :-1]
-    else:
-        opacity = np.ones((nb_surfaces, 1)).astype(float)
+    colors = np.ones((nb_surfaces, 4))
+    colors[:, : color.shape[1]] = color
+    colors = np.round(np.clip(colors, 0, 1) * 255).astype(np.uint8)
 
-    for i, roi_id in enumerate(unique_roi_id):
-        roi_data = np.isin(data, roi_id).astype(int)
-        roi_surface = contour_from_roi(
-            roi_data, affine=affine, color=color[i], opacity=opacity[i]
+    # scipy.ndimage is slow to import and only needed here.
+    from scipy.ndimage import find_objects
+
+    rois, origins = [], []
+    for roi_label, box in enumerate(find_objects(labels), start=1):
+        # Keep a margin of one voxel for the surface to be closed
+        box = tuple(
+            slice(max(axis_slice.start - 1, 0), min(axis_slice.stop + 1, size))
+            for axis_slice, size in zip(box, data.shape)
         )
-        unique_roi_surfaces.AddPart(roi_surface)
+        rois.append(labels[box] == roi_label)
+        origins.append([axis_slice.start for axis_slice in box])
+
+    if n_workers > 1 and nb_surfaces > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            surfaces = list(executor.map(_contour_label, rois, origins))
+    else:
+        surfaces = [_contour_label(roi, origin) for roi, origin in zip(rois, origins)]
+
+    nb_vertices = [len(vertices) for vertices, _ in surfaces]
+    nb_triangles = [len(triangles) for _, triangles in surfaces]
+    # The empty arrays give an empty actor for a volume without labels.
+    vertices = np.concatenate([np.empty((0, 3))] + [v for v, _ in surfaces])
+    triangles = np.concatenate(
+        [np.empty((0, 3), dtype=int)]
+        + [
+            triangles + first_vertex
+            for (_, triangles), first_vertex in zip(
+                surfaces, np.cumsum([0] + nb_vertices[:-1])
+            )
+        ]
+    )
 
-    return unique_roi_surfaces
+    if affine is not None:
+        vertices = apply_affine(affine, vertices)
+        if np.linalg.det(affine[:3, :3]) < 0:
+            # keep the triangles facing outwards
+            triangles = triangles[:, ::-1]
+
+    polydata = PolyData()
+    set_polydata_vertices(polydata, vertices)
+    set_polydata_triangles(polydata, triangles)
+    set_polydata_colors(polydata, np.repeat(colors, nb_vertices, axis=0))
+    vtk_labels = numpy_support.numpy_to_vtk(np.repeat(unique_roi_id, nb_triangles))
+    vtk_labels.SetName("labels")
+    polydata.GetCellData().AddArray(vtk_labels)
+
+    normals = PolyDataNormals()
+    normals.SetInputData(polydata)
+    normals.SetFeatureAngle(60.0)
+
+    mapper = PolyDataMapper()
+    mapper.SetInputConnection(normals.GetOutputPort())
+
+    contour_actor = Actor()
+    contour_actor.SetMapper(mapper)
+    return contour_actor
 
 
 @warn_on_args_to_kwargs()
@@ -701,7 +797,7 @@ def streamtube(
 
     """
     # Poly data with lines and colors
-    poly_data, color_is_scalar = lines_to_vtk_polydata(lines, colors=colors)
+    poly_data, color_is_scalar = lines_to_vtk_polydata(lines, colors=colors, deep=False)
     next_input = poly_data
 
     # set primitives count
@@ -854,7 +950,7 @@ def line(
 
     """
     # Poly data with lines and colors
-    poly_data, color_is_scalar = lines_to_vtk_polydata(lines, colors=colors)
+    poly_data, color_is_scalar = lines_to_vtk_polydata(lines, colors=colors, deep=False)
     next_input = poly_data
 
     # set primitives count
@@ -998,6 +1094,11 @@ def odf_slicer(
     colormap=None,
     global_cm=False,
     B_matrix=None,
+    cache_size=8,
+    memory_budget=2**28,
+    n_workers=1,
+    lod_spheres=None,
+    lod_thresholds=None,
 ):
     """Create an actor for rendering a grid of ODFs given an array of
     spherical function (SF) or spherical harmonics (SH) coefficients.
@@ -1034,6 +1135,28 @@ def odf_slicer(
         Optional SH to SF matrix for projecting `odfs` given in SH
         coefficients on the `sphere`. If None, then the input is assumed
         to be expressed in SF coefficients.
+    cache_size : int, optional
+        Number of slices kept in memory so that going back to a previously
+        displayed slice does not recompute it. Use 0 to disable the cache.
+    memory_budget : int, optional
+        Approximate size in bytes of the temporary arrays used to build a
+        slice. Larger slices are built in blocks of voxels. If None, a slice
+        is built at once.
+    n_workers : int, optional
+        Number of threads building the blocks of voxels of a slice.
+    lod_spheres : sequence, optional
+        Spheres used for ODFs covering few pixels on screen. Each sphere is
+        the name of a sphere of :func:`fury.primitive.prim_sphere`, a dipy
+        Sphere, a (vertices, faces) tuple or a (vertices, faces, B) tuple
+        with its SH to SF matrix. If no matrix is given, the SF values of the
+        nearest directions of `sphere` are used. Once the actor is added to a
+        scene, each ODF is drawn with a sphere picked from its projected size
+        and the geometry is rebuilt only when an ODF crosses a threshold.
+    lod_thresholds : sequence of float, optional
+        Projected ODF diameters, in pixels, from which the next sphere, by
+        increasing number of vertices, is used. There is one threshold less
+        than the number of spheres, `sphere` included. Default is twice the
+        square root of the number of vertices of each coarser sphere.
 
     Returns
     -------
@@ -1078,6 +1201,22 @@ def odf_slicer(
                 )
             )
 
+    lod = []
+    for lod_sphere in [] if lod_spheres is None else lod_spheres:
+        if isinstance(lod_sphere, str):
+            lod_sphere = fp.prim_sphere(name=lod_sphere)
+        elif hasattr(lod_sphere, "vertices"):
+            lod_sphere = (lod_sphere.vertices, lod_sphere.faces)
+        lod_vertices, lod_faces, *lod_B = lod_sphere
+        if lod_B and len(lod_vertices) != lod_B[0].shape[1]:
+            raise ValueError(
+                "Invalid number of SH coefficients. Expected {0}, got {1}.".format(
+                    len(lod_vertices), lod_B[0].shape[1]
+                )
+            )
+        lod_faces = fix_winding_order(lod_vertices, lod_faces, clockwise=True)
+        lod.append((lod_vertices, lod_faces, *lod_B))
+
     # create and return an instance of OdfSlicerActor
     return OdfSlicerActor(
         odfs[indices],
@@ -1093,6 +1232,11 @@ def odf_slicer(
         opacity,
         affine=affine,
         B=B_matrix,
+        cache_size=cache_size,
+        memory_budget=memory_budget,
+        n_workers=n_workers,
+        lod_spheres=lod,
+        lod_thresholds=lod_thresholds,
     )
 
 
@@ -4084,3 +4228,78 @@ def odf(centers, coeffs, sh_basis="descoteaux", scales=1.0, opacity=1.0):
     coeffs = np.dot(np.diag(1 / total * scales), coeffs) * 1.7
 
     return sh_odf(centers, coeffs, degree, sh_basis, scales, opacity)
+
+
+@warn_on_args_to_kwargs()
+def instanced_glyphs(
+    centers,
+    *,
+    geometry="sphere",
+    vertices=None,
+    faces=None,
+    directions=None,
+    colors=(1, 0, 0),
+    scales=1,
+    opacity=1,
+):
+    """Visualize many copies of a shape drawn with GPU instancing.
+
+    Unlike the other glyph actors (:func:`sphere`, :func:`box`, ...), the
+    shape is not duplicated in memory: only the template mesh and the
+    per-instance centers, directions, scales and colors are stored, which
+    makes it suitable for millions of glyphs.
+
+    Parameters
+    ----------
+    centers : ndarray, shape (N, 3)
+        Glyphs positions.
+    geometry : str, optional
+        Name of a primitive of :mod:`fury.primitive` (e.g. 'sphere', 'box',
+        'cone', 'arrow', 'cylinder') used as template. Ignored if vertices and
+        faces are given.
+    vertices : ndarray, shape (V, 3), optional
+        Vertices of a custom template mesh.
+    faces : ndarray, shape (F, 3), optional
+        Triangles of a custom template mesh.
+    directions : ndarray, shape (N, 3) or tuple (3,), optional
+        The X axis of the template is aligned with these directions.
+    colors : ndarray (N,3) or (N, 4) or tuple (3,) or tuple (4,), optional
+        RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1].
+    scales : float or ndarray, shape (N,) or (N, 3), optional
+        Uniform or per-axis scale of each glyph.
+    opacity : float, optional
+        Takes values from 0 (fully transparent) to 1 (opaque). Default is 1.
+
+    Returns
+    -------
+    glyph_actor : InstancedGlyphActor
+        Actor whose per-instance arrays can be updated in place.
+
+    Examples
+    --------
+    >>> from fury import window, actor
+    >>> scene = window.Scene()
+    >>> centers = np.random.rand(1000, 3) * 100
+    >>> glyph_actor = actor.instanced_glyphs(centers, geometry="box")
+    >>> scene.add(glyph_actor)
+    >>> glyph_actor.centers += 1
+    >>> glyph_actor.update()
+    >>> # window.show(scene)
+
+    """
+    if vertices is None or faces is None:
+        prim = getattr(fp, "prim_{}".format(geometry), None)
+        if prim is None:
+            raise ValueError("Unknown geometry: {}".format(geometry))
+        vertices, faces = prim()
+
+    glyph_actor = InstancedGlyphActor(
+        centers,
+        vertices,
+        faces,
+        directions=directions,
+        colors=colors,
+        scales=scales,
+    )
+    glyph_actor.GetProperty().SetOpacity(opacity)
+    return glyph_actor
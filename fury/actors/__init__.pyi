@@ -4,6 +4,7 @@
 # This will enable type hinting for engines.
 
 __all__ = [
+    "InstancedGlyphActor",
     "PeakActor",
     "OdfSlicerActor",
     "_orientation_colors",
@@ -14,6 +15,7 @@ __all__ = [
     "tensor_ellipsoid",
 ]
 
+from .glyph import InstancedGlyphActor
 from .odf_slicer import OdfSlicerActor
 from .peak import (
     PeakActor,
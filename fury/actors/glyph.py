@@ -0,0 +1,154 @@
+import numpy as np
+
+from fury.decorators import warn_on_args_to_kwargs
+from fury.lib import Actor, Glyph3DMapper, PolyData, numpy_support
+from fury.utils import (
+    numpy_to_vtk_colors,
+    numpy_to_vtk_points,
+    set_polydata_triangles,
+    set_polydata_vertices,
+    update_polydata_normals,
+)
+
+
+class InstancedGlyphActor(Actor):
+    """VTK actor drawing many copies of a template mesh with GPU instancing.
+
+    Only the template mesh and one center, direction, scale and color per
+    instance are stored; the copies are generated by the GPU at draw time.
+    The per-instance arrays are shared with VTK, they can be modified in
+    place (followed by a call to :meth:`update`) or through the properties.
+
+    Parameters
+    ----------
+    centers : ndarray, shape (N, 3)
+        Instances positions.
+    vertices : ndarray, shape (V, 3)
+        Vertices of the template mesh.
+    faces : ndarray, shape (F, 3)
+        Triangles of the template mesh.
+    directions : ndarray, shape (N, 3) or tuple (3,), optional
+        The X axis of the template is aligned with the direction of each
+        instance. If None, the template orientation is kept.
+    colors : ndarray (N, 3) or (N, 4) or tuple (3,) or tuple (4,), optional
+        RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1].
+    scales : float or ndarray, shape (N,) or (N, 3), optional
+        Uniform or per-axis scale of each instance.
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(
+        self, centers, vertices, faces, *, directions=None, colors=(1, 0, 0), scales=1
+    ):
+        centers = np.asarray(centers)
+        if centers.ndim != 2 or centers.shape[1] != 3:
+            raise ValueError("centers should be an array of shape (N, 3)")
+        n_instances = len(centers)
+
+        self._centers = np.array(centers, dtype=np.float64, order="C")
+        self._colors = np.full((n_instances, 4), 255, dtype=np.uint8)
+        self._directions = np.empty((n_instances, 3))
+        self._directions[:] = (1, 0, 0) if directions is None else directions
+        scales = np.asarray(scales, dtype=np.float64)
+        per_axis = scales.ndim == 2 or (scales.shape == (3,) and n_instances != 3)
+        scale_shape = (n_instances, 3) if per_axis else (n_instances,)
+        self._scales = np.empty(scale_shape)
+        self._scales[:] = scales
+        self._set_colors(colors)
+
+        self._polydata = PolyData()
+        self._polydata.SetPoints(numpy_to_vtk_points(self._centers, deep=False))
+        point_data = self._polydata.GetPointData()
+        vtk_colors = numpy_to_vtk_colors(self._colors, deep=False)
+        vtk_colors.SetName("colors")
+        point_data.SetScalars(vtk_colors)
+        for name, array in (("directions", self._directions), ("scales", self._scales)):
+            vtk_array = numpy_support.numpy_to_vtk(array, deep=False)
+            vtk_array.SetName(name)
+            point_data.AddArray(vtk_array)
+
+        self._template = PolyData()
+        set_polydata_vertices(self._template, np.asarray(vertices))
+        set_polydata_triangles(self._template, np.asarray(faces))
+        update_polydata_normals(self._template)
+
+        mapper = Glyph3DMapper()
+        mapper.SetInputData(self._polydata)
+        mapper.SetSourceData(self._template)
+        mapper.SetOrientationArray("directions")
+        mapper.SetOrientationModeToDirection()
+        mapper.SetOrient(directions is not None)
+        mapper.SetScaleArray("scales")
+        mapper.SetScaling(True)
+        if self._scales.ndim == 2:
+            mapper.SetScaleModeToScaleByVectorComponents()
+        else:
+            mapper.SetScaleModeToScaleByMagnitude()
+        mapper.SetScalarModeToUsePointData()
+        mapper.SetColorModeToDirectScalars()
+        mapper.ScalarVisibilityOn()
+        self.SetMapper(mapper)
+
+    def _set_colors(self, colors):
+        colors = np.asarray(colors)
+        n_components = colors.shape[-1]
+        if n_components not in (3, 4):
+            raise ValueError("colors should be RGB or RGBA")
+        self._colors[:, :n_components] = 255 * colors
+        if n_components == 3:
+            self._colors[:, 3] = 255
+
+    def update(self):
+        """Upload the per-instance arrays after an in-place modification."""
+        self._polydata.GetPoints().GetData().Modified()
+        point_data = self._polydata.GetPointData()
+        for i in range(point_data.GetNumberOfArrays()):
+            point_data.GetArray(i).Modified()
+        self._polydata.Modified()
+
+    @property
+    def n_instances(self):
+        """Return the number of instances."""
+        return len(self._centers)
+
+    @property
+    def centers(self):
+        """Return the (N, 3) instances positions, shared with VTK."""
+        return self._centers
+
+    @centers.setter
+    def centers(self, centers):
+        self._centers[:] = centers
+        self.update()
+
+    @property
+    def directions(self):
+        """Return the (N, 3) instances directions, shared with VTK."""
+        return self._directions
+
+    @directions.setter
+    def directions(self, directions):
+        self._directions[:] = directions
+        self.GetMapper().SetOrient(True)
+        self.update()
+
+    @property
+    def scales(self):
+        """Return the (N,) or (N, 3) instances scales, shared with VTK."""
+        return self._scales
+
+    @scales.setter
+    def scales(self, scales):
+        self._scales[:] = scales
+        self.update()
+
+    @property
+    def colors(self):
+        """Return the (N, 4) RGBA uint8 instances colors, shared with VTK."""
+        return self._colors
+
+    @colors.setter
+    def colors(self, colors):
+        self._set_colors(colors)
+        self.update()
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from weakref import WeakKeyDictionary
+
 import numpy as np
 
 from fury.colormap import create_colormap
@@ -6,11 +10,21 @@ from fury.decorators import warn_on_args_to_kwargs
 from fury.lib import Actor, PolyData, PolyDataMapper
 from fury.utils import (
     apply_affine,
-    set_polydata_colors,
-    set_polydata_triangles,
-    set_polydata_vertices,
+    numpy_to_vtk_cells,
+    numpy_to_vtk_colors,
+    numpy_to_vtk_points,
+    vtk_matrix_to_numpy,
 )
 
+# Approximate size of the temporary arrays (SF values, normalization and
+# colormap) per displayed vertex, in bytes.
+_TEMP_BYTES_PER_VERTEX = 80
+
+# A sphere the ODFs can be drawn with. `directions` are the vertices in world
+# coordinates. The SF values are given by `B` for SH coefficients, or by the
+# SF `columns` of the main sphere for SF coefficients (None: all of them).
+_Sphere = namedtuple("_Sphere", ["vertices", "directions", "faces", "B", "columns"])
+
 
 class OdfSlicerActor(Actor):
     """VTK actor for visualizing slices of ODF field.
@@ -49,6 +63,27 @@ class OdfSlicerActor(Actor):
         Optional SH to SF matrix for projecting `odfs` given in SH
         coefficients on the `sphere`. If None, then the input is assumed
         to be expressed in SF coefficients.
+    cache_size : int, optional
+        Number of slices kept in memory. Displaying a cached slice again only
+        swaps the mapper input. Use 0 to disable the cache.
+    memory_budget : int, optional
+        Approximate size in bytes of the temporary arrays used to build a
+        slice. The voxels are processed in blocks fitting in this budget and
+        written directly in the vertices and colors arrays given to VTK. If
+        None, all the voxels of a slice are processed at once.
+    n_workers : int, optional
+        Number of threads processing the blocks of voxels.
+    lod_spheres : sequence of tuple, optional
+        Level of detail spheres, given as (vertices, faces) or (vertices,
+        faces, B) tuples. Once the actor is added to a scene, each ODF is
+        drawn with the sphere picked from its projected diameter in pixels,
+        the spheres being sorted by number of vertices. Without a B matrix,
+        the SF values of a sphere are those of the nearest directions of the
+        main sphere.
+    lod_thresholds : sequence of float, optional
+        Projected ODF diameters, in pixels, from which the next finer sphere
+        is used. Default is twice the square root of the number of vertices
+        of each coarser sphere.
 
     """
 
@@ -69,6 +104,11 @@ class OdfSlicerActor(Actor):
         *,
         affine=None,
         B=None,
+        cache_size=8,
+        memory_budget=2**28,
+        n_workers=1,
+        lod_spheres=None,
+        lod_thresholds=None,
     ):
         self.vertices = vertices
         self.faces = faces
@@ -79,9 +119,29 @@ class OdfSlicerActor(Actor):
         self.colormap = colormap
         self.grid_shape = shape
         self.global_cm = global_cm
+        self.memory_budget = memory_budget
+        self.n_workers = n_workers
+        self.lod_spheres = [] if lod_spheres is None else list(lod_spheres)
+        self.lod_thresholds = lod_thresholds
+        self._glyph_radius = scale
 
         # declare a mask to be instantiated in slice_along_axis
         self.mask = None
+        self._extent = None
+
+        # Polydata of the last displayed extents, in least recently used
+        # order, and faces tiled for the largest slice of the grid.
+        self.cache_size = cache_size
+        self._slice_cache = OrderedDict()
+        self._all_faces = {}
+        self._max_slice_size = max(
+            (
+                np.bincount(axis_indices).max()
+                for axis_indices in indices
+                if len(axis_indices)
+            ),
+            default=0,
+        )
 
         # If a B matrix is given, odfs are expected to
         # be in SH basis coefficients.
@@ -103,6 +163,14 @@ class OdfSlicerActor(Actor):
             self.w_verts = self.vertices.dot(affine[:3, :3])
             self.w_pos = apply_affine(affine, np.asarray(self.indices).T)
 
+        # Sphere of each displayed ODF and the last view used to pick them.
+        # None until the actor is rendered with LOD spheres.
+        self._set_spheres()
+        self._levels = None
+        self._lod_view = None
+        # StartEvent observer tag of each scene the actor was added to.
+        self._lod_observers = WeakKeyDictionary()
+
         # Initialize mapper and slice to the
         # middle of the volume along Z axis
         self.mapper = PolyDataMapper()
@@ -122,6 +190,7 @@ class OdfSlicerActor(Actor):
         mask = np.zeros(self.grid_shape, dtype=bool)
         mask[x1 : x2 + 1, y1 : y2 + 1, z1 : z2 + 1] = True
         self.mask = mask
+        self._extent = (x1, x2, y1, y2, z1, z2)
 
         self._update_mapper()
 
@@ -181,39 +250,281 @@ class OdfSlicerActor(Actor):
             self.w_verts = self.vertices.dot(self.affine[:3, :3])
         self.faces = faces
         self.B = B
+        self._set_spheres()
+        self.clear_cache()
 
         # draw ODFs with new sphere
         self._update_mapper()
 
-    def _update_mapper(self):
-        """Map vtkPolyData to the actor."""
-        polydata = PolyData()
+    def clear_cache(self):
+        """Discard the cached slices.
+
+        Call it after modifying ``odfs`` in place so that the slices are
+        computed again.
+        """
+        self._slice_cache.clear()
+
+    def add_to_scene(self, scene):
+        """Add the actor to `scene`, picking its LOD spheres before renders."""
+        scene.AddActor(self)
+        if len(self._spheres) > 1 and scene not in self._lod_observers:
+            self._lod_observers[scene] = scene.AddObserver(
+                "StartEvent", self._update_lod_callback
+            )
+
+    def _update_lod_callback(self, scene, event):
+        if scene.HasViewProp(self):
+            self.update_lod(scene)
+        elif scene in self._lod_observers:
+            # The actor left the scene, stop following its renders.
+            scene.RemoveObserver(self._lod_observers.pop(scene))
+
+    def update_lod(self, scene):
+        """Pick the sphere of each displayed ODF from its size in `scene`.
+
+        The geometry is only rebuilt when an ODF crosses a LOD threshold.
+        This is done before each render of the scenes the actor was added to.
+
+        Parameters
+        ----------
+        scene : Scene
+            The scene whose active camera and size in pixels are used.
+
+        Returns
+        -------
+        bool
+            Whether the geometry was rebuilt.
+
+        """
+        if len(self._spheres) == 1 or self.mask is None:
+            return False
+        camera = scene.GetActiveCamera()
+        self._lod_view = (
+            scene.GetSize()[1],
+            camera.GetParallelProjection(),
+            camera.GetParallelScale(),
+            np.array(camera.GetPosition()),
+            np.array(camera.GetDirectionOfProjection()),
+            camera.GetViewAngle(),
+        )
+        rows = np.flatnonzero(self.mask[self.indices])
+        levels = self._get_levels(rows)
+        if levels is None or (
+            self._levels is not None and np.array_equal(levels, self._levels)
+        ):
+            return False
+        self._set_polydata(rows, levels)
+        return True
+
+    def _set_spheres(self):
+        """Sort the main and the LOD spheres by number of vertices."""
+        spheres = [(self.vertices, self.faces, self.B, None)]
+        for lod_sphere in self.lod_spheres:
+            vertices, faces = lod_sphere[:2]
+            B = lod_sphere[2] if len(lod_sphere) > 2 else None
+            columns = None
+            if B is None:
+                # nearest directions of the main sphere
+                columns = np.argmax(np.dot(vertices, self.vertices.T), axis=1)
+                if self.B is not None:
+                    B, columns = self.B[:, columns], None
+            elif self.B is None:
+                raise ValueError("B matrices need ODFs in SH coefficients.")
+            spheres.append((vertices, faces, B, columns))
+
+        order = np.argsort([len(sphere[0]) for sphere in spheres], kind="stable")
+        self._main_level = int(np.flatnonzero(order == 0)[0])
+        self._spheres = []
+        for vertices, faces, B, columns in (spheres[i] for i in order):
+            directions = vertices
+            if self.affine is not None:
+                directions = vertices.dot(self.affine[:3, :3])
+            self._spheres.append(_Sphere(vertices, directions, faces, B, columns))
+
+        if self.lod_thresholds is None:
+            thresholds = [2 * np.sqrt(len(sph.vertices)) for sph in self._spheres]
+            self._thresholds = np.array(thresholds[:-1])
+        elif len(self.lod_thresholds) != len(self._spheres) - 1:
+            raise ValueError(
+                "Expected {0} LOD thresholds, got {1}.".format(
+                    len(self._spheres) - 1, len(self.lod_thresholds)
+                )
+            )
+        else:
+            self._thresholds = np.asarray(self.lod_thresholds, dtype=float)
+        self._all_faces = {}
+
+    def _get_levels(self, rows):
+        """Get the sphere of the ODFs at `rows` for the last LOD view.
 
-        offsets = self._get_odf_offsets(self.mask)
-        if len(offsets) == 0:
-            self.mapper.SetInputData(polydata)
+        None is returned when no view is known yet.
+        """
+        if self._lod_view is None or self._lod_view[0] == 0:
             return None
+        height, parallel, parallel_scale, position, direction, angle = self._lod_view
 
-        sph_dirs = self._get_sphere_directions()
-        sf = self._get_sf(self.mask)
+        # diameter of the ODFs in world coordinates
+        matrix = vtk_matrix_to_numpy(self.GetMatrix())
+        linear = matrix[:3, :3]
+        if self.affine is not None:
+            linear = linear.dot(self.affine[:3, :3])
+        voxel_size = np.abs(np.linalg.det(linear)) ** (1 / 3)
+        diameter = 2 * abs(self._glyph_radius) * voxel_size
 
-        all_vertices = self._get_all_vertices(offsets, sph_dirs, sf)
-        all_faces = self._get_all_faces(len(offsets), len(sph_dirs))
-        all_colors = self._generate_color_for_vertices(sf)
+        if parallel:
+            pixels = np.full(len(rows), diameter * height / (2 * parallel_scale))
+        else:
+            centers = apply_affine(matrix, self._get_odf_offsets(rows))
+            depth = (centers - position).dot(direction)
+            focal_length = height / (2 * np.tan(np.radians(angle) / 2))
+            # ODFs behind the camera are not seen, they get the coarsest sphere
+            pixels = np.zeros(len(rows))
+            np.divide(diameter * focal_length, depth, out=pixels, where=depth > 0)
+        return np.searchsorted(self._thresholds, pixels, side="right").astype(np.uint8)
 
-        # TODO: There is a lot of deep copy here.
-        # Optimize (see viz_network.py example).
-        set_polydata_triangles(polydata, all_faces)
-        set_polydata_vertices(polydata, all_vertices)
-        set_polydata_colors(polydata, all_colors)
+    def _update_mapper(self):
+        """Map the vtkPolyData of the displayed extent to the actor."""
+        rows = np.flatnonzero(self.mask[self.indices])
+        self._set_polydata(rows, self._get_levels(rows))
+
+    def _set_polydata(self, rows, levels):
+        """Map the vtkPolyData of the ODFs at `rows` to the actor."""
+        self._levels = levels
+        key = self._extent if levels is None else (self._extent, levels.tobytes())
+        polydata = self._slice_cache.get(key)
+        if polydata is not None:
+            self._slice_cache.move_to_end(key)
+        else:
+            polydata = self._build_polydata(rows, levels=levels)
+            if self.cache_size > 0:
+                self._slice_cache[key] = polydata
+                while len(self._slice_cache) > self.cache_size:
+                    self._slice_cache.popitem(last=False)
 
         self.mapper.SetInputData(polydata)
 
-    def _get_odf_offsets(self, mask):
-        """Get the position of non-zero voxels inside `mask`."""
+    def _build_polydata(self, rows, *, levels=None):
+        """Build the vtkPolyData of the ODFs at `rows`.
+
+        `levels` gives the sphere of each ODF, default is the main sphere.
+        """
+        polydata = PolyData()
+        if len(rows) == 0:
+            return polydata
+
+        if levels is None:
+            groups = [(self._main_level, rows)]
+        else:
+            groups = [(level, rows[levels == level]) for level in np.unique(levels)]
+        sizes = [
+            (
+                len(group_rows) * len(self._spheres[level].vertices),
+                len(group_rows) * len(self._spheres[level].faces),
+            )
+            for level, group_rows in groups
+        ]
+        nb_vertices = sum(size[0] for size in sizes)
+
+        all_vertices = np.empty((nb_vertices, 3), dtype=np.float32)
+        all_colors = np.empty((nb_vertices, 3), dtype=np.uint8)
+        # A global colormap needs the range of all the SF values first.
+        all_sf = np.empty(nb_vertices) if self.global_cm else None
+
+        start = 0
+        for (level, group_rows), (nb_group_vertices, _) in zip(groups, sizes):
+            vertex_slice = slice(start, start + nb_group_vertices)
+            self._build_vertices(
+                group_rows,
+                self._spheres[level],
+                all_vertices[vertex_slice],
+                all_colors[vertex_slice],
+                None if all_sf is None else all_sf[vertex_slice],
+            )
+            start += nb_group_vertices
+
+        if all_sf is not None:
+            sf_range = (all_sf.min(), all_sf.max())
+
+            def color_block(block):
+                self._generate_color_for_vertices(
+                    all_sf[block], None, out=all_colors[block], sf_range=sf_range
+                )
+
+            self._process_blocks(color_block, nb_vertices, 1)
+
+        if len(groups) == 1:
+            all_faces = self._get_all_faces(len(rows), groups[0][0])
+        else:
+            all_faces = np.empty((sum(size[1] for size in sizes), 3), dtype=np.int64)
+            start = face_start = 0
+            for (level, group_rows), (nb_group_vertices, nb_faces) in zip(
+                groups, sizes
+            ):
+                np.add(
+                    self._get_all_faces(len(group_rows), level),
+                    start,
+                    out=all_faces[face_start : face_start + nb_faces],
+                )
+                start += nb_group_vertices
+                face_start += nb_faces
+
+        # The arrays are fresh (or read-only views of the shared faces),
+        # VTK can wrap them without copying.
+        polydata.SetPolys(numpy_to_vtk_cells(all_faces, is_coords=False))
+        polydata.SetPoints(numpy_to_vtk_points(all_vertices, deep=False))
+        vtk_colors = numpy_to_vtk_colors(all_colors, deep=False)
+        vtk_colors.SetName("colors")
+        polydata.GetPointData().SetScalars(vtk_colors)
+        return polydata
+
+    def _build_vertices(self, rows, sphere, vertices, colors, sf_values):
+        """Write the vertices and colors of the ODFs at `rows` drawn with `sphere`.
+
+        If `sf_values` is given, the SF values are written in it instead of
+        the colors, to be mapped by a global colormap.
+        """
+        offsets = self._get_odf_offsets(rows)
+        nb_dirs = len(sphere.vertices)
+
+        def build_block(block):
+            sf = self._get_sf(rows[block], sphere)
+            vertex_block = slice(block.start * nb_dirs, block.stop * nb_dirs)
+            self._get_all_vertices(
+                offsets[block], sphere.directions, sf, out=vertices[vertex_block]
+            )
+            if sf_values is None:
+                self._generate_color_for_vertices(sf, sphere, out=colors[vertex_block])
+            else:
+                sf_values[vertex_block] = sf.ravel()
+
+        self._process_blocks(build_block, len(rows), nb_dirs)
+
+    def _process_blocks(self, func, nb_odfs, nb_dirs):
+        """Call `func` on blocks of ODFs fitting in the memory budget."""
+        if self.memory_budget is None:
+            block_size = nb_odfs
+        else:
+            odf_bytes = 8 * self.odfs.shape[-1] + _TEMP_BYTES_PER_VERTEX * nb_dirs
+            block_size = max(
+                1, int(self.memory_budget // (odf_bytes * max(self.n_workers, 1)))
+            )
+        blocks = [
+            slice(start, min(start + block_size, nb_odfs))
+            for start in range(0, nb_odfs, block_size)
+        ]
+        if self.n_workers > 1 and len(blocks) > 1:
+            # NumPy releases the GIL in the projection and the arithmetic.
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                list(executor.map(func, blocks))
+        else:
+            for block in blocks:
+                func(block)
+
+    def _get_odf_offsets(self, rows):
+        """Get the position of the voxels of the ODFs at `rows`."""
         if self.affine is not None:
-            return self.w_pos[mask[self.indices]]
-        return np.asarray(self.indices).T[mask[self.indices]]
+            return self.w_pos[rows]
+        return np.asarray(self.indices).T[rows]
 
     def _get_sphere_directions(self):
         """Get the sphere directions onto which is projected the signal."""
@@ -221,57 +532,89 @@ class OdfSlicerActor(Actor):
             return self.w_verts
         return self.vertices
 
-    def _get_sf(self, mask):
-        """Get SF coefficients inside `mask`."""
+    def _get_sf(self, rows, sphere):
+        """Get SF coefficients of the ODFs at `rows` on `sphere`."""
         # when odfs are expressed in SH coefficients
-        if self.B is not None:
-            sf = self.odfs[mask[self.indices]].dot(self.B)
+        if sphere.B is not None:
+            sf = self.odfs[rows].dot(sphere.B)
             # normalisation and scaling is done on SF coefficients
             if self.norm:
                 sf /= np.abs(sf).max(axis=-1, keepdims=True)
-            return sf * self.scale
+            sf *= self.scale
+            return sf
         # when odfs are in SF coefficients, the normalisation and scaling
         # are done during initialisation. We simply return them:
-        return self.odfs[mask[self.indices]]
+        if sphere.columns is not None:
+            return self.odfs[np.ix_(rows, sphere.columns)]
+        return self.odfs[rows]
 
-    def _get_all_vertices(self, offsets, sph_dirs, sf):
+    def _get_all_vertices(self, offsets, sph_dirs, sf, *, out=None):
         """Get array of all the vertices of the ODFs to display."""
+        if out is None:
+            out = np.empty((len(offsets) * len(sph_dirs), 3), dtype=np.float32)
+        vertices = out.reshape((len(offsets), len(sph_dirs), 3))
         if self.radial_scale:
-            # apply SF amplitudes to all sphere
-            # directions and offset each voxel
-            return np.tile(sph_dirs, (len(offsets), 1)) * sf.reshape(-1, 1) + np.repeat(
-                offsets, len(sph_dirs), axis=0
-            )
-        # return scaled spheres offsetted by `offsets`
-        return np.tile(sph_dirs, (len(offsets), 1)) * self.scale + np.repeat(
-            offsets, len(sph_dirs), axis=0
-        )
+            # apply SF amplitudes to all sphere directions
+            np.multiply(sph_dirs, sf[..., None], out=vertices)
+        else:
+            # scaled spheres
+            vertices[:] = sph_dirs * self.scale
+        # offset each voxel
+        vertices += offsets[:, None]
+        return out
 
-    def _get_all_faces(self, nb_odfs, nb_dirs):
-        """Get array of all the faces of the ODFs to display."""
-        return np.tile(self.faces, (nb_odfs, 1)) + np.repeat(
-            np.arange(nb_odfs) * nb_dirs, len(self.faces)
-        ).reshape(-1, 1)
+    def _get_all_faces(self, nb_odfs, level):
+        """Get array of all the faces of the ODFs drawn with sphere `level`.
 
-    def _generate_color_for_vertices(self, sf):
-        """Get array of all vertices colors."""
+        The faces are tiled once for the largest slice of the grid, a view on
+        the first `nb_odfs` ODFs is returned.
+        """
+        sphere = self._spheres[level]
+        faces = np.asarray(sphere.faces, dtype=np.int64)
+        nb_dirs = len(sphere.vertices)
+        nb_faces = nb_odfs * len(faces)
+        all_faces = self._all_faces.get(level)
+        if all_faces is None or len(all_faces) < nb_faces:
+            nb_tiles = max(nb_odfs, self._max_slice_size)
+            all_faces = np.empty((nb_tiles, len(faces), 3), dtype=np.int64)
+
+            def tile_block(block):
+                first_vertices = np.arange(block.start, block.stop) * nb_dirs
+                np.add(faces, first_vertices[:, None, None], out=all_faces[block])
+
+            self._process_blocks(tile_block, nb_tiles, nb_dirs)
+            all_faces = all_faces.reshape((-1, 3))
+            all_faces.flags.writeable = False
+            self._all_faces[level] = all_faces
+        return all_faces[:nb_faces]
+
+    def _generate_color_for_vertices(self, sf, sphere, *, out=None, sf_range=None):
+        """Get array of all vertices colors of the ODFs drawn with `sphere`.
+
+        `sf_range` is the (min, max) range of the SF values mapped by a global
+        colormap, default is the range of `sf`.
+        """
+        if out is None:
+            out = np.empty((sf.size, 3), dtype=np.uint8)
         if self.global_cm:
             if self.colormap is None:
                 raise IOError("if global_cm=True, colormap must be defined.")
-            else:
-                all_colors = create_colormap(sf.ravel(), name=self.colormap) * 255
+            if sf_range is None:
+                sf_range = (sf.min(), sf.max())
+            values = np.interp(sf.ravel(), sf_range, [0, 1])
+            out[:] = create_colormap(values, name=self.colormap, auto=False) * 255
         elif self.colormap is not None:
             if isinstance(self.colormap, str):
                 # Map ODFs values [min, max] to [0, 1] for each ODF
                 range_sf = sf.max(axis=-1) - sf.min(axis=-1)
                 rescaled = sf - sf.min(axis=-1, keepdims=True)
                 rescaled[range_sf > 0] /= range_sf[range_sf > 0][..., None]
-                all_colors = create_colormap(rescaled.ravel(), name=self.colormap) * 255
-            else:
-                all_colors = np.tile(
-                    np.array(self.colormap).reshape(1, 3),
-                    (sf.shape[0] * sf.shape[1], 1),
+                out[:] = (
+                    create_colormap(rescaled.ravel(), name=self.colormap, auto=False)
+                    * 255
                 )
+            else:
+                out[:] = np.asarray(self.colormap).reshape(1, 3)
         else:
-            all_colors = np.tile(np.abs(self.vertices) * 255, (len(sf), 1))
-        return all_colors.astype(np.uint8)
+            out.reshape((len(sf), -1, 3))[:] = np.abs(sphere.vertices) * 255
+        return out
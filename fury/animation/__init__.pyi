@@ -3,6 +3,7 @@
 
 __all__ = [
     "Animation",
+    "BatchAnimation",
     "CameraAnimation",
     "Timeline",
     "euclidean_distances",
@@ -25,7 +26,7 @@ __all__ = [
     "xyz_color_interpolator",
 ]
 
-from .animation import Animation, CameraAnimation
+from .animation import Animation, BatchAnimation, CameraAnimation
 from .helpers import (
     euclidean_distances,
     get_next_timestamp,
@@ -1,9 +1,9 @@
 from collections import defaultdict
+from functools import lru_cache
 from time import perf_counter
 from warnings import warn
 
 import numpy as np
-from scipy.spatial import transform
 
 from fury import utils
 from fury.actor import line
@@ -17,6 +17,17 @@ from fury.decorators import warn_on_args_to_kwargs
 from fury.lib import Actor, Camera, Transform
 
 
+@lru_cache(maxsize=None)
+def _rotation():
+    """Return the scipy Rotation class, imported on first use.
+
+    scipy.spatial is slow to import and only needed for rotations.
+    """
+    from scipy.spatial.transform import Rotation
+
+    return Rotation
+
+
 class Animation:
     """Keyframe animation class.
 
@@ -655,9 +666,11 @@ class Animation:
             # user is expected to set rotation order by default as setting
             # orientation of a `vtkActor` ordered as z->x->y.
             rotation = np.asarray(rotation, dtype=float)
-            rotation = transform.Rotation.from_euler(
-                "zxy", rotation[[2, 0, 1]], degrees=True
-            ).as_quat()
+            rotation = (
+                _rotation()
+                .from_euler("zxy", rotation[[2, 0, 1]], degrees=True)
+                .as_quat()
+            )
             self.set_keyframe("rotation", timestamp, rotation, **kwargs)
         else:
             warn(
@@ -677,7 +690,7 @@ class Animation:
             Directional vector that describes the rotation.
 
         """
-        quat = transform.Rotation.from_rotvec(vector).as_quat()
+        quat = _rotation().from_rotvec(vector).as_quat()
         self.set_keyframe("rotation", timestamp, quat, **kwargs)
 
     def set_scale(self, timestamp, scalar, **kwargs):
@@ -814,14 +827,12 @@ class Animation:
         if len(rot) == 4:
             if as_quat:
                 return rot
-            r = transform.Rotation.from_quat(rot)
+            r = _rotation().from_quat(rot)
             degrees = r.as_euler("zxy", degrees=True)[[1, 2, 0]]
             return degrees
         elif not as_quat:
             return rot
-        return transform.Rotation.from_euler(
-            "zxy", rot[[2, 0, 1]], degrees=True
-        ).as_quat()
+        return _rotation().from_euler("zxy", rot[[2, 0, 1]], degrees=True).as_quat()
 
     def get_scale(self, t):
         """Return the interpolated scale.
@@ -1144,33 +1155,7 @@ class Animation:
 
         # actors properties
         if in_scene:
-            if self.is_interpolatable("position"):
-                position = self.get_position(time)
-                self._transform.Translate(*position)
-
-            if self.is_interpolatable("opacity"):
-                opacity = self.get_opacity(time)
-                [act.GetProperty().SetOpacity(opacity) for act in self.actors]
-
-            if self.is_interpolatable("rotation"):
-                x, y, z = self.get_rotation(time)
-                # Rotate in the same order as VTK defaults.
-                self._transform.RotateZ(z)
-                self._transform.RotateX(x)
-                self._transform.RotateY(y)
-
-            if self.is_interpolatable("scale"):
-                scale = self.get_scale(time)
-                self._transform.Scale(*scale)
-
-            if self.is_interpolatable("color"):
-                color = self.get_color(time)
-                for act in self.actors:
-                    act.vcolors[:] = color * 255
-                    utils.update_actor(act)
-
-            # update actors' transformation matrix
-            [act.SetUserTransform(self._transform) for act in self.actors]
+            self._update_actors(time)
 
         for attrib in self._data:
             callbacks = self._data.get(attrib, {}).get("callbacks", [])
@@ -1187,6 +1172,43 @@ class Animation:
         if self._scene and not has_handler:
             self._scene.reset_clipping_range()
 
+    def _update_actors(self, time):
+        """Set the interpolated properties of the actors at a given time.
+
+        Parameters
+        ----------
+        time: float or int
+            The time to evaluate the properties at.
+
+        """
+        if self.is_interpolatable("position"):
+            position = self.get_position(time)
+            self._transform.Translate(*position)
+
+        if self.is_interpolatable("opacity"):
+            opacity = self.get_opacity(time)
+            [act.GetProperty().SetOpacity(opacity) for act in self.actors]
+
+        if self.is_interpolatable("rotation"):
+            x, y, z = self.get_rotation(time)
+            # Rotate in the same order as VTK defaults.
+            self._transform.RotateZ(z)
+            self._transform.RotateX(x)
+            self._transform.RotateY(y)
+
+        if self.is_interpolatable("scale"):
+            scale = self.get_scale(time)
+            self._transform.Scale(*scale)
+
+        if self.is_interpolatable("color"):
+            color = self.get_color(time)
+            for act in self.actors:
+                act.vcolors[:] = color * 255
+                utils.update_actor(act)
+
+        # update actors' transformation matrix
+        [act.SetUserTransform(self._transform) for act in self.actors]
+
     def add_to_scene(self, scene):
         """Add this Animation, its actors and sub Animations to the scene"""
         [scene.add(actor) for actor in self._actors]
@@ -1423,7 +1445,7 @@ class CameraAnimation(Animation):
                 translation[:3, 3] = pos
                 # camera axis is reverted
                 rot = -self.get_rotation(time, as_quat=True)
-                rot = transform.Rotation.from_quat(rot).as_matrix()
+                rot = _rotation().from_quat(rot).as_matrix()
                 rot = np.array([[*rot[0], 0], [*rot[1], 0], [*rot[2], 0], [0, 0, 0, 1]])
                 rot = translation @ rot @ np.linalg.inv(translation)
                 self._camera.SetModelTransformMatrix(rot.flatten())
@@ -1444,3 +1466,236 @@ class CameraAnimation(Animation):
                 self._camera.SetViewUp(0, 1, 0)
             if self._scene:
                 self._scene.reset_clipping_range()
+
+
+class BatchAnimation(Animation):
+    """Keyframe animation of many homogeneous instances at once.
+
+    BatchAnimation animates N instances of a glyph actor, i.e. an actor whose
+    vertices are N consecutive copies of the same mesh such as the ones
+    created by :func:`fury.actor.box`, :func:`fury.actor.cone` or
+    :func:`fury.actor.sphere`. Keyframes hold the values of all the instances
+    (struct-of-arrays), e.g. positions of shape (N, 3), and are interpolated
+    for all the instances in one vectorized pass. The results are written
+    directly into the vertex and color buffers of the actor, instead of
+    updating one ``vtkTransform`` per actor.
+
+    Attributes
+    ----------
+    actor : Actor
+        Glyph actor made of N copies of the same mesh.
+    centers : ndarray, shape (N, 3)
+        Centers of the instances the actor was created with.
+    length : float or int, default: None, optional
+        the fixed length of the animation. If set to None, the animation will
+        get its duration from the keyframes being set.
+    loop : bool, optional, default: True
+        Whether to loop the animation (True) of play once (False).
+
+    Notes
+    -----
+    Position keyframes are the centers of the instances. Rotation and scale
+    keyframes are applied around each center, on top of the orientation and
+    size the actor was created with. Keyframe values can either be given per
+    instance, e.g. an array of shape (N, 3) for colors, or once for all the
+    instances, e.g. an array of shape (3,). Per-instance opacity requires an
+    actor with RGBA colors.
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(self, actor, centers, *, length=None, loop=True):
+        super(BatchAnimation, self).__init__(length=length, loop=loop)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        self._n_instances = len(centers)
+        self._centers = centers
+        self.add_actor(actor)
+        self._actor = actor
+        vertices = utils.vertices_from_actor(actor)
+        if len(vertices) % self._n_instances:
+            raise ValueError(
+                f"The actor has {len(vertices)} vertices which cannot be split "
+                f"into {self._n_instances} instances."
+            )
+        self._vertices = vertices.reshape(self._n_instances, -1, 3)
+        self._local_vertices = self._vertices - centers[:, None]
+        colors = utils.colors_from_actor(actor)
+        self._colors = colors.reshape((self._n_instances, -1, colors.shape[-1]))
+
+    @classmethod
+    def from_animations(cls, animations, actor, centers, *, length=None, loop=True):
+        """Create a BatchAnimation from homogeneous Animations.
+
+        Parameters
+        ----------
+        animations : list[Animation]
+            N Animations with keyframes set at the same timestamps for the
+            same attributes. Their interpolators are not kept, the default
+            ones are used.
+        actor : Actor
+            Glyph actor made of N copies of the same mesh.
+        centers : ndarray, shape (N, 3)
+            Centers of the instances the actor was created with.
+        length : float or int, default: None, optional
+            the fixed length of the animation.
+        loop : bool, optional, default: True
+            Whether to loop the animation (True) of play once (False).
+
+        Returns
+        -------
+        BatchAnimation
+
+        """
+        batch = cls(actor, centers, length=length, loop=loop)
+        if len(animations) != batch._n_instances:
+            raise ValueError(
+                f"Expected {batch._n_instances} animations, got {len(animations)}."
+            )
+        attribs = set(animations[0]._get_data()) - {"in_scene"}
+        for attrib in sorted(attribs):
+            all_keyframes = [anim.get_keyframes(attrib=attrib) for anim in animations]
+            timestamps = sorted(all_keyframes[0])
+            if any(sorted(keyframes) != timestamps for keyframes in all_keyframes):
+                raise ValueError(
+                    f"All animations must have the same '{attrib}' timestamps."
+                )
+            keyframes = {
+                t: np.stack([keyframes[t]["value"] for keyframes in all_keyframes])
+                for t in timestamps
+            }
+            batch.set_keyframes(attrib, keyframes)
+        return batch
+
+    @property
+    def n_instances(self):
+        """Return the number of animated instances.
+
+        Returns
+        -------
+        int
+            The number of instances.
+
+        """
+        return self._n_instances
+
+    def set_rotation(self, timestamp, rotation, **kwargs):
+        """Set the rotation keyframe of all the instances at a timestamp.
+
+        Parameters
+        ----------
+        timestamp: float
+            Timestamp of the keyframe
+        rotation: ndarray, shape(N, 3) or shape(N, 4)
+            Rotation of each instance in euler degrees with shape(N, 3) or in
+            quaternions with shape(N, 4).
+
+        Notes
+        -----
+        Euler rotations are executed by rotating first around Z then around X,
+        and finally around Y.
+
+        """
+        rotation = np.asarray(rotation, dtype=float)
+        rotation = np.broadcast_to(rotation, (self._n_instances, rotation.shape[-1]))
+        if rotation.shape[-1] == 3:
+            rotation = (
+                _rotation()
+                .from_euler("zxy", rotation[:, [2, 0, 1]], degrees=True)
+                .as_quat()
+            )
+        elif rotation.shape[-1] != 4:
+            warn(
+                f"Keyframe with {rotation.shape[-1]} components is not a "
+                f"valid rotation data. Skipped!",
+                stacklevel=2,
+            )
+            return
+        self.set_keyframe("rotation", timestamp, rotation, **kwargs)
+
+    def get_rotation(self, t, as_quat=False):
+        """Return the interpolated rotation of all the instances.
+
+        Parameters
+        ----------
+        t: float
+            the time to interpolate rotation at.
+        as_quat: bool
+            Returned rotation will be as quaternion if True.
+
+        Returns
+        -------
+        ndarray(N, 3) or ndarray(N, 4):
+            The interpolated rotations as Euler degrees by default.
+
+        """
+        rot = self.get_value("rotation", t)
+        if as_quat:
+            return rot
+        return _rotation().from_quat(rot).as_euler("zxy", degrees=True)[:, [1, 2, 0]]
+
+    def _per_instance(self, value, n_components):
+        """Broadcast a keyframe value to shape (N, n_components)."""
+        value = np.asarray(value, dtype=float)
+        return np.broadcast_to(np.atleast_2d(value), (self._n_instances, n_components))
+
+    def _update_actors(self, time):
+        """Set the interpolated properties of all the instances at once.
+
+        Parameters
+        ----------
+        time: float or int
+            The time to evaluate the properties at.
+
+        """
+        if self.is_interpolatable("position"):
+            positions = self._per_instance(self.get_position(time), 3)
+        else:
+            positions = self._centers
+
+        matrices = None
+        if self.is_interpolatable("rotation"):
+            quats = self._per_instance(self.get_rotation(time, as_quat=True), 4)
+            matrices = _rotation().from_quat(quats).as_matrix()
+
+        if self.is_interpolatable("scale"):
+            scales = self._per_instance(self.get_scale(time), 3)
+            if matrices is None:
+                matrices = np.zeros((self._n_instances, 3, 3))
+                matrices[:, [0, 1, 2], [0, 1, 2]] = scales
+            else:
+                matrices = matrices * scales[:, None, :]
+
+        if matrices is None:
+            np.add(self._local_vertices, positions[:, None], out=self._vertices)
+        else:
+            np.matmul(
+                self._local_vertices,
+                matrices.transpose(0, 2, 1),
+                out=self._vertices,
+                casting="same_kind",
+            )
+            self._vertices += positions[:, None]
+
+        update_colors = False
+        if self.is_interpolatable("color"):
+            colors = self._per_instance(self.get_color(time), 3)
+            self._colors[..., :3] = 255 * colors[:, None]
+            update_colors = True
+
+        if self.is_interpolatable("opacity"):
+            opacity = self.get_opacity(time)
+            if np.ndim(opacity) == 0:
+                self._actor.GetProperty().SetOpacity(opacity)
+            elif self._colors.shape[-1] == 4:
+                self._colors[..., 3] = 255 * np.reshape(opacity, (-1, 1))
+                update_colors = True
+            else:
+                raise ValueError("Per-instance opacity requires RGBA colors.")
+
+        utils.update_actor(self._actor, all_arrays=update_colors)
+        utils.compute_bounds(self._actor)
+        # The instances are in world space, only the parent transform is left.
+        self._actor.SetUserTransform(self._transform)
+
+    def update_motion_path(self):
+        """Motion paths are not drawn for batched instances."""
@@ -23,10 +23,9 @@ def get_previous_timestamp(timestamps, current_time, *, include_last=False):
         The previous timestamp
 
     """
-    for timestamp in timestamps[::-1] if include_last else timestamps[-2::-1]:
-        if timestamp <= current_time:
-            return timestamp
-    return timestamps[0]
+    last = len(timestamps) - (1 if include_last else 2)
+    index = np.searchsorted(timestamps, current_time, side="right") - 1
+    return timestamps[max(min(index, last), 0)]
 
 
 @warn_on_args_to_kwargs()
@@ -49,10 +48,9 @@ def get_next_timestamp(timestamps, current_time, *, include_first=False):
         The next timestamp
 
     """
-    for timestamp in timestamps[:] if include_first else timestamps[1:]:
-        if timestamp > current_time:
-            return timestamp
-    return timestamps[-1]
+    first = 0 if include_first else 1
+    index = np.searchsorted(timestamps, current_time, side="right")
+    return timestamps[min(max(index, first), len(timestamps) - 1)]
 
 
 def get_timestamps_from_keyframes(keyframes):
@@ -96,19 +94,24 @@ def get_time_tau(t, t0, t1):
 
     Parameters
     ----------
-    t : float or int
+    t : float or int or ndarray
         Current time to calculate tau for.
-    t0 : float or int
+    t0 : float or int or ndarray
         Lower timestamp of the time period.
-    t1 : float or int
+    t1 : float or int or ndarray
         Higher timestamp of the time period.
 
     Returns
     -------
-    float
+    float or ndarray
         The time tau
 
     """
+    if np.ndim(t) or np.ndim(t0) or np.ndim(t1):
+        t, t0, t1 = np.broadcast_arrays(t, t0, t1)
+        span = np.where(t1 > t0, t1 - t0, 1)
+        tau = np.clip((t - t0) / span, 0, 1)
+        return np.where(t <= t0, 0, np.where(t >= t1, 1, tau))
     return 0 if t <= t0 else 1 if t >= t1 else (t - t0) / (t1 - t0)
 
 
@@ -118,14 +121,14 @@ def lerp(v0, v1, t0, t1, t):
     Parameters
     ----------
     v0: ndarray or float or int.
-        The first value
+        The first value, or the stacked first values of each time in `t`.
     v1: ndarray or float or int.
-        The second value
-    t : float or int
+        The second value, or the stacked second values of each time in `t`.
+    t : float or int or ndarray
         Current time to interpolate at.
-    t0 : float or int
+    t0 : float or int or ndarray
         Timestamp associated with v0.
-    t1 : float or int
+    t1 : float or int or ndarray
         Timestamp associated with v1.
 
     Returns
@@ -134,6 +137,10 @@ def lerp(v0, v1, t0, t1, t):
         The interpolated value
 
     """
+    if np.ndim(t) or np.ndim(t0):
+        dt = np.where(np.equal(t0, t1), 0, get_time_tau(t, t0, t1))
+        dt = expand_time_tau(dt, v0)
+        return dt * (v1 - v0) + v0
     if t0 == t1:
         return v0
     v = v1 - v0
@@ -156,3 +163,107 @@ def euclidean_distances(points):
 
     """
     return [np.linalg.norm(x - y) for x, y in zip(points, points[1:])]
+
+
+def expand_time_tau(tau, values):
+    """Reshape an array of time taus to broadcast against stacked values.
+
+    Parameters
+    ----------
+    tau : float or ndarray, shape (N,)
+        Time tau of each evaluated time.
+    values : ndarray, shape (N, ...)
+        Values associated with each evaluated time.
+
+    Returns
+    -------
+    float or ndarray
+        `tau` with trailing axes added to match the dimensions of `values`.
+
+    """
+    if not np.ndim(tau):
+        return tau
+    tau = np.asarray(tau)
+    return tau.reshape(tau.shape + (1,) * (np.ndim(values) - tau.ndim))
+
+
+class KeyframeIndex:
+    """Sorted view of keyframes with a fast lookup of the surrounding interval.
+
+    Keyframe timestamps are sorted once and looked up with `np.searchsorted`.
+    The interval found last is cached, so successive evaluations inside the
+    same interval (the usual case while playing an animation) cost two
+    comparisons. Keyframe data is stacked into arrays ordered by timestamp,
+    which lets interpolators evaluate arrays of times at once.
+
+    Parameters
+    ----------
+    keyframes : dict
+        keyframes dict that contains timestamps as keys and data as values.
+
+    """
+
+    def __init__(self, keyframes):
+        self.keyframes = keyframes
+        self.timestamps = get_timestamps_from_keyframes(keyframes)
+        self._last = max(len(self.timestamps) - 2, 0)
+        self._arrays = {}
+        self._interval = (np.inf, -np.inf, 0)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def get(self, key="value"):
+        """Return the data of all keyframes for a given key.
+
+        Parameters
+        ----------
+        key : str, optional
+            The keyframe data key, e.g. 'value', 'in_cp' or 'out_tangent'.
+
+        Returns
+        -------
+        ndarray
+            Keyframes data stacked in the order of the timestamps.
+
+        """
+        if key not in self._arrays:
+            data = [self.keyframes.get(t, {}).get(key) for t in self.timestamps]
+            try:
+                self._arrays[key] = np.asarray(data)
+            except ValueError:
+                # Inconsistent data, kept as is to fail on evaluation.
+                self._arrays[key] = np.array(data + [None], dtype=object)[:-1]
+        return self._arrays[key]
+
+    def segment(self, t):
+        """Return the indices of the keyframes surrounding a time.
+
+        The returned indices are the ones of the timestamps given by
+        `get_previous_timestamp` and `get_next_timestamp`.
+
+        Parameters
+        ----------
+        t : float or ndarray
+            The time, or array of times, to look for.
+
+        Returns
+        -------
+        tuple of int or tuple of ndarray
+            Indices of the previous and next keyframes.
+
+        """
+        n = len(self.timestamps)
+        if np.ndim(t):
+            index = np.searchsorted(self.timestamps, t, side="right") - 1
+            index = np.clip(index, 0, self._last)
+            return index, np.minimum(index + 1, n - 1)
+
+        lower, upper, index = self._interval
+        if not lower <= t < upper:
+            index = np.searchsorted(self.timestamps, t, side="right") - 1
+            index = int(min(max(index, 0), self._last))
+            lower = -np.inf if index == 0 else self.timestamps[index]
+            upper = np.inf if index >= n - 2 else self.timestamps[index + 1]
+            self._interval = (lower, upper, index)
+        return index, min(index + 1, n - 1)
@@ -1,11 +1,9 @@
 import numpy as np
-from scipy.interpolate import splev, splprep
-from scipy.spatial import transform
 
 from fury.animation.helpers import (
+    KeyframeIndex,
     euclidean_distances,
-    get_next_timestamp,
-    get_previous_timestamp,
+    expand_time_tau,
     get_time_tau,
     get_timestamps_from_keyframes,
     get_values_from_keyframes,
@@ -40,22 +38,28 @@ def spline_interpolator(keyframes, degree):
             f"keyframes must be set in order to use "
             f"{degree}-degree spline"
         )
-    timestamps = get_timestamps_from_keyframes(keyframes)
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
 
     values = get_values_from_keyframes(keyframes)
     distances = euclidean_distances(values)
     distances_sum = sum(distances)
     cumulative_dist_sum = np.cumsum([0] + distances)
+    distances = np.asarray(distances)
+    # scipy.interpolate is slow to import and only needed by this interpolator.
+    from scipy.interpolate import splev, splprep
+
     tck = splprep(values.T, k=degree, full_output=1, s=0)[0][0]
 
     def interpolate(t):
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-        mi_index = np.where(timestamps == t0)[0][0]
+        mi_index, next_index = index.segment(t)
+        t0 = timestamps[mi_index]
+        t1 = timestamps[next_index]
         dt = get_time_tau(t, t0, t1)
         section = cumulative_dist_sum[mi_index]
         ts = (section + dt * distances[mi_index]) / distances_sum
-        return np.array(splev(ts, tck))
+        value = np.array(splev(ts, tck))
+        return value.T if np.ndim(t) else value
 
     return interpolate
 
@@ -104,10 +108,14 @@ def step_interpolator(keyframes):
         value at that time.
 
     """
-    timestamps = get_timestamps_from_keyframes(keyframes)
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
 
     def interpolate(t):
-        previous_t = get_previous_timestamp(timestamps, t, include_last=True)
+        i0, i1 = index.segment(t)
+        if np.ndim(t):
+            return index.get("value")[np.where(t >= timestamps[i1], i1, i0)]
+        previous_t = timestamps[i1] if t >= timestamps[i1] else timestamps[i0]
         return keyframes.get(previous_t).get("value")
 
     return interpolate
@@ -131,18 +139,18 @@ def linear_interpolator(keyframes):
         value at that time.
 
     """
-    timestamps = get_timestamps_from_keyframes(keyframes)
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
     is_single = len(keyframes) == 1
 
     def interpolate(t):
         if is_single:
-            t = timestamps[0]
-            return keyframes.get(t).get("value")
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-        p0 = keyframes.get(t0).get("value")
-        p1 = keyframes.get(t1).get("value")
-        return lerp(p0, p1, t0, t1, t)
+            value = keyframes.get(timestamps[0]).get("value")
+            return np.repeat([value], len(t), axis=0) if np.ndim(t) else value
+        i0, i1 = index.segment(t)
+        t0, t1 = timestamps[i0], timestamps[i1]
+        values = index.get("value")
+        return lerp(values[i0], values[i1], t0, t1, t)
 
     return interpolate
 
@@ -170,7 +178,8 @@ def cubic_bezier_interpolator(keyframes):
     Bézier interpolator will almost behave as a linear interpolator.
 
     """
-    timestamps = get_timestamps_from_keyframes(keyframes)
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
 
     for ts in timestamps:
         # keyframe at timestamp
@@ -182,15 +191,13 @@ def cubic_bezier_interpolator(keyframes):
             kf_ts["out_cp"] = kf_ts.get("value")
 
     def interpolate(t):
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-        k0 = keyframes.get(t0)
-        k1 = keyframes.get(t1)
-        p0 = k0.get("value")
-        p1 = k0.get("out_cp")
-        p2 = k1.get("in_cp")
-        p3 = k1.get("value")
-        dt = get_time_tau(t, t0, t1)
+        i0, i1 = index.segment(t)
+        t0, t1 = timestamps[i0], timestamps[i1]
+        p0 = index.get("value")[i0]
+        p1 = index.get("out_cp")[i0]
+        p2 = index.get("in_cp")[i1]
+        p3 = index.get("value")[i1]
+        dt = expand_time_tau(get_time_tau(t, t0, t1), p0)
         val = (
             (1 - dt) ** 3 * p0
             + 3 * (1 - dt) ** 2 * dt * p1
@@ -220,7 +227,9 @@ def slerp(keyframes):
 
     Notes
     -----
-    Rotation keyframes must be in the form of quaternions.
+    Rotation keyframes must be in the form of quaternions. Keyframes holding
+    an array of shape (N, 4) are the rotations of N instances, which are all
+    interpolated at once.
 
     """
     timestamps = get_timestamps_from_keyframes(keyframes)
@@ -228,6 +237,10 @@ def slerp(keyframes):
     quat_rots = []
     for ts in timestamps:
         quat_rots.append(keyframes.get(ts).get("value"))
+    if quat_rots and np.ndim(quat_rots[0]) == 2:
+        return _instances_slerp(keyframes)
+    from scipy.spatial import transform
+
     rotations = transform.Rotation.from_quat(quat_rots)
     # if only one keyframe specified, linear interpolator is used.
     if len(timestamps) == 1:
@@ -237,7 +250,10 @@ def slerp(keyframes):
     max_t = timestamps[-1]
 
     def interpolate(t):
-        t = min_t if t < min_t else max_t if t > max_t else t
+        if np.ndim(t):
+            t = np.clip(t, min_t, max_t)
+        else:
+            t = min_t if t < min_t else max_t if t > max_t else t
         v = slerp_interp(t)
         q = v.as_quat()
         return q
@@ -245,6 +261,39 @@ def slerp(keyframes):
     return interpolate
 
 
+def _instances_slerp(keyframes):
+    """Spherical interpolation of the (N, 4) quaternion keyframes of N
+    instances, see :func:`slerp`."""
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
+    quats = index.get("value").astype(float)
+    quats /= np.linalg.norm(quats, axis=-1, keepdims=True)
+    min_t = timestamps[0]
+    max_t = timestamps[-1]
+
+    def interpolate(t):
+        t = np.clip(t, min_t, max_t) if np.ndim(t) else min(max(t, min_t), max_t)
+        i0, i1 = index.segment(t)
+        q0, q1 = quats[i0], quats[i1]
+        tau = get_time_tau(t, timestamps[i0], timestamps[i1])
+        tau = expand_time_tau(tau, q0[..., :1])
+
+        # Take the shortest path
+        dot = np.sum(q0 * q1, axis=-1, keepdims=True)
+        q1 = np.where(dot < 0, -q1, q1)
+        theta = np.arccos(np.clip(np.abs(dot), 0, 1))
+        sin_theta = np.sin(theta)
+        # Fall back to linear interpolation for almost equal rotations
+        is_small = sin_theta < 1e-6
+        sin_theta = np.where(is_small, 1, sin_theta)
+        w0 = np.where(is_small, 1 - tau, np.sin((1 - tau) * theta) / sin_theta)
+        w1 = np.where(is_small, tau, np.sin(tau * theta) / sin_theta)
+        q = w0 * q0 + w1 * q1
+        return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+    return interpolate
+
+
 def color_interpolator(keyframes, rgb2space, space2rgb):
     """Custom-space color interpolator.
 
@@ -268,21 +317,20 @@ def color_interpolator(keyframes, rgb2space, space2rgb):
         value at that time.
 
     """
-    timestamps = get_timestamps_from_keyframes(keyframes)
-    space_keyframes = {}
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
     is_single = len(keyframes) == 1
-    for ts, keyframe in keyframes.items():
-        space_keyframes[ts] = rgb2space(keyframe.get("value"))
+    space_values = np.asarray(
+        [rgb2space(keyframes.get(ts).get("value")) for ts in timestamps]
+    )
 
     def interpolate(t):
         if is_single:
-            t = timestamps[0]
-            return keyframes.get(t).get("value")
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-        c0 = space_keyframes.get(t0)
-        c1 = space_keyframes.get(t1)
-        space_color_val = lerp(c0, c1, t0, t1, t)
+            value = keyframes.get(timestamps[0]).get("value")
+            return np.repeat([value], len(t), axis=0) if np.ndim(t) else value
+        i0, i1 = index.segment(t)
+        t0, t1 = timestamps[i0], timestamps[i1]
+        space_color_val = lerp(space_values[i0], space_values[i1], t0, t1, t)
         return space2rgb(space_color_val)
 
     return interpolate
@@ -339,27 +387,28 @@ def tan_cubic_spline_interpolator(keyframes):
         value at that time.
 
     """
-    timestamps = get_timestamps_from_keyframes(keyframes)
+    index = KeyframeIndex(keyframes)
+    timestamps = index.timestamps
     for time in keyframes:
         data = keyframes.get(time)
         value = data.get("value")
         if data.get("in_tangent") is None:
             data["in_tangent"] = np.zeros_like(value)
-        if data.get("in_tangent") is None:
-            data["in_tangent"] = np.zeros_like(value)
+        if data.get("out_tangent") is None:
+            data["out_tangent"] = np.zeros_like(value)
 
     def interpolate(t):
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
+        i0, i1 = index.segment(t)
+        t0, t1 = timestamps[i0], timestamps[i1]
 
-        dt = get_time_tau(t, t0, t1)
+        p0 = index.get("value")[i0]
+        dt = expand_time_tau(get_time_tau(t, t0, t1), p0)
 
-        time_delta = t1 - t0
+        time_delta = expand_time_tau(t1 - t0, p0)
 
-        p0 = keyframes.get(t0).get("value")
-        tan_0 = keyframes.get(t0).get("out_tangent") * time_delta
-        p1 = keyframes.get(t1).get("value")
-        tan_1 = keyframes.get(t1).get("in_tangent") * time_delta
+        tan_0 = index.get("out_tangent")[i0] * time_delta
+        p1 = index.get("value")[i1]
+        tan_1 = index.get("in_tangent")[i1] * time_delta
         # cubic spline equation using tangents
         t2 = dt * dt
         t3 = t2 * dt
@@ -1,8 +1,9 @@
 import numpy as np
 import numpy.testing as npt
+from scipy.spatial import transform
 
-from fury import actor
-from fury.animation import Animation, CameraAnimation
+from fury import actor, utils
+from fury.animation import Animation, BatchAnimation, CameraAnimation
 from fury.animation.interpolator import (
     cubic_bezier_interpolator,
     cubic_spline_interpolator,
@@ -115,3 +116,78 @@ def test_camera_animation():
     matrix.DeepCopy(rot.ravel(), matrix)
     expected = np.array([[1, 0, 0, 0], [0, -1, 0, 4], [0, 0, -1, 2], [0, 0, 0, 1]])
     npt.assert_almost_equal(expected, rot.reshape([4, 4]))
+
+
+def test_batch_animation():
+    n = 4
+    centers = np.random.rand(n, 3)
+    box_actor = actor.box(centers, colors=np.random.rand(n, 3))
+    local = (utils.vertices_from_actor(box_actor).reshape(n, -1, 3)) - centers[:, None]
+
+    batch = BatchAnimation(box_actor, centers)
+    npt.assert_equal(batch.n_instances, n)
+    npt.assert_equal(batch.actors, [box_actor])
+
+    positions = np.random.rand(n, 3) * 10
+    rotations = np.random.rand(n, 3) * 90
+    colors = np.random.rand(n, 3)
+    batch.set_position(0, centers)
+    batch.set_position(2, positions)
+    batch.set_rotation(0, np.zeros(3))
+    batch.set_rotation(2, rotations)
+    batch.set_scale(0, np.ones(3))
+    batch.set_scale(2, [1, 2, 3])
+    batch.set_color(2, colors)
+    npt.assert_equal(batch.get_rotation(0, as_quat=True).shape, (n, 4))
+    npt.assert_almost_equal(batch.get_rotation(2), rotations)
+
+    batch.update_animation(time=2)
+    matrices = transform.Rotation.from_euler(
+        "zxy", rotations[:, [2, 0, 1]], degrees=True
+    ).as_matrix() * np.array([1, 2, 3])
+    expected = np.einsum("nij,nvj->nvi", matrices, local) + positions[:, None]
+    vertices = utils.vertices_from_actor(box_actor).reshape(n, -1, 3)
+    npt.assert_almost_equal(vertices, expected, decimal=4)
+    vcolors = utils.colors_from_actor(box_actor).reshape(n, -1, 3)
+    npt.assert_array_equal(
+        vcolors,
+        np.broadcast_to((colors * 255).astype(np.uint8)[:, None], vcolors.shape),
+    )
+
+    # Each instance interpolates its own rotation.
+    batch.update_animation(time=1)
+    expected_quats = [
+        transform.Slerp([0, 2], transform.Rotation.from_quat([[0, 0, 0, 1], q]))(
+            1
+        ).as_quat()
+        for q in batch.get_rotation(2, as_quat=True)
+    ]
+    quats = batch.get_rotation(1, as_quat=True)
+    npt.assert_almost_equal(np.abs(np.sum(quats * expected_quats, axis=1)), 1)
+
+    npt.assert_raises(ValueError, BatchAnimation, box_actor, np.zeros((3, 3)))
+
+
+def test_batch_animation_from_animations():
+    n = 3
+    centers = np.zeros((n, 3))
+    animations = []
+    for i in range(n):
+        anim = Animation()
+        anim.set_position(0, np.zeros(3))
+        anim.set_position(1, np.array([i, 0, 0]))
+        anim.set_opacity(1, 0.5)
+        animations.append(anim)
+    box_actor = actor.box(centers, colors=np.ones((n, 4)))
+    batch = BatchAnimation.from_animations(animations, box_actor, centers)
+    npt.assert_almost_equal(
+        batch.get_position(0.5), [[0, 0, 0], [0.5, 0, 0], [1, 0, 0]]
+    )
+    npt.assert_almost_equal(batch.get_opacity(1), [0.5] * n)
+    batch.update_animation(time=1)
+    npt.assert_array_equal(utils.colors_from_actor(box_actor)[:, 3], 127)
+
+    animations[1].set_position(2, np.ones(3))
+    npt.assert_raises(
+        ValueError, BatchAnimation.from_animations, animations, box_actor, centers
+    )
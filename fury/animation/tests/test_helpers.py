@@ -32,6 +32,11 @@ def test_lerp():
     npt.assert_array_equal(helpers.lerp(v0, v1, t0, t1, t0), v0)
     npt.assert_array_equal(helpers.lerp(v0, v1, t0, t1, t1), v1)
 
+    times = np.arange(-100, 100) / 10
+    interp_values = helpers.lerp(np.tile(v0, (200, 1)), v1, t0, t1, times)
+    for t, interp_value in zip(times, interp_values):
+        npt.assert_array_equal(helpers.lerp(v0, v1, t0, t1, t), interp_value)
+
 
 def test_get_values_from_keyframes():
     keyframes = {
@@ -100,6 +105,12 @@ def test_get_time_tau():
     ft.assert_equal(helpers.get_time_tau(14, 5, 20), 0.6)
     ft.assert_equal(helpers.get_time_tau(1.5, 1, 2), 0.5)
 
+    times = np.arange(-100, 100) / 10
+    npt.assert_array_equal(
+        helpers.get_time_tau(times, t0, t1),
+        [helpers.get_time_tau(t, t0, t1) for t in times],
+    )
+
 
 def test_euclidean_distances():
     points = [
@@ -111,3 +122,33 @@ def test_euclidean_distances():
     distance = helpers.euclidean_distances(points)
     expected_distances = np.array([1, 1, 2])
     npt.assert_equal(distance, expected_distances)
+
+
+def test_keyframe_index():
+    keyframes = {t: {"value": np.array([t, 2 * t, 0])} for t in [3, 1, 2, 6, 4, 5]}
+    index = helpers.KeyframeIndex(keyframes)
+    timestamps = np.array([1, 2, 3, 4, 5, 6])
+    npt.assert_array_equal(index.timestamps, timestamps)
+    npt.assert_equal(len(index), 6)
+    npt.assert_array_equal(index.get("value")[:, 0], timestamps)
+    npt.assert_array_equal(index.get("in_cp"), [None] * 6)
+
+    times = np.arange(-100, 100) / 10
+    for t in np.concatenate([times, times[::-1]]):
+        i0, i1 = index.segment(t)
+        ft.assert_equal(timestamps[i0], helpers.get_previous_timestamp(timestamps, t))
+        ft.assert_equal(timestamps[i1], helpers.get_next_timestamp(timestamps, t))
+
+    i0, i1 = index.segment(times)
+    expected = [helpers.get_previous_timestamp(timestamps, t) for t in times]
+    npt.assert_array_equal(timestamps[i0], expected)
+    expected = [helpers.get_next_timestamp(timestamps, t) for t in times]
+    npt.assert_array_equal(timestamps[i1], expected)
+
+    index = helpers.KeyframeIndex({1: {"value": np.array([1, 2, 3])}})
+    npt.assert_equal(index.segment(-10), (0, 0))
+    npt.assert_equal(index.segment(10), (0, 0))
+
+    index = helpers.KeyframeIndex({1: {"value": None}, 2: {"value": np.ones(3)}})
+    npt.assert_equal(index.get("value").dtype, object)
+    npt.assert_equal(len(index.get("value")), 2)
@@ -12,6 +12,7 @@ from fury.animation.interpolator import (
     slerp,
     spline_interpolator,
     step_interpolator,
+    tan_cubic_spline_interpolator,
     xyz_color_interpolator,
 )
 
@@ -351,3 +352,40 @@ def test_slerp():
         raise Exception("This shouldn't work since invalid keyframes were provided!")
     except ValueError:
         ...
+
+
+def test_interpolators_array_of_times():
+    data = {
+        t: {
+            "value": np.array([t, t**2, 1.0]),
+            "in_cp": np.array([t, 0, 0.5]),
+            "in_tangent": np.array([1.0, 0, 0]),
+            "out_tangent": np.array([0, 1.0, 0]),
+        }
+        for t in range(6)
+    }
+    color_data = {t: {"value": np.array([t / 5, 1 - t / 5, 0.5])} for t in range(6)}
+    rotations = {
+        0: {"value": np.array([0, 0, 0, 1])},
+        2: {"value": np.array([0, 0.7071068, 0, 0.7071068])},
+        5: {"value": np.array([0.7071068, 0, 0, 0.7071068])},
+    }
+    interpolators = [
+        step_interpolator(data),
+        linear_interpolator(data),
+        linear_interpolator({1: {"value": np.array([1, 2, 3])}}),
+        cubic_bezier_interpolator(data),
+        cubic_spline_interpolator(data),
+        spline_interpolator(data, degree=2),
+        tan_cubic_spline_interpolator(data),
+        hsv_color_interpolator(color_data),
+        lab_color_interpolator(color_data),
+        xyz_color_interpolator(color_data),
+        slerp(rotations),
+    ]
+    times = np.linspace(-1, 7, 97)
+    for interpolator in interpolators:
+        values = interpolator(times)
+        expected = np.array([interpolator(t) for t in times])
+        npt.assert_equal(values.shape, expected.shape)
+        npt.assert_array_almost_equal(values, expected)
@@ -1,4 +1,3 @@
-import os
 from time import perf_counter
 
 from PIL import Image
@@ -7,6 +6,7 @@ import numpy as np
 from fury import window
 from fury.animation.animation import Animation
 from fury.decorators import warn_on_args_to_kwargs
+from fury.io import FrameWriter
 from fury.lib import RenderWindow, WindowToImageFilter, numpy_support
 from fury.ui.elements import PlaybackPanel
 
@@ -300,6 +300,9 @@ class Timeline:
         multi_samples=8,
         max_peels=4,
         show_panel=False,
+        return_frames=None,
+        max_queue_size=8,
+        n_workers=None,
     ):
         """Record the animation
 
@@ -307,7 +310,9 @@ class Timeline:
         ----------
         fname : str, optional
             The file name. Save a GIF file if name ends with '.gif', or mp4
-            video if name ends with'.mp4'.
+            video if name ends with'.mp4'. Other image extensions save one file
+            per frame, numbered before the extension, e.g. 'frame.png' gives
+            'frame000000.png', see :class:`fury.io.FrameWriter`.
             If None, this method will only return an array of frames.
         fps : int, optional
             The number of frames per second of the record.
@@ -326,30 +331,30 @@ class Timeline:
         show_panel : bool, optional, default False
             Controls whether to show the playback (if True) panel of hide it
             (if False)
+        return_frames : bool, optional
+            Keep all the frames in memory and return them. By default only
+            when ``fname`` is None, so that recording a long animation to a
+            file uses a bounded amount of memory.
+        max_queue_size : int, optional
+            Maximum number of rendered frames waiting to be written. Rendering
+            pauses when it is reached.
+        n_workers : int, optional
+            Number of threads encoding and writing the frames.
+            See :class:`fury.io.FrameWriter`.
 
         Returns
         -------
-        ndarray:
-            The recorded frames.
+        list:
+            The recorded frames as PIL images, empty if ``return_frames`` is
+            False.
 
         Notes
         -----
         It's recommended to use 50 or 30 FPS while recording to a GIF file.
 
         """
-        ext = os.path.splitext(fname)[-1]
-
-        mp4 = ext == ".mp4"
-
-        if mp4:
-            try:
-                import cv2
-            except ImportError as err:
-                raise ImportError(
-                    "OpenCV must be installed in order to " "save as MP4 video."
-                ) from err
-            fourcc = cv2.VideoWriter.fourcc(*"mp4v")
-            out = cv2.VideoWriter(fname, fourcc, fps, size)
+        if return_frames is None:
+            return_frames = fname is None
 
         duration = self.duration
         step = speed / fps
@@ -370,57 +375,55 @@ class Timeline:
         render_window.SetSize(*size)
 
         if order_transparent:
-            window.antialiasing(scene, render_window, multi_samples, max_peels, 0)
-
-        render_window = RenderWindow()
-        render_window.SetOffScreenRendering(1)
-        render_window.AddRenderer(scene)
-        render_window.SetSize(*size)
-
-        if order_transparent:
-            window.antialiasing(scene, render_window, multi_samples, max_peels, 0)
+            window.antialiasing(
+                scene,
+                render_window,
+                multi_samples=multi_samples,
+                max_peels=max_peels,
+                occlusion_ratio=0,
+            )
 
         window_to_image_filter = WindowToImageFilter()
 
-        print("Recording...")
-        while t < duration:
-            self.seek(t)
-            render_window.Render()
-            window_to_image_filter.SetInput(render_window)
-            window_to_image_filter.Update()
-            window_to_image_filter.Modified()
-            vtk_image = window_to_image_filter.GetOutput()
-            h, w, _ = vtk_image.GetDimensions()
-            vtk_array = vtk_image.GetPointData().GetScalars()
-            components = vtk_array.GetNumberOfComponents()
-            snap = numpy_support.vtk_to_numpy(vtk_array).reshape(w, h, components)
-            corrected_snap = np.flipud(snap)
-
-            if mp4:
-                cv_img = cv2.cvtColor(corrected_snap, cv2.COLOR_RGB2BGR)
-                out.write(cv_img)
-            else:
-                pillow_snap = Image.fromarray(corrected_snap)
-                frames.append(pillow_snap)
-
-            t += step
-
-        print("Saving...")
-
-        if fname is None:
-            return frames
-
-        if mp4:
-            out.release()
-        else:
-            frames[0].save(
+        # Frames are encoded and written by background threads while the next
+        # ones are rendered.
+        writer = None
+        if fname is not None:
+            writer = FrameWriter(
                 fname,
-                append_images=frames[1:],
-                loop=0,
-                duration=1000 / fps,
-                save_all=True,
+                fps=fps,
+                numbered=True,
+                max_queue_size=max_queue_size,
+                n_workers=n_workers,
             )
 
+        print("Recording...")
+        try:
+            while t < duration:
+                self.seek(t)
+                render_window.Render()
+                window_to_image_filter.SetInput(render_window)
+                window_to_image_filter.Update()
+                window_to_image_filter.Modified()
+                vtk_image = window_to_image_filter.GetOutput()
+                h, w, _ = vtk_image.GetDimensions()
+                vtk_array = vtk_image.GetPointData().GetScalars()
+                components = vtk_array.GetNumberOfComponents()
+                snap = numpy_support.vtk_to_numpy(vtk_array).reshape(w, h, components)
+                corrected_snap = np.flipud(snap)
+
+                if writer is not None:
+                    writer.submit(corrected_snap)
+                if return_frames:
+                    frames.append(Image.fromarray(corrected_snap))
+
+                t += step
+
+            print("Saving...")
+        finally:
+            if writer is not None:
+                writer.close()
+
         if _hide_panel:
             self.playback_panel.show()
 
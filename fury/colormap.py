@@ -1,9 +1,9 @@
+import importlib.util
 import json
 from os.path import join as pjoin
 from warnings import warn
 
 import numpy as np
-from scipy import linalg
 
 from fury.data import DATA_DIR
 from fury.decorators import warn_on_args_to_kwargs
@@ -12,7 +12,8 @@ from fury.lib import LookupTable
 # Allow import, but disable doctests if we don't have matplotlib
 from fury.optpkg import optional_package
 
-cm, have_matplotlib, _ = optional_package("matplotlib.cm")
+# matplotlib is slow to import, it is only imported by ``create_colormap``.
+have_matplotlib = importlib.util.find_spec("matplotlib") is not None
 
 
 @warn_on_args_to_kwargs()
@@ -360,7 +361,11 @@ def create_colormap(v, *, name="plasma", auto=True):
     # For backwards compatibility with lowercase names
     newname = lowercase_cm_name.get(name) or name
 
-    colormap = getattr(cm, newname) if have_matplotlib else get_cmap(newname)
+    if have_matplotlib:
+        cm, _, _ = optional_package("matplotlib.cm")
+        colormap = getattr(cm, newname)
+    else:
+        colormap = get_cmap(newname)
     if colormap is None:
         e_s = "Colormap {} is not yet implemented ".format(name)
         raise ValueError(e_s)
@@ -761,7 +766,7 @@ xyz_from_rgb = np.array(
     ]
 )
 
-rgb_from_xyz = linalg.inv(xyz_from_rgb)
+rgb_from_xyz = np.linalg.inv(xyz_from_rgb)
 
 
 def xyz2rgb(xyz):
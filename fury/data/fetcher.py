@@ -1,22 +1,27 @@
 """Fetcher based on dipy."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
+from functools import partial
 from hashlib import sha256
 import json
 import os
 from os.path import dirname, join as pjoin
 import platform
-from shutil import copyfileobj
+import shutil
 import sys
 import tarfile
-from urllib.request import urlopen
+from threading import Lock
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 import warnings
 import zipfile
 
 import aiohttp
 
 from fury.decorators import warn_on_args_to_kwargs
+from fury.deprecator import deprecate_with_version
 
 # Set a user-writeable file-system location to put files:
 if "FURY_HOME" in os.environ:
@@ -24,6 +29,19 @@ if "FURY_HOME" in os.environ:
 else:
     fury_home = pjoin(os.path.expanduser("~"), ".fury")
 
+# Content-addressed cache of the downloaded files, it can be shared between
+# users and processes by pointing FURY_CACHE to a common directory. The cache
+# creates its folders and lock files with the umask of each process, so a
+# cache shared by several users must be a group-writable setgid directory
+# used with a umask that keeps the group write permission (e.g. 002):
+if "FURY_CACHE" in os.environ:
+    fury_cache = os.environ["FURY_CACHE"]
+else:
+    fury_cache = pjoin(fury_home, "cache")
+
+# Size of the blocks read from the network and hashed while being written.
+_CHUNK_SIZE = 1024 * 1024
+
 # The URL to the University of Washington Researchworks repository:
 UW_RW_URL = "https://digital.lib.washington.edu/researchworks/bitstream/handle/"
 
@@ -80,6 +98,10 @@ def update_progressbar(progress, total_length):
     sys.stdout.flush()
 
 
+@deprecate_with_version(
+    "copyfileobj_withprogress is deprecated, fetch_data now reports the "
+    "progress of all its downloads at once."
+)
 @warn_on_args_to_kwargs()
 def copyfileobj_withprogress(fsrc, fdst, total_length, *, length=16 * 1024):
     copied = 0
@@ -93,6 +115,31 @@ def copyfileobj_withprogress(fsrc, fdst, total_length, *, length=16 * 1024):
         update_progressbar(progress, total_length)
 
 
+class _DownloadProgress:
+    """Progress of concurrent downloads, shown at most once per percent."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._total = 0
+        self._copied = 0
+        self._percent = -1
+
+    def add(self, total_length, *, copied=0):
+        with self._lock:
+            self._total += total_length
+            self._copied += copied
+
+    def update(self, length):
+        with self._lock:
+            self._copied += length
+            if not self._total:
+                return
+            progress = min(self._copied / self._total, 1)
+            if int(100 * progress) != self._percent:
+                self._percent = int(100 * progress)
+                update_progressbar(progress, self._total)
+
+
 def _already_there_msg(folder):
     """Print a message indicating that dataset is already in place."""
     msg = "Dataset is already in place. If you want to fetch it again "
@@ -137,7 +184,11 @@ def check_sha(filename, *, stored_sha256=None):
     if stored_sha256 is not None:
         computed_sha256 = _get_file_sha(filename)
         if stored_sha256.lower() != computed_sha256:
-            msg = """The downloaded file, %s,
+            raise _sha_error(filename, stored_sha256, computed_sha256)
+
+
+def _sha_error(filename, stored_sha256, computed_sha256):
+    msg = """The downloaded file, %s,
              does not have the expected sha
             checksum of "%s".
              Instead, the sha checksum was: "%s".
@@ -147,27 +198,198 @@ def check_sha(filename, *, stored_sha256=None):
             You can try downloading the file again
              or updating to the newest version of
             Fury.""" % (filename, stored_sha256, computed_sha256)
-            raise FetcherError(msg)
+    return FetcherError(msg)
+
 
+@contextlib.contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on ``path`` shared by threads and processes.
 
+    The lock is taken on a ``.lock`` file next to ``path``, which is kept
+    afterwards to avoid races between removal and creation.
+    """
+    with open(path + ".lock", "a+b") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 seconds, keep waiting.
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@warn_on_args_to_kwargs()
+def _download_file(url, fname, *, progress=None):
+    """Download a file, resuming a previous partial download if any.
+
+    The data is written to ``fname + '.part'``, hashed on the fly, and the
+    file is renamed to ``fname`` once complete.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    fname : str
+        The path of the downloaded file.
+    progress : _DownloadProgress, optional
+        Progress shared between several downloads.
+
+    Returns
+    -------
+    sha256 : str
+        The sha checksum of the downloaded file.
+
+    """
+    part = fname + ".part"
+    sha256_data = sha256()
+    offset = 0
+    if os.path.exists(part):
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                sha256_data.update(chunk)
+                offset += len(chunk)
+
+    request = Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+    try:
+        response = urlopen(request)
+    except HTTPError as e:
+        # 416: the partial file already holds all the requested bytes.
+        if not (offset and e.code == 416):
+            raise
+        os.replace(part, fname)
+        return sha256_data.hexdigest()
+
+    with contextlib.closing(response):
+        if offset and getattr(response, "status", None) != 206:
+            # The server does not support ranges, start over.
+            sha256_data = sha256()
+            offset = 0
+        length = response.headers.get("content-length")
+        if progress is not None and length is not None:
+            progress.add(int(length) + offset, copied=offset)
+        copied = 0
+        with open(part, "ab" if offset else "wb") as data:
+            for chunk in iter(lambda: response.read(_CHUNK_SIZE), b""):
+                data.write(chunk)
+                sha256_data.update(chunk)
+                copied += len(chunk)
+                if progress is not None:
+                    progress.update(len(chunk))
+            if length is not None and copied != int(length):
+                # Keep the partial file to resume it on the next fetch.
+                raise FetcherError(
+                    "Incomplete download of %s: %d bytes received out of %s"
+                    % (url, copied, length)
+                )
+            data.flush()
+            os.fsync(data.fileno())
+    os.replace(part, fname)
+    return sha256_data.hexdigest()
+
+
+@deprecate_with_version("_get_file_data is deprecated, use fetch_data instead.")
 def _get_file_data(fname, url):
-    with contextlib.closing(urlopen(url)) as opener:
+    _download_file(url, fname, progress=_DownloadProgress())
+
+
+def _cache_path(cache_dir, sha):
+    return pjoin(cache_dir, "sha256", sha[:2], sha)
+
+
+def _link(src, dst):
+    """Hard link ``src`` to ``dst``, or copy it when links are not possible.
+
+    The cached ``src`` is read-only, so that editing the linked file in place
+    cannot corrupt the cache.
+    """
+    if os.path.lexists(dst):
         try:
-            response_size = opener.headers["content-length"]
-        except KeyError:
-            response_size = None
+            os.remove(dst)
+        except PermissionError:
+            # Windows does not remove read-only files, even other links.
+            os.chmod(dst, 0o644)
+            os.remove(dst)
+            os.chmod(src, 0o444)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _is_fetched(fname, sha, cache_dir):
+    if not os.path.exists(fname):
+        return False
+    if sha is None:
+        return True
+    blob = _cache_path(cache_dir, sha.lower())
+    if os.path.exists(blob) and os.path.samefile(fname, blob):
+        return True
+    return _get_file_sha(fname) == sha.lower()
 
-        with open(fname, "wb") as data:
-            if response_size is None:
-                copyfileobj(opener, data)
-            else:
-                copyfileobj_withprogress(opener, data, response_size)
+
+@warn_on_args_to_kwargs()
+def _fetch_file(url, fname, *, sha=None, cache_dir=None, progress=None):
+    """Fetch a file through the content-addressed cache.
+
+    Files with a known sha checksum are downloaded once in ``cache_dir``
+    and linked to ``fname``. Concurrent fetches of the same file, from
+    threads or processes, wait for the first one to complete.
+    """
+    if cache_dir is None:
+        cache_dir = fury_cache
+    if sha is None:
+        # Lock in the cache, not next to the file in the user's folder.
+        fname_key = sha256(os.path.abspath(fname).encode()).hexdigest()
+        lock = pjoin(cache_dir, "locks", fname_key)
+        os.makedirs(dirname(lock), exist_ok=True)
+        with _file_lock(lock):
+            # Another thread or process may have fetched it while we waited.
+            if not os.path.exists(fname):
+                _download_file(url, fname, progress=progress)
+        return
+
+    sha = sha.lower()
+    blob = _cache_path(cache_dir, sha)
+    os.makedirs(dirname(blob), exist_ok=True)
+    with _file_lock(blob):
+        if not os.path.exists(blob):
+            computed_sha256 = _download_file(url, blob, progress=progress)
+            if computed_sha256 != sha:
+                # Keep the file for inspection, out of the cache.
+                shutil.move(blob, fname)
+                raise _sha_error(fname, sha, computed_sha256)
+            os.chmod(blob, 0o444)
+    _link(blob, fname)
 
 
 @warn_on_args_to_kwargs()
-def fetch_data(files, folder, *, data_size=None):
+def fetch_data(files, folder, *, data_size=None, n_workers=4, cache_dir=None):
     """Download files to folder and checks their sha checksums.
 
+    The files are downloaded concurrently and hashed while they are written.
+    Interrupted downloads are resumed. Files with a sha checksum are stored
+    once in a content-addressed cache and linked to `folder`, so fetching
+    them again, in any folder, does not download anything.
+
     Parameters
     ----------
     files : dictionary
@@ -180,6 +402,14 @@ def fetch_data(files, folder, *, data_size=None):
     data_size : str, optional
         A string describing the size of the data (e.g. "91 MB") to be logged to
         the screen. Default does not produce any information about data size.
+    n_workers : int, optional
+        Maximum number of files downloaded at the same time.
+    cache_dir : str, optional
+        Directory of the content-addressed cache. Default is the directory
+        given by the FURY_CACHE environment variable, or FURY_HOME/cache.
+        A cache shared by several users must be a group-writable setgid
+        directory. Cached files are read-only, as are their links in
+        `folder`.
 
     Raises
     ------
@@ -196,20 +426,37 @@ def fetch_data(files, folder, *, data_size=None):
     if data_size is not None:
         print("Data size is approximately %s" % data_size)
 
-    all_skip = True
+    if cache_dir is None:
+        cache_dir = fury_cache
+
+    to_fetch = []
     for f in files:
         url, sha = files[f]
         fullpath = pjoin(folder, f)
-        if os.path.exists(fullpath) and (_get_file_sha(fullpath) == sha.lower()):
+        if _is_fetched(fullpath, sha, cache_dir):
             continue
-        all_skip = False
         print('Downloading "%s" to %s' % (f, folder))
-        _get_file_data(fullpath, url)
-        check_sha(fullpath, stored_sha256=sha)
-    if all_skip:
+        to_fetch.append((url, fullpath, sha))
+    if not to_fetch:
         _already_there_msg(folder)
-    else:
-        print("Files successfully downloaded to %s" % (folder))
+        return
+
+    progress = _DownloadProgress()
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(
+                _fetch_file,
+                url,
+                fullpath,
+                sha=sha,
+                cache_dir=cache_dir,
+                progress=progress,
+            )
+            for url, fullpath, sha in to_fetch
+        ]
+        for future in futures:
+            future.result()
+    print("Files successfully downloaded to %s" % (folder))
 
 
 @warn_on_args_to_kwargs()
@@ -320,32 +567,31 @@ async def _request(session, url):
 
 
 @warn_on_args_to_kwargs()
-async def _download(session, url, filename, *, size=None):
+async def _download(url, filename, *, cache_dir=None, progress=None):
     """Download file from url.
 
+    The download runs in a thread through the cache locks, so concurrent
+    fetches of the same file, from threads or processes, wait for the first
+    one to complete. HTTP errors are raised and the file only appears once
+    it is fully downloaded.
+
     Parameters
     ----------
-    session : ClientSession
-        Aiohttp client session
     url : string
         The URL of the downloadable file
     filename : string
         Name of the downloaded file (e.g. BoxTextured.gltf)
-    size : int, optional
-        Length of the content in bytes
+    cache_dir : str, optional
+        Directory of the cache holding the locks. Default is `fury_cache`.
+    progress : _DownloadProgress, optional
+        Progress shared between several downloads.
     """
     if not os.path.exists(filename):
         print(f"Downloading: {filename}")
-        async with session.get(url) as response:
-            size = response.content_length if not size else size
-            block = size
-            copied = 0
-            with open(filename, mode="wb") as f:
-                async for chunk in response.content.iter_chunked(block):
-                    f.write(chunk)
-                    copied += len(chunk)
-                    progress = float(copied) / float(size)
-                    update_progressbar(progress, size)
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(_fetch_file, url, filename, cache_dir=cache_dir, progress=progress),
+        )
 
 
 async def _fetch_gltf(name, mode):
@@ -394,15 +640,15 @@ async def _fetch_gltf(name, mode):
             os.makedirs(folder)
 
         d_urls = [file["download_url"] for file in urls]
-        sizes = [file["size"] for file in urls]
         f_names = [url.split("/")[-1] for url in d_urls]
         f_paths = [pjoin(folder, name) for name in f_names]
-        zip_url = zip(d_urls, f_paths, sizes)
-
-        async with aiohttp.ClientSession() as session:
-            await asyncio.gather(
-                *[_download(session, url, name, size=s) for url, name, s in zip_url]
-            )
+        progress = _DownloadProgress()
+        await asyncio.gather(
+            *[
+                _download(url, f_path, progress=progress)
+                for url, f_path in zip(d_urls, f_paths)
+            ]
+        )
 
         return f_names, folder
 
@@ -1,10 +1,24 @@
+import asyncio
+from hashlib import sha256
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import json
 import os
 from os.path import join as pjoin
+from tempfile import TemporaryDirectory as InTemporaryDirectory
+from threading import Thread
+from urllib.error import HTTPError
 
+import numpy as np
 import numpy.testing as npt
 
-from fury.data import fetch_gltf, list_gltf_sample_models, read_viz_gltf
+from fury.data import (
+    FetcherError,
+    fetch_data,
+    fetch_gltf,
+    list_gltf_sample_models,
+    read_viz_gltf,
+)
+from fury.data.fetcher import _download
 
 if "FURY_HOME" in os.environ:
     fury_home = os.environ["FURY_HOME"]
@@ -81,3 +95,154 @@ def test_read_viz_gltf():
     out_path = read_viz_gltf("Box").split(os.sep)
     mode = out_path[-2:][0]
     npt.assert_equal(mode, "glTF")
+
+
+class _RangeRequestHandler(SimpleHTTPRequestHandler):
+    """Serve files with support of the Range header and record the requests."""
+
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        byte_range = self.headers.get("Range")
+        self.requests.append((self.path, byte_range))
+        start = 0
+        if byte_range is not None:
+            start = int(byte_range.split("=")[1].split("-")[0])
+            if start >= len(data):
+                self.send_error(416)
+                return
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+
+def test_fetch_data():
+    rng = np.random.default_rng(42)
+    with InTemporaryDirectory() as tmpdir:
+        served = pjoin(tmpdir, "served")
+        os.makedirs(served)
+        contents = {}
+        for i in range(3):
+            contents[f"f{i}.bin"] = rng.bytes(3 * 1024 * 1024 + i)
+            with open(pjoin(served, f"f{i}.bin"), "wb") as f:
+                f.write(contents[f"f{i}.bin"])
+
+        handler = _RangeRequestHandler
+        handler.requests = []
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), lambda *args: handler(*args, directory=served)
+        )
+        Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        files = {
+            name: (url + name, sha256(data).hexdigest())
+            for name, data in contents.items()
+        }
+        cache_dir = pjoin(tmpdir, "cache")
+        try:
+            fetch_data(files, pjoin(tmpdir, "a"), n_workers=2, cache_dir=cache_dir)
+            for name, data in contents.items():
+                with open(pjoin(tmpdir, "a", name), "rb") as f:
+                    npt.assert_equal(f.read() == data, True)
+            npt.assert_equal(len(handler.requests), 3)
+            for name, (_, sha) in files.items():
+                blob = pjoin(cache_dir, "sha256", sha[:2], sha)
+                npt.assert_equal(os.stat(blob).st_mode & 0o222, 0)
+                npt.assert_equal(os.path.samefile(blob, pjoin(tmpdir, "a", name)), True)
+
+            # Other folders are filled from the cache.
+            fetch_data(files, pjoin(tmpdir, "b"), cache_dir=cache_dir)
+            npt.assert_equal(sorted(os.listdir(pjoin(tmpdir, "b"))), sorted(files))
+            npt.assert_equal(len(handler.requests), 3)
+
+            # Interrupted downloads are resumed.
+            sha = files["f1.bin"][1]
+            blob = pjoin(cache_dir, "sha256", sha[:2], sha)
+            os.remove(blob)
+            with open(blob + ".part", "wb") as f:
+                f.write(contents["f1.bin"][:1000])
+            os.remove(pjoin(tmpdir, "b", "f1.bin"))
+            fetch_data(files, pjoin(tmpdir, "b"), cache_dir=cache_dir)
+            npt.assert_equal(handler.requests[-1], ("/f1.bin", "bytes=1000-"))
+            with open(pjoin(tmpdir, "b", "f1.bin"), "rb") as f:
+                npt.assert_equal(f.read() == contents["f1.bin"], True)
+            npt.assert_equal(os.path.exists(blob + ".part"), False)
+
+            # Corrupted files are not cached.
+            sha = sha256(b"other content").hexdigest()
+            bad = {"bad.bin": (url + "f0.bin", sha)}
+            npt.assert_raises(
+                FetcherError, fetch_data, bad, pjoin(tmpdir, "c"), cache_dir=cache_dir
+            )
+            npt.assert_equal(os.path.exists(pjoin(tmpdir, "c", "bad.bin")), True)
+            npt.assert_equal(
+                os.path.exists(pjoin(cache_dir, "sha256", sha[:2], sha)), False
+            )
+
+            # Files without checksum are locked in the cache, not in the folder.
+            fetch_data(
+                {"d.bin": (url + "f2.bin", None)},
+                pjoin(tmpdir, "d"),
+                cache_dir=cache_dir,
+            )
+            npt.assert_equal(os.listdir(pjoin(tmpdir, "d")), ["d.bin"])
+            npt.assert_equal(len(os.listdir(pjoin(cache_dir, "locks"))), 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def test_download_concurrent():
+    with InTemporaryDirectory() as tmpdir:
+        served = pjoin(tmpdir, "served")
+        os.makedirs(served)
+        data = np.random.default_rng(0).bytes(2 * 1024 * 1024)
+        with open(pjoin(served, "model.bin"), "wb") as f:
+            f.write(data)
+
+        handler = _RangeRequestHandler
+        handler.requests = []
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), lambda *args: handler(*args, directory=served)
+        )
+        Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        cache_dir = pjoin(tmpdir, "cache")
+        fname = pjoin(tmpdir, "model.bin")
+
+        async def fetch_twice(url, fname):
+            await asyncio.gather(
+                _download(url, fname, cache_dir=cache_dir),
+                _download(url, fname, cache_dir=cache_dir),
+            )
+
+        try:
+            # The second fetch waits for the first one and downloads nothing.
+            asyncio.run(fetch_twice(url + "model.bin", fname))
+            npt.assert_equal(len(handler.requests), 1)
+            with open(fname, "rb") as f:
+                npt.assert_equal(f.read() == data, True)
+            npt.assert_equal(os.path.exists(fname + ".part"), False)
+
+            # Error responses are raised, not saved as the file.
+            missing = pjoin(tmpdir, "missing.bin")
+            npt.assert_raises(
+                HTTPError, asyncio.run, fetch_twice(url + "missing.bin", missing)
+            )
+            npt.assert_equal(os.path.exists(missing), False)
+            npt.assert_equal(os.path.exists(missing + ".part"), False)
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -65,6 +65,10 @@ def warn_on_args_to_kwargs(
     keyword-only arguments. It also checks that all keyword arguments are
     expected by the function.
 
+    The signature of the decorated function is inspected only once, when the
+    decorator is applied, so calls using keyword arguments correctly have
+    almost no overhead.
+
     Parameters
     ----------
     from_version: str, optional
@@ -116,51 +120,54 @@ def warn_on_args_to_kwargs(
             Decorated function.
         """
 
+        # The signature is inspected once, at decoration time. The wrapper
+        # only calls ``func`` and looks at this metadata when the call fails.
+        params = signature(func).parameters
+        KEYWORD_ONLY_ARGS = [
+            arg.name for arg in params.values() if arg.kind == arg.KEYWORD_ONLY
+        ]
+        POSITIONAL_ARGS = [
+            arg.name
+            for arg in params.values()
+            if arg.kind in (arg.POSITIONAL_OR_KEYWORD, arg.POSITIONAL_ONLY)
+        ]
+        # Keyword-only arguments without and with default values
+        KEYWORD_ONLY_REQUIRED = [
+            arg for arg in KEYWORD_ONLY_ARGS if params[arg].default is params[arg].empty
+        ]
+        KEYWORD_ONLY_DEFAULT = [
+            arg
+            for arg in KEYWORD_ONLY_ARGS
+            if params[arg].default is not params[arg].empty
+        ]
+        positional_args_len = len(POSITIONAL_ARGS)
+        params_len = len(params)
+
+        # Create a sample of the function parameters
+        func_params_sample = []
+        for arg in params.values():
+            if arg.kind in (arg.POSITIONAL_OR_KEYWORD, arg.POSITIONAL_ONLY):
+                func_params_sample.append(f"{arg.name}_value")
+            elif arg.kind == arg.KEYWORD_ONLY:
+                func_params_sample.append(f"{arg.name}='value'")
+        func_params_sample = ", ".join(func_params_sample)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            sig = signature(func)
-            params = sig.parameters
-            #
-            KEYWORD_ONLY_ARGS = [
-                arg.name for arg in params.values() if arg.kind == arg.KEYWORD_ONLY
-            ]
-            POSITIONAL_ARGS = [
-                arg.name
-                for arg in params.values()
-                if arg.kind in (arg.POSITIONAL_OR_KEYWORD, arg.POSITIONAL_ONLY)
-            ]
-
-            # Keyword-only arguments that do not have default values and not in kwargs
-            missing_kwargs = [
-                arg
-                for arg in KEYWORD_ONLY_ARGS
-                if arg not in kwargs and params[arg].default == params[arg].empty
-            ]
-
-            # Keyword-only arguments that have default values
-            ARG_DEFAULT = [
-                arg
-                for arg in KEYWORD_ONLY_ARGS
-                if arg not in kwargs and params[arg].default != params[arg].empty
-            ]
-            func_params_sample = []
-
-            # Create a sample of the function parameters
-            for arg in params.values():
-                if arg.kind in (arg.POSITIONAL_OR_KEYWORD, arg.POSITIONAL_ONLY):
-                    func_params_sample.append(f"{arg.name}_value")
-                elif arg.kind == arg.KEYWORD_ONLY:
-                    func_params_sample.append(f"{arg.name}='value'")
-            func_params_sample = ", ".join(func_params_sample)
-            args_kwargs_len = len(args) + len(kwargs)
-            params_len = len(params)
             try:
                 return func(*args, **kwargs)
             except TypeError as e:
                 FURY_CURRENT_VERSION = fury.__version__
 
-                if ARG_DEFAULT:
-                    missing_kwargs += ARG_DEFAULT
+                # Keyword-only arguments not in kwargs, the ones without
+                # default values first.
+                missing_kwargs = [
+                    arg for arg in KEYWORD_ONLY_REQUIRED if arg not in kwargs
+                ]
+                missing_kwargs += [
+                    arg for arg in KEYWORD_ONLY_DEFAULT if arg not in kwargs
+                ]
+                args_kwargs_len = len(args) + len(kwargs)
                 if missing_kwargs and params_len >= args_kwargs_len:
                     # if the version of fury is greater than until_version,
                     # an error should be displayed,
@@ -169,7 +176,6 @@ def warn_on_args_to_kwargs(
                     ):
                         raise TypeError(e) from e
 
-                    positional_args_len = len(POSITIONAL_ARGS)
                     args_k = list(args[positional_args_len:])
                     args = list(args[:positional_args_len])
                     kwargs.update(dict(zip(missing_kwargs, args_k)))
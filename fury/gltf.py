@@ -1,13 +1,16 @@
 # TODO: Materials, Lights
 import base64
 import copy
+import hashlib
+import io as _io
 import os
+import struct
 from typing import Dict  # noqa
+from urllib.parse import unquote
 
 from PIL import Image
 import numpy as np
 import pygltflib as gltflib
-from pygltflib.utils import glb2gltf, gltf2glb
 
 from fury import actor, io, transform, utils
 from fury.animation import Animation
@@ -25,7 +28,7 @@ comp_type = {
     5121: {"size": 1, "dtype": np.ubyte},
     5122: {"size": 2, "dtype": np.short},
     5123: {"size": 2, "dtype": np.ushort},
-    5125: {"size": 4, "dtype": np.uint},
+    5125: {"size": 4, "dtype": np.uint32},
     5126: {"size": 4, "dtype": np.float32},
 }
 
@@ -48,18 +51,17 @@ class glTF:
         if filename in ["", None]:
             raise IOError("Filename cannot be empty or None!")
 
-        name, extension = os.path.splitext(filename)
-
-        if extension == ".glb":
-            fname_gltf = f"{name}.gltf"
-            if not os.path.exists(fname_gltf):
-                glb2gltf(filename)
-                filename = fname_gltf
-
-        self.gltf = gltflib.GLTF2().load(filename)
-
         self.pwd = os.path.dirname(filename)
         self.apply_normals = apply_normals
+        # Buffers are loaded once and shared by all the accessors.
+        self._buffers = {}
+        self._glb_filename = None
+        self._glb_bin_chunk = None
+
+        if os.path.splitext(filename)[1] == ".glb":
+            self.gltf = self._load_glb(filename)
+        else:
+            self.gltf = gltflib.GLTF2().load(filename)
 
         self.cameras = {}
         self.materials = []
@@ -287,6 +289,66 @@ class glTF:
                     prim_morphdata.append(self.get_morph_data(target, mesh_id))
                 self.morph_vertices.append(prim_morphdata)
 
+    def _load_glb(self, filename):
+        """Read the JSON chunk of a binary glTF and locate its binary chunk.
+
+        The binary chunk is not read here, it is memory-mapped by
+        :meth:`get_buffer` when an accessor needs it.
+        """
+        with open(filename, "rb") as f:
+            magic, _, _ = struct.unpack("<4sII", f.read(12))
+            if magic != b"glTF":
+                raise IOError(f"{filename} is not a binary glTF file.")
+            json_length, _ = struct.unpack("<II", f.read(8))
+            gltf = gltflib.GLTF2.gltf_from_json(f.read(json_length).decode("utf-8"))
+            chunk_header = f.read(8)
+            if len(chunk_header) == 8:
+                bin_length, _ = struct.unpack("<II", chunk_header)
+                self._glb_bin_chunk = (20 + json_length + 8, bin_length)
+        self._glb_filename = filename
+        return gltf
+
+    def get_buffer(self, buff_id):
+        """Get the bytes of a buffer, loading it on first use.
+
+        External ``.bin`` files and the binary chunk of ``.glb`` files are
+        memory-mapped, data URIs are decoded once.
+
+        Parameters
+        ----------
+        buff_id : int
+            Buffer index
+
+        Returns
+        -------
+        buffer : ndarray
+            Read-only uint8 array of the buffer bytes.
+
+        """
+        if buff_id in self._buffers:
+            return self._buffers[buff_id]
+
+        uri = self.gltf.buffers[buff_id].uri
+        if uri is None:
+            if self._glb_bin_chunk is None:
+                raise IOError(f"Buffer {buff_id} has no data.")
+            offset, length = self._glb_bin_chunk
+            buffer = np.memmap(
+                self._glb_filename,
+                dtype=np.uint8,
+                mode="r",
+                offset=offset,
+                shape=(length,),
+            )
+        elif uri.startswith("data:"):
+            buffer = np.frombuffer(base64.b64decode(uri.split(",")[1]), np.uint8)
+        else:
+            buffer = np.memmap(
+                os.path.join(self.pwd, unquote(uri)), dtype=np.uint8, mode="r"
+            )
+        self._buffers[buff_id] = buffer
+        return buffer
+
     def get_acc_data(self, acc_id):
         """Get the correct data from buffer using accessors and bufferviews.
 
@@ -298,32 +360,29 @@ class glTF:
         Returns
         -------
         buffer_array : ndarray
-            Numpy array extracted from the buffer.
+            Read-only view of the buffer, without copy.
 
         """
         accessor = self.gltf.accessors[acc_id]
 
         buffview_id = accessor.bufferView
-        acc_byte_offset = accessor.byteOffset
+        acc_byte_offset = accessor.byteOffset or 0
         count = accessor.count
-        d_type = comp_type.get(accessor.componentType)
-        d_size = d_type["size"]
+        d_type = np.dtype(comp_type.get(accessor.componentType)["dtype"])
         a_type = acc_type.get(accessor.type)
 
         buffview = self.gltf.bufferViews[buffview_id]
 
-        buff_id = buffview.buffer
-        byte_offset = buffview.byteOffset
-        byte_stride = buffview.byteStride
-        byte_stride = byte_stride if byte_stride else (a_type * d_size)
-        byte_length = count * byte_stride
-
-        total_byte_offset = byte_offset + acc_byte_offset
+        byte_offset = (buffview.byteOffset or 0) + acc_byte_offset
+        byte_stride = buffview.byteStride or a_type * d_type.itemsize
 
-        buff_array = self.get_buff_array(
-            buff_id, d_type["dtype"], byte_length, total_byte_offset, byte_stride
+        return np.ndarray(
+            (count, a_type),
+            dtype=d_type,
+            buffer=self.get_buffer(buffview.buffer),
+            offset=byte_offset,
+            strides=(byte_stride, d_type.itemsize),
         )
-        return buff_array[:, :a_type]
 
     def get_buff_array(self, buff_id, d_type, byte_length, byte_offset, byte_stride):
         """Extract the mesh data from buffer.
@@ -344,40 +403,24 @@ class glTF:
         Returns
         -------
         out_arr : ndarray
-            Numpy array of size byte_length from buffer.
+            Read-only view of byte_length bytes of the buffer, one row per
+            stride.
 
         """
-        buffer = self.gltf.buffers[buff_id]
-        uri = buffer.uri
-
-        if d_type == np.short or d_type == np.ushort or d_type == np.uint16:
-            byte_length = int(byte_length / 2)
-            byte_stride = int(byte_stride / 2)
-
-        elif d_type == np.float32:
-            byte_length = int(byte_length / 4)
-            byte_stride = int(byte_stride / 4)
-
         try:
-            if uri.startswith("data:application/octet-stream;base64") or uri.startswith(
-                "data:application/gltf-buffer;base64"
-            ):
-                buff_data = uri.split(",")[1]
-                buff_data = base64.b64decode(buff_data)
-
-            elif uri.endswith(".bin"):
-                with open(os.path.join(self.pwd, uri), "rb") as f:
-                    buff_data = f.read(-1)
-
-            out_arr = np.frombuffer(
-                buff_data, dtype=d_type, count=byte_length, offset=byte_offset
-            )
-
-            out_arr = out_arr.reshape(-1, byte_stride)
-            return out_arr
-
+            buffer = self.get_buffer(buff_id)
         except IOError:
             print("Failed to read ! Error in opening file:")
+            return None
+
+        itemsize = np.dtype(d_type).itemsize
+        return np.ndarray(
+            (byte_length // byte_stride, byte_stride // itemsize),
+            dtype=d_type,
+            buffer=buffer,
+            offset=byte_offset,
+            strides=(byte_stride, itemsize),
+        )
 
     def get_materials(self, mat_id):
         """Get the material data.
@@ -437,13 +480,8 @@ class glTF:
 
         elif bv_index is not None:
             bv = self.gltf.bufferViews[bv_index]
-            buffer = bv.buffer
-            bo = bv.byteOffset
-            bl = bv.byteLength
-            uri = self.gltf.buffers[buffer].uri
-            with open(os.path.join(self.pwd, uri), "rb") as f:
-                f.seek(bo)
-                img_binary = f.read(bl)
+            bo = bv.byteOffset or 0
+            img_binary = self.get_buffer(bv.buffer)[bo : bo + bv.byteLength]
             extension = ".png" if mimetype == "images/png" else ".jpg"
             image_path = os.path.join(self.pwd, str("bvtexture" + extension))
             with open(image_path, "wb") as image_file:
@@ -745,14 +783,17 @@ class glTF:
                 joint_matrices,
                 parent_bone_deform=parent_transform,
             )
+        bone_matrices = self.get_bone_matrices(joint_matrices)
         for i, vertex in enumerate(self._vertices):
-            vertex[:] = self.apply_skin_matrix(
+            # The actor transformation is folded into the joint matrices so the
+            # skinned vertices are written once, straight into the vtk buffer.
+            self.skin_vertices(
                 self._vcopy[i],
-                joint_matrices,
+                bone_matrices,
                 actor_index=i,
+                transform_mat=self.transformations[i],
+                out=vertex,
             )
-            actor_transf = self.transformations[i]
-            vertex[:] = transform.apply_transformation(vertex, actor_transf)
             utils.update_actor(self._actors[i])
             utils.compute_bounds(self._actors[i])
 
@@ -786,8 +827,9 @@ class glTF:
         ----------
         vertices : ndarray
             Vertices of an actor.
-        join_matrices : list
-            List  of skinning matrix to calculate the weighted transformation.
+        join_matrices : dict
+            Skinning matrix of each bone, used to calculate the weighted
+            transformation.
 
         Returns
         -------
@@ -795,26 +837,74 @@ class glTF:
             Modified vertices.
 
         """
-        clone = np.copy(vertices)
+        bone_matrices = self.get_bone_matrices(joint_matrices)
+        return self.skin_vertices(vertices, bone_matrices, actor_index=actor_index)
+
+    def get_bone_matrices(self, joint_matrices):
+        """Stack the skinning matrices of all the bones in one array.
+
+        Parameters
+        ----------
+        joint_matrices : dict
+            Skinning matrix of each bone, indexed by bone id.
+
+        Returns
+        -------
+        bone_matrices : ndarray (n_bones, 4, 4)
+            Skinning matrices ordered as ``self.bones``. Bones without a
+            skinning matrix get the identity.
+
+        """
+        identity = np.identity(4)
+        return np.stack([joint_matrices.get(bone, identity) for bone in self.bones])
+
+    @warn_on_args_to_kwargs()
+    def skin_vertices(
+        self, vertices, bone_matrices, *, actor_index=0, transform_mat=None, out=None
+    ):
+        """Apply linear blend skinning to all the vertices of an actor at once.
+
+        Parameters
+        ----------
+        vertices : ndarray (n, 3)
+            Vertices of the actor in bind pose.
+        bone_matrices : ndarray (n_bones, 4, 4)
+            Skinning matrices, see :meth:`get_bone_matrices`.
+        actor_index : int, optional
+            Index of the actor, selects its joints and weights.
+        transform_mat : ndarray (4, 4), optional
+            Transformation matrix applied to the skinned vertices.
+        out : ndarray (n, 3), optional
+            Array where the skinned vertices are written, e.g. the vertex
+            buffer of the actor.
+
+        Returns
+        -------
+        vertices : ndarray (n, 3)
+            Skinned vertices.
+
+        """
         weights = self.weights_0[actor_index]
         joints = self.joints_0[actor_index]
 
-        for i, xyz in enumerate(clone):
-            a_joint = joints[i]
-            a_joint = [self.bones[i] for i in a_joint]
-            a_weight = weights[i]
-
-            skin_mat = (
-                np.multiply(a_weight[0], joint_matrices[a_joint[0]])
-                + np.multiply(a_weight[1], joint_matrices[a_joint[1]])
-                + np.multiply(a_weight[2], joint_matrices[a_joint[2]])
-                + np.multiply(a_weight[3], joint_matrices[a_joint[3]])
-            )
+        # Vertices are points (w = 1), only the affine part is needed.
+        matrices = bone_matrices[:, :3, :]
+        if transform_mat is not None:
+            matrices = np.matmul(transform_mat[:3, :3], matrices)
 
-            xyz = np.dot(skin_mat, np.append(xyz, [1.0]))
-            clone[i] = xyz[:3]
+        skin_mat = weights[:, 0, None, None] * matrices[joints[:, 0]]
+        for i in range(1, joints.shape[1]):
+            skin_mat += weights[:, i, None, None] * matrices[joints[:, i]]
 
-        return clone
+        if out is None:
+            out = np.empty_like(vertices)
+        np.einsum(
+            "nij,nj->ni", skin_mat[:, :, :3], vertices, out=out, casting="same_kind"
+        )
+        out += skin_mat[:, :, 3]
+        if transform_mat is not None:
+            out += transform_mat[:3, 3]
+        return out
 
     def transverse_bones(self, bone_id, channel_name, parent_animation: Animation):
         """Loop over the bones and add child bone animation to their parent
@@ -1068,15 +1158,22 @@ class glTF:
 
 
 @warn_on_args_to_kwargs()
-def export_scene(scene, *, filename="default.gltf"):
+def export_scene(scene, *, filename="default.gltf", deduplicate=True):
     """Generate gltf from FURY scene.
 
+    `.glb` files are built in memory: the arrays of all the actors are packed
+    in the single binary chunk of the file, each actor is a node referencing
+    its mesh with the actor transform, and no other file is written.
+
     Parameters
     ----------
     scene: Scene
         FURY scene object.
     filename: str, optional
         Name of the model to be saved
+    deduplicate: bool, optional
+        Only used for `.glb` files. If True, actors with identical geometry,
+        colors and texture share a single mesh.
 
     """
     gltf_obj = gltflib.GLTF2()
@@ -1085,6 +1182,10 @@ def export_scene(scene, *, filename="default.gltf"):
     if extension not in [".gltf", ".glb"]:
         raise IOError("Filename should be .gltf or .glb")
 
+    if extension == ".glb":
+        _export_glb(scene, filename, deduplicate=deduplicate)
+        return
+
     buffer_file = open(f"{name}.bin", "wb")
     primitives = []
     buffer_size = 0
@@ -1110,8 +1211,203 @@ def export_scene(scene, *, filename="default.gltf"):
     write_scene(gltf_obj, [0])
 
     gltf_obj.save(f"{name}.gltf")
-    if extension == ".glb":
-        gltf2glb(f"{name}.gltf", destination=filename)
+
+
+class _BinaryChunk:
+    """Pack arrays in one buffer with a bufferView per kind of data.
+
+    All the indices, and all the vertex attributes, share a bufferView and
+    the accessors index into it with their byte offset. Images need a
+    bufferView each.
+    """
+
+    def __init__(self):
+        self._views = {}
+        self._sizes = {}
+
+    def add(self, view, data):
+        """Append bytes to a view and return their offset in this view."""
+        if view not in self._views:
+            self._views[view] = []
+            self._sizes[view] = 0
+        offset = self._sizes[view]
+        self._views[view].append(data)
+        self._sizes[view] += len(data)
+        return offset
+
+    def write(self, gltf):
+        """Create the bufferViews and return the bytes of the buffer."""
+        chunks = []
+        size = 0
+        view_ids = {}
+        for view, data in self._views.items():
+            # Accessors require 4 bytes aligned offsets.
+            chunks.append(b"\0" * (-size % 4))
+            size += len(chunks[-1])
+            view_ids[view] = len(gltf.bufferViews)
+            write_bufferview(gltf, 0, size, self._sizes[view])
+            chunks.extend(data)
+            size += self._sizes[view]
+        chunks.append(b"\0" * (-size % 4))
+        return b"".join(chunks), view_ids
+
+
+def _mesh_arrays(act):
+    """Return the arrays exported for an actor, or None if it has no mesh."""
+    mapper = act.GetMapper()
+    if mapper is None:
+        return None
+    if mapper.GetNumberOfInputConnections(0):
+        mapper.GetInputAlgorithm().Update()
+    polydata = mapper.GetInput()
+    if polydata is None or not polydata.GetNumberOfPoints():
+        return None
+
+    if polydata.GetNumberOfVerts():
+        mode = 0
+    elif polydata.GetNumberOfLines():
+        mode = 3
+    else:
+        mode = 4
+
+    arrays = {"vertices": utils.get_polydata_vertices(polydata).astype(np.float32)}
+    if polydata.GetNumberOfPolys():
+        try:
+            triangles = utils.get_polydata_triangles(polydata)
+            arrays["indices"] = triangles.ravel().astype(np.uint32)
+        except AssertionError as error:
+            print(error)
+    normals = utils.get_polydata_normals(polydata)
+    if normals is not None:
+        arrays["normals"] = normals.astype(np.float32)
+
+    colors = utils.colors_from_actor(act)
+    if colors is None:
+        colors = utils.get_polydata_colors(polydata)
+    if colors is not None:
+        rgba = np.ones((len(colors), 4), dtype=np.float32)
+        rgba[:, : min(colors.shape[1], 4)] = colors[:, :4] / 255
+        arrays["colors"] = rgba
+
+    texture = None
+    tcoords = utils.get_polydata_tcoord(polydata)
+    if tcoords is not None and act.GetTexture() is not None:
+        arrays["tcoords"] = tcoords.astype(np.float32)
+        texture = act.GetTexture()
+    return mode, arrays, texture
+
+
+def _texture_png(texture):
+    vtk_image = texture.GetInput()
+    rows, cols, _ = vtk_image.GetDimensions()
+    scalars = vtk_image.GetPointData().GetScalars()
+    np_im = numpy_support.vtk_to_numpy(scalars).reshape((rows, cols, -1))
+    png = _io.BytesIO()
+    Image.fromarray(np_im).save(png, format="png")
+    return png.getvalue()
+
+
+def _export_glb(scene, filename, *, deduplicate=True):
+    """Write a scene in a single .glb file with shared meshes."""
+    gltf = gltflib.GLTF2()
+    chunk = _BinaryChunk()
+    # accessors are created once the bufferViews are known
+    accessors = []
+    meshes = {}
+    textures = {}
+    nodes = []
+
+    def add_accessor(view, array, acc_type, comp_type, *, bounds=False):
+        offset = chunk.add(view, np.ascontiguousarray(array).tobytes())
+        bound = {}
+        if bounds:
+            bound = {"max": array.max(0).tolist(), "min": array.min(0).tolist()}
+        accessors.append((view, offset, comp_type, len(array), acc_type, bound))
+        return len(accessors) - 1
+
+    for act in scene.GetActors():
+        mesh_data = _mesh_arrays(act)
+        if mesh_data is None:
+            continue
+        mode, arrays, texture = mesh_data
+
+        key = len(meshes)
+        if deduplicate:
+            digest = hashlib.blake2b(digest_size=16)
+            for name in sorted(arrays):
+                digest.update(f"{name}{arrays[name].shape}".encode())
+                digest.update(np.ascontiguousarray(arrays[name]).data)
+            key = (mode, id(texture), digest.digest())
+
+        if key not in meshes:
+            material = None
+            if texture is not None:
+                if id(texture) not in textures:
+                    textures[id(texture)] = len(textures)
+                    chunk.add(("image", len(textures) - 1), _texture_png(texture))
+                material = textures[id(texture)]
+
+            index = None
+            if "indices" in arrays:
+                index = add_accessor(
+                    "indices",
+                    arrays["indices"],
+                    gltflib.SCALAR,
+                    gltflib.UNSIGNED_INT,
+                )
+            attributes = {}
+            for name, acc_type in (
+                ("vertices", gltflib.VEC3),
+                ("normals", gltflib.VEC3),
+                ("tcoords", gltflib.VEC2),
+                ("colors", gltflib.VEC4),
+            ):
+                if name in arrays:
+                    attributes[name] = add_accessor(
+                        "attributes",
+                        arrays[name],
+                        acc_type,
+                        gltflib.FLOAT,
+                        bounds=name == "vertices",
+                    )
+            prim = get_prim(
+                attributes["vertices"],
+                index,
+                attributes.get("colors"),
+                attributes.get("tcoords"),
+                attributes.get("normals"),
+                material,
+                mode=mode,
+            )
+            meshes[key] = len(gltf.meshes)
+            write_mesh(gltf, [prim])
+
+        matrix = utils.vtk_matrix_to_numpy(act.GetMatrix())
+        nodes.append(len(gltf.nodes))
+        write_node(
+            gltf,
+            mesh_id=meshes[key],
+            matrix=None if np.array_equal(matrix, np.eye(4)) else matrix,
+        )
+
+    blob, view_ids = chunk.write(gltf)
+    for view, offset, comp, count, acc_type, bound in accessors:
+        write_accessor(gltf, view_ids[view], offset, comp, count, acc_type, **bound)
+    for texture_id in textures.values():
+        write_material(gltf, texture_id, None)
+        gltf.images[-1].bufferView = view_ids[("image", texture_id)]
+        gltf.images[-1].mimeType = "image/png"
+
+    camera = scene.camera()
+    if camera:
+        write_camera(gltf, camera)
+        nodes.append(len(gltf.nodes))
+        write_node(gltf, camera_id=0)
+    write_scene(gltf, nodes)
+
+    write_buffer(gltf, len(blob), None)
+    gltf.set_binary_blob(blob)
+    gltf.save_binary(filename)
 
 
 def _connect_primitives(gltf, actor, buff_file, byteoffset, count, name):
@@ -1301,7 +1597,7 @@ def write_scene(gltf, nodes):
 
 
 @warn_on_args_to_kwargs()
-def write_node(gltf, *, mesh_id=None, camera_id=None):
+def write_node(gltf, *, mesh_id=None, camera_id=None, matrix=None):
     """Create node
 
     Parameters
@@ -1312,6 +1608,8 @@ def write_node(gltf, *, mesh_id=None, camera_id=None):
         Mesh index
     camera_id: int, optional
         Camera index.
+    matrix: ndarray (4, 4), optional
+        Transformation matrix of the node.
 
     """
     node = gltflib.Node()
@@ -1319,6 +1617,9 @@ def write_node(gltf, *, mesh_id=None, camera_id=None):
         node.mesh = mesh_id
     if camera_id is not None:
         node.camera = camera_id
+    if matrix is not None:
+        # glTF matrices are stored in column-major order
+        node.matrix = np.asarray(matrix, dtype=float).T.ravel().tolist()
     gltf.nodes.append(node)
 
 
@@ -1,9 +1,12 @@
 import os
+import queue
 from tempfile import TemporaryDirectory as InTemporaryDirectory
+import threading
+from time import perf_counter
 from urllib.request import urlretrieve
 import warnings
 
-from PIL import Image
+from PIL import GifImagePlugin, Image
 import numpy as np
 
 from fury.decorators import warn_on_args_to_kwargs
@@ -335,6 +338,245 @@ def save_image(
         writer.Write()
 
 
+class FrameWriter:
+    """Encode and write rendered frames in background threads.
+
+    The render loop hands each frame to :meth:`submit`, which returns as soon
+    as the frame is queued. A pool of worker threads encodes the frames and
+    writes them to disk. At most ``max_queue_size`` frames are held at any
+    time (queued, being encoded or waiting for their turn to be written),
+    ``submit`` blocks when this limit is reached, so the memory used by a
+    recording does not grow with its length. GIF frames are reduced to a
+    palette of 256 colors and encoded in the worker threads, then appended
+    to the open file.
+
+    Parameters
+    ----------
+    fname : str
+        Output file. A '.gif' or '.mp4' extension writes an animation. Any
+        other extension supported by :func:`save_image` writes images.
+    fps : int, optional
+        Frames per second of the animation.
+    numbered : bool, optional
+        Write one image per frame, named after ``fname`` with the frame index
+        on 6 digits added before the extension, e.g. ``'frame.png'`` gives
+        ``'frame000000.png'``, ``'frame000001.png'``... Otherwise every frame
+        overwrites ``fname``. Ignored for animations.
+    max_queue_size : int, optional
+        Maximum number of frames held by the writer.
+    n_workers : int, optional
+        Number of encoding threads. Default is ``min(4, os.cpu_count())``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from fury.io import FrameWriter
+    >>> frames = np.random.randint(0, 255, (10, 30, 40, 3), dtype=np.uint8)
+    >>> with FrameWriter("frame.png", numbered=True) as writer:  # doctest: +SKIP
+    ...     for frame in frames:
+    ...         writer.submit(frame)
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(
+        self, fname, *, fps=30, numbered=False, max_queue_size=8, n_workers=None
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size should be at least 1")
+        self.fname = fname
+        self.fps = fps
+        self.extension = os.path.splitext(fname)[1].lower()
+        self.numbered = numbered and self.extension not in (".gif", ".mp4")
+        self._video = None
+        self._gif_file = None
+        if self.extension == ".mp4":
+            try:
+                import cv2
+            except ImportError as err:
+                raise ImportError(
+                    "OpenCV must be installed in order to save as MP4 video."
+                ) from err
+            self._cv2 = cv2
+
+        if n_workers is None:
+            n_workers = min(4, os.cpu_count() or 1)
+        self._queue = queue.SimpleQueue()
+        self._slots = threading.Semaphore(max_queue_size)
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._next_index = 0
+        self._error = None
+        self._closed = False
+
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.frames_encoded = 0
+        self.encode_time = 0.0
+        self.write_time = 0.0
+        self.max_encode_latency = 0.0
+        self._start_time = None
+        self._last_write_time = None
+
+        self._workers = [
+            threading.Thread(target=self._work, daemon=True) for _ in range(n_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def queue_depth(self):
+        """Return the number of submitted frames not written yet."""
+        return self.frames_submitted - self.frames_written
+
+    @property
+    def encode_latency(self):
+        """Return the mean time in seconds spent encoding a frame.
+
+        Time spent waiting for the previous frames and writing the frame is
+        not included, see ``write_time``.
+        """
+        return self.encode_time / max(self.frames_encoded, 1)
+
+    @property
+    def write_fps(self):
+        """Return the number of frames written per second."""
+        if self._last_write_time is None:
+            return 0.0
+        elapsed = self._last_write_time - self._start_time
+        return self.frames_written / elapsed if elapsed > 0 else 0.0
+
+    def submit(self, frame):
+        """Queue a frame, blocking while the writer is full.
+
+        Parameters
+        ----------
+        frame : ndarray
+            Image of shape (H, W, 3) or (H, W, 4) with the first row at the
+            top. It is copied, the caller can reuse its buffer.
+
+        """
+        if self._closed:
+            raise ValueError("Cannot submit frames to a closed FrameWriter")
+        self._raise_error()
+        self._slots.acquire()
+        if self._start_time is None:
+            self._start_time = perf_counter()
+        self._queue.put((self.frames_submitted, np.array(frame)))
+        self.frames_submitted += 1
+
+    def close(self):
+        """Write the remaining frames and finalize the output file."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        if self._gif_file is not None:
+            self._gif_file.write(b";")  # GIF trailer
+            self._gif_file.close()
+        if self._video is not None:
+            self._video.release()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError("Failed to write a frame") from self._error
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            index, frame = item
+            start = perf_counter()
+            try:
+                payload = self._encode(index, frame)
+            except Exception as err:
+                self._error = self._error or err
+                payload = None
+            del frame
+            latency = perf_counter() - start
+            with self._lock:
+                self.frames_encoded += 1
+                self.encode_time += latency
+                self.max_encode_latency = max(self.max_encode_latency, latency)
+                self._pending[index] = payload
+                # Formats writing a single file need the frames in order.
+                while self._next_index in self._pending:
+                    payload = self._pending.pop(self._next_index)
+                    start = perf_counter()
+                    try:
+                        self._write(self._next_index, payload)
+                    except Exception as err:
+                        self._error = self._error or err
+                    self._next_index += 1
+                    now = perf_counter()
+                    self.write_time += now - start
+                    self._last_write_time = now
+                    self.frames_written += 1
+                    self._slots.release()
+
+    def _frame_name(self, index):
+        # Unlike os.path.splitext, '.png' is an extension without name here.
+        head, tail = os.path.split(self.fname)
+        name, dot, extension = tail.rpartition(".")
+        if not dot:
+            name, extension = extension, ""
+        return os.path.join(head, f"{name}{index:06d}{dot}{extension}")
+
+    def _encode(self, index, frame):
+        if self.extension == ".gif":
+            image = Image.fromarray(np.ascontiguousarray(frame[..., :3]))
+            image = image.convert("P", palette=Image.ADAPTIVE)
+            chunks = []
+            if index == 0:
+                # The first frame gives the size and the global palette.
+                header, _ = GifImagePlugin.getheader(image, info={"loop": 0})
+                chunks.extend(header)
+            # Every frame has its own palette.
+            data = GifImagePlugin.getdata(
+                image, duration=1000 / self.fps, include_color_table=True
+            )
+            chunks.extend(data)
+            # The list belongs to a class freed by the garbage collector only,
+            # empty it to release the frame now.
+            data.clear()
+            return b"".join(chunks)
+        if self.extension == ".mp4":
+            return self._cv2.cvtColor(frame[..., :3], self._cv2.COLOR_RGB2BGR)
+        if self.numbered:
+            save_image(frame, self._frame_name(index))
+            return None
+        return frame
+
+    def _write(self, index, payload):
+        if payload is None:
+            return
+        if self.extension == ".gif":
+            if self._gif_file is None:
+                self._gif_file = open(self.fname, "wb")
+            self._gif_file.write(payload)
+        elif self.extension == ".mp4":
+            if self._video is None:
+                height, width = payload.shape[:2]
+                fourcc = self._cv2.VideoWriter.fourcc(*"mp4v")
+                self._video = self._cv2.VideoWriter(
+                    self.fname, fourcc, self.fps, (width, height)
+                )
+            self._video.write(payload)
+        else:
+            save_image(payload, self.fname)
+
+
 def load_polydata(file_name):
     """Load a vtk polydata to a supported format file.
 
@@ -1,328 +1,368 @@
-from vtkmodules.util import colors, numpy_support  # type: ignore # noqa: F401
-from vtkmodules.util.misc import calldata_type  # type: ignore # noqa: F401
-import vtkmodules.vtkCommonCore as ccvtk  # type: ignore
-import vtkmodules.vtkCommonDataModel as cdmvtk  # type: ignore
-import vtkmodules.vtkCommonExecutionModel as cemvtk  # type: ignore
-import vtkmodules.vtkCommonMath as cmvtk  # type: ignore
-import vtkmodules.vtkCommonTransforms as ctvtk  # type: ignore
-import vtkmodules.vtkDomainsChemistry as dcvtk  # type: ignore
-import vtkmodules.vtkDomainsChemistryOpenGL2 as dcovtk  # type: ignore
-import vtkmodules.vtkFiltersCore as fcvtk  # type: ignore
-import vtkmodules.vtkFiltersGeneral as fgvtk  # type: ignore
-import vtkmodules.vtkFiltersHybrid as fhvtk  # type: ignore
-import vtkmodules.vtkFiltersModeling as fmvtk  # type: ignore
-import vtkmodules.vtkFiltersSources as fsvtk  # type: ignore
-import vtkmodules.vtkFiltersTexture as ftvtk  # type: ignore
-import vtkmodules.vtkIOGeometry as iogvtk  # type: ignore
-import vtkmodules.vtkIOImage as ioivtk  # type: ignore
-import vtkmodules.vtkIOLegacy as iolvtk  # type: ignore
-import vtkmodules.vtkIOMINC as iomincvtk  # type: ignore
-import vtkmodules.vtkIOPLY as ioplyvtk  # type: ignore
-import vtkmodules.vtkIOXML as ioxmlvtk  # type: ignore
-import vtkmodules.vtkImagingCore as icvtk  # type: ignore
-import vtkmodules.vtkInteractionStyle as isvtk  # type: ignore
-import vtkmodules.vtkRenderingAnnotation as ravtk  # type: ignore
-import vtkmodules.vtkRenderingCore as rcvtk  # type: ignore
-import vtkmodules.vtkRenderingFreeType as rftvtk  # type: ignore
-import vtkmodules.vtkRenderingLOD as rlodvtk  # type: ignore
-import vtkmodules.vtkRenderingOpenGL2 as roglvtk  # type: ignore
+"""Lazy access to the VTK classes used across FURY.
 
-VTK_VERSION = ccvtk.vtkVersion.GetVTKVersion()
+Importing every VTK module FURY relies on adds a noticeable delay to
+``import fury.*``. Instead, each name below is only resolved (and its VTK
+module imported) the first time it is accessed, e.g.
+``from fury.lib import Actor`` imports ``vtkRenderingCore`` but not
+``vtkIOMINC``. Resolved names are cached in the module namespace.
+"""
 
-##############################################################
-#  vtkCommonCore Module
-#: class for callback/observer methods
-Command = ccvtk.vtkCommand
-#: class for LookupTable methods
-LookupTable = ccvtk.vtkLookupTable
-#: class for Points methods
-Points = ccvtk.vtkPoints
-#: class for IdTypeArray methods
-IdTypeArray = ccvtk.vtkIdTypeArray
-#: class for FloatArray methods
-FloatArray = ccvtk.vtkFloatArray
-#: class for DoubleArray methods
-DoubleArray = ccvtk.vtkDoubleArray
-#: class for StringArray methods
-StringArray = ccvtk.vtkStringArray
-#: class for UnsignedCharArray
-UnsignedCharArray = ccvtk.vtkUnsignedCharArray
-#: class for VTK_OBJECT
-VTK_OBJECT = ccvtk.VTK_OBJECT
-#: class for VTK_ID_TYPE
-VTK_ID_TYPE = ccvtk.VTK_ID_TYPE
-#: class for VTK_INT
-VTK_INT = ccvtk.VTK_INT
-#: class for VTK_DOUBLE
-VTK_DOUBLE = ccvtk.VTK_DOUBLE
-#: class for VTK_FLOAT
-VTK_FLOAT = ccvtk.VTK_FLOAT
-#: class for VTK_TEXT_LEFT
-VTK_TEXT_LEFT = ccvtk.VTK_TEXT_LEFT
-#: class for VTK_TEXT_RIGHT
-VTK_TEXT_RIGHT = ccvtk.VTK_TEXT_RIGHT
-#: class for VTK_TEXT_BOTTOM
-VTK_TEXT_BOTTOM = ccvtk.VTK_TEXT_BOTTOM
-#: class for VTK_TEXT_TOP
-VTK_TEXT_TOP = ccvtk.VTK_TEXT_TOP
-#: class for VTK_TEXT_CENTERED
-VTK_TEXT_CENTERED = ccvtk.VTK_TEXT_CENTERED
-#: class for VTK_UNSIGNED_CHAR
-VTK_UNSIGNED_CHAR = ccvtk.VTK_UNSIGNED_CHAR
-#: class for VTK_UNSIGNED_INT
-VTK_UNSIGNED_INT = ccvtk.VTK_UNSIGNED_INT
-#: class for VTK_UNSIGNED_SHORT
-VTK_UNSIGNED_SHORT = ccvtk.VTK_UNSIGNED_SHORT
+import importlib
 
-##############################################################
-#  vtkCommonExecutionModel Module
-#: class for AlgorithmOutput
-AlgorithmOutput = cemvtk.vtkAlgorithmOutput
+#: VTK modules providing the object factories (OpenGL backend, fonts,
+#: interactor styles) needed by the rendering modules, imported alongside
+#: the first rendering class that is accessed.
+_RENDERING_FACTORIES = (
+    "vtkRenderingOpenGL2",
+    "vtkRenderingFreeType",
+    "vtkInteractionStyle",
+)
 
-##############################################################
-#  vtkRenderingCore Module
-#: class for Renderer
-Renderer = rcvtk.vtkRenderer
-#: class for Skybox
-Skybox = rcvtk.vtkSkybox
-#: class for Volume
-Volume = rcvtk.vtkVolume
-#: class for Actor2D
-Actor2D = rcvtk.vtkActor2D
-#: class for Actor
-Actor = rcvtk.vtkActor
-#: class for RenderWindow
-RenderWindow = rcvtk.vtkRenderWindow
-#: class for RenderWindowInteractor
-RenderWindowInteractor = rcvtk.vtkRenderWindowInteractor
-#: class for InteractorEventRecorder
-InteractorEventRecorder = rcvtk.vtkInteractorEventRecorder
-#: class for WindowToImageFilter
-WindowToImageFilter = rcvtk.vtkWindowToImageFilter
-#: class for InteractorStyle
-InteractorStyle = rcvtk.vtkInteractorStyle
-#: class for PropPicker
-PropPicker = rcvtk.vtkPropPicker
-#: class for PointPicker
-PointPicker = rcvtk.vtkPointPicker
-#: class for CellPicker
-CellPicker = rcvtk.vtkCellPicker
-#: class for WorldPointPicker
-WorldPointPicker = rcvtk.vtkWorldPointPicker
-#: class for HardwareSelector
-HardwareSelector = rcvtk.vtkHardwareSelector
-#: class for ImageActor
-ImageActor = rcvtk.vtkImageActor
-#: class for PolyDataMapper
-PolyDataMapper = rcvtk.vtkPolyDataMapper
-#: class for PolyDataMapper2D
-PolyDataMapper2D = rcvtk.vtkPolyDataMapper2D
-#: class for Assembly
-Assembly = rcvtk.vtkAssembly
-#: class for DataSetMapper
-DataSetMapper = rcvtk.vtkDataSetMapper
-#: class for Texture
-Texture = rcvtk.vtkTexture
-#: class for TexturedActor2D
-TexturedActor2D = rcvtk.vtkTexturedActor2D
-#: class for Follower
-Follower = rcvtk.vtkFollower
-#: class for TextActor
-TextActor = rcvtk.vtkTextActor
-#: class for TextActor3D
-TextActor3D = rcvtk.vtkTextActor3D
-#: class for Property2D
-Property2D = rcvtk.vtkProperty2D
-#: class for Camera
-Camera = rcvtk.vtkCamera
+#: Modules that require :data:`_RENDERING_FACTORIES` once imported.
+_RENDERING_MODULES = {
+    "vtkRenderingCore",
+    "vtkRenderingOpenGL2",
+    "vtkRenderingFreeType",
+    "vtkRenderingLOD",
+    "vtkRenderingAnnotation",
+    "vtkInteractionStyle",
+    "vtkDomainsChemistryOpenGL2",
+}
 
-##############################################################
-#  vtkRenderingFreeType Module
-#: class for VectorText
-VectorText = rftvtk.vtkVectorText
+#: Python helpers shipped with VTK, ``name: (module, attribute)``. A ``None``
+#: attribute means the module itself.
+_VTK_UTILS = {
+    "colors": ("vtkmodules.util.colors", None),
+    "numpy_support": ("vtkmodules.util.numpy_support", None),
+    "calldata_type": ("vtkmodules.util.misc", "calldata_type"),
+}
 
-##############################################################
-#  vtkRenderingLOD Module
-#: class for LODActor
-LODActor = rlodvtk.vtkLODActor
+#: VTK classes and constants exposed by FURY,
+#: ``name: (vtkmodules submodule, attribute)``.
+_VTK_CLASSES = {
+    "Version": ("vtkCommonCore", "vtkVersion"),
+    ##############################################################
+    #  vtkCommonCore Module
+    #: class for callback/observer methods
+    "Command": ("vtkCommonCore", "vtkCommand"),
+    #: class for LookupTable methods
+    "LookupTable": ("vtkCommonCore", "vtkLookupTable"),
+    #: class for Points methods
+    "Points": ("vtkCommonCore", "vtkPoints"),
+    #: class for IdTypeArray methods
+    "IdTypeArray": ("vtkCommonCore", "vtkIdTypeArray"),
+    #: class for FloatArray methods
+    "FloatArray": ("vtkCommonCore", "vtkFloatArray"),
+    #: class for DoubleArray methods
+    "DoubleArray": ("vtkCommonCore", "vtkDoubleArray"),
+    #: class for StringArray methods
+    "StringArray": ("vtkCommonCore", "vtkStringArray"),
+    #: class for UnsignedCharArray
+    "UnsignedCharArray": ("vtkCommonCore", "vtkUnsignedCharArray"),
+    #: class for VTK_OBJECT
+    "VTK_OBJECT": ("vtkCommonCore", "VTK_OBJECT"),
+    #: class for VTK_ID_TYPE
+    "VTK_ID_TYPE": ("vtkCommonCore", "VTK_ID_TYPE"),
+    #: class for VTK_INT
+    "VTK_INT": ("vtkCommonCore", "VTK_INT"),
+    #: class for VTK_DOUBLE
+    "VTK_DOUBLE": ("vtkCommonCore", "VTK_DOUBLE"),
+    #: class for VTK_FLOAT
+    "VTK_FLOAT": ("vtkCommonCore", "VTK_FLOAT"),
+    #: class for VTK_TEXT_LEFT
+    "VTK_TEXT_LEFT": ("vtkCommonCore", "VTK_TEXT_LEFT"),
+    #: class for VTK_TEXT_RIGHT
+    "VTK_TEXT_RIGHT": ("vtkCommonCore", "VTK_TEXT_RIGHT"),
+    #: class for VTK_TEXT_BOTTOM
+    "VTK_TEXT_BOTTOM": ("vtkCommonCore", "VTK_TEXT_BOTTOM"),
+    #: class for VTK_TEXT_TOP
+    "VTK_TEXT_TOP": ("vtkCommonCore", "VTK_TEXT_TOP"),
+    #: class for VTK_TEXT_CENTERED
+    "VTK_TEXT_CENTERED": ("vtkCommonCore", "VTK_TEXT_CENTERED"),
+    #: class for VTK_UNSIGNED_CHAR
+    "VTK_UNSIGNED_CHAR": ("vtkCommonCore", "VTK_UNSIGNED_CHAR"),
+    #: class for VTK_UNSIGNED_INT
+    "VTK_UNSIGNED_INT": ("vtkCommonCore", "VTK_UNSIGNED_INT"),
+    #: class for VTK_UNSIGNED_SHORT
+    "VTK_UNSIGNED_SHORT": ("vtkCommonCore", "VTK_UNSIGNED_SHORT"),
+    ##############################################################
+    #  vtkCommonExecutionModel Module
+    #: class for AlgorithmOutput
+    "AlgorithmOutput": ("vtkCommonExecutionModel", "vtkAlgorithmOutput"),
+    ##############################################################
+    #  vtkRenderingCore Module
+    #: class for Renderer
+    "Renderer": ("vtkRenderingCore", "vtkRenderer"),
+    #: class for Skybox
+    "Skybox": ("vtkRenderingCore", "vtkSkybox"),
+    #: class for Volume
+    "Volume": ("vtkRenderingCore", "vtkVolume"),
+    #: class for Actor2D
+    "Actor2D": ("vtkRenderingCore", "vtkActor2D"),
+    #: class for Actor
+    "Actor": ("vtkRenderingCore", "vtkActor"),
+    #: class for RenderWindow
+    "RenderWindow": ("vtkRenderingCore", "vtkRenderWindow"),
+    #: class for RenderWindowInteractor
+    "RenderWindowInteractor": ("vtkRenderingCore", "vtkRenderWindowInteractor"),
+    #: class for InteractorEventRecorder
+    "InteractorEventRecorder": ("vtkRenderingCore", "vtkInteractorEventRecorder"),
+    #: class for WindowToImageFilter
+    "WindowToImageFilter": ("vtkRenderingCore", "vtkWindowToImageFilter"),
+    #: class for InteractorStyle
+    "InteractorStyle": ("vtkRenderingCore", "vtkInteractorStyle"),
+    #: class for PropPicker
+    "PropPicker": ("vtkRenderingCore", "vtkPropPicker"),
+    #: class for PointPicker
+    "PointPicker": ("vtkRenderingCore", "vtkPointPicker"),
+    #: class for CellPicker
+    "CellPicker": ("vtkRenderingCore", "vtkCellPicker"),
+    #: class for WorldPointPicker
+    "WorldPointPicker": ("vtkRenderingCore", "vtkWorldPointPicker"),
+    #: class for HardwareSelector
+    "HardwareSelector": ("vtkRenderingCore", "vtkHardwareSelector"),
+    #: class for ImageActor
+    "ImageActor": ("vtkRenderingCore", "vtkImageActor"),
+    #: class for PolyDataMapper
+    "PolyDataMapper": ("vtkRenderingCore", "vtkPolyDataMapper"),
+    #: class for PolyDataMapper2D
+    "PolyDataMapper2D": ("vtkRenderingCore", "vtkPolyDataMapper2D"),
+    #: class for Assembly
+    "Assembly": ("vtkRenderingCore", "vtkAssembly"),
+    #: class for DataSetMapper
+    "DataSetMapper": ("vtkRenderingCore", "vtkDataSetMapper"),
+    #: class for Glyph3DMapper
+    "Glyph3DMapper": ("vtkRenderingCore", "vtkGlyph3DMapper"),
+    #: class for Texture
+    "Texture": ("vtkRenderingCore", "vtkTexture"),
+    #: class for TexturedActor2D
+    "TexturedActor2D": ("vtkRenderingCore", "vtkTexturedActor2D"),
+    #: class for Follower
+    "Follower": ("vtkRenderingCore", "vtkFollower"),
+    #: class for TextActor
+    "TextActor": ("vtkRenderingCore", "vtkTextActor"),
+    #: class for TextActor3D
+    "TextActor3D": ("vtkRenderingCore", "vtkTextActor3D"),
+    #: class for Property2D
+    "Property2D": ("vtkRenderingCore", "vtkProperty2D"),
+    #: class for Camera
+    "Camera": ("vtkRenderingCore", "vtkCamera"),
+    ##############################################################
+    #  vtkRenderingFreeType Module
+    #: class for VectorText
+    "VectorText": ("vtkRenderingFreeType", "vtkVectorText"),
+    ##############################################################
+    #  vtkRenderingLOD Module
+    #: class for LODActor
+    "LODActor": ("vtkRenderingLOD", "vtkLODActor"),
+    ##############################################################
+    #  vtkRenderingAnnotation Module
+    #: class for ScalarBarActor
+    "ScalarBarActor": ("vtkRenderingAnnotation", "vtkScalarBarActor"),
+    ##############################################################
+    #  vtkRenderingOpenGL2 Module
+    #: class for OpenGLRenderer
+    "OpenGLRenderer": ("vtkRenderingOpenGL2", "vtkOpenGLRenderer"),
+    #: class for Shader
+    "Shader": ("vtkRenderingOpenGL2", "vtkShader"),
+    ##############################################################
+    #  vtkInteractionStyle Module
+    #: class for InteractorStyleImage
+    "InteractorStyleImage": ("vtkInteractionStyle", "vtkInteractorStyleImage"),
+    #: class for InteractorStyleTrackballActor
+    "InteractorStyleTrackballActor": (
+        "vtkInteractionStyle",
+        "vtkInteractorStyleTrackballActor",
+    ),
+    #: class for InteractorStyleTrackballCamera
+    "InteractorStyleTrackballCamera": (
+        "vtkInteractionStyle",
+        "vtkInteractorStyleTrackballCamera",
+    ),
+    #: class for InteractorStyleUser
+    "InteractorStyleUser": ("vtkInteractionStyle", "vtkInteractorStyleUser"),
+    ##############################################################
+    #  vtkFiltersCore Module
+    #: class for CleanPolyData
+    "CleanPolyData": ("vtkFiltersCore", "vtkCleanPolyData"),
+    #: class for PolyDataNormals
+    "PolyDataNormals": ("vtkFiltersCore", "vtkPolyDataNormals"),
+    #: class for ContourFilter
+    "ContourFilter": ("vtkFiltersCore", "vtkContourFilter"),
+    #: class for TubeFilter
+    "TubeFilter": ("vtkFiltersCore", "vtkTubeFilter"),
+    #: class for Glyph3D
+    "Glyph3D": ("vtkFiltersCore", "vtkGlyph3D"),
+    #: class for TriangleFilter
+    "TriangleFilter": ("vtkFiltersCore", "vtkTriangleFilter"),
+    ##############################################################
+    #  vtkFiltersGeneral Module
+    #: class for SplineFilter
+    "SplineFilter": ("vtkFiltersGeneral", "vtkSplineFilter"),
+    #: class for TransformPolyDataFilter
+    "TransformPolyDataFilter": ("vtkFiltersGeneral", "vtkTransformPolyDataFilter"),
+    ##############################################################
+    #  vtkFiltersHybrid Module
+    #: class for RenderLargeImage
+    "RenderLargeImage": ("vtkFiltersHybrid", "vtkRenderLargeImage"),
+    ##############################################################
+    #  vtkFiltersModeling Module
+    #: class for LoopSubdivisionFilter
+    "LoopSubdivisionFilter": ("vtkFiltersModeling", "vtkLoopSubdivisionFilter"),
+    #: class for ButterflySubdivisionFilter
+    "ButterflySubdivisionFilter": (
+        "vtkFiltersModeling",
+        "vtkButterflySubdivisionFilter",
+    ),
+    #: class for OutlineFilter
+    "OutlineFilter": ("vtkFiltersModeling", "vtkOutlineFilter"),
+    #: class for LinearExtrusionFilter
+    "LinearExtrusionFilter": ("vtkFiltersModeling", "vtkLinearExtrusionFilter"),
+    ##############################################################
+    #  vtkFiltersTexture Module
+    #: class for TextureMapToPlane
+    "TextureMapToPlane": ("vtkFiltersTexture", "vtkTextureMapToPlane"),
+    ##############################################################
+    #  vtkFiltersSource Module
+    #: class for SphereSource
+    "SphereSource": ("vtkFiltersSources", "vtkSphereSource"),
+    #: class for CylinderSource
+    "CylinderSource": ("vtkFiltersSources", "vtkCylinderSource"),
+    #: class for ArrowSource
+    "ArrowSource": ("vtkFiltersSources", "vtkArrowSource"),
+    #: class for ConeSource
+    "ConeSource": ("vtkFiltersSources", "vtkConeSource"),
+    #: class for DiskSource
+    "DiskSource": ("vtkFiltersSources", "vtkDiskSource"),
+    #: class for TexturedSphereSource
+    "TexturedSphereSource": ("vtkFiltersSources", "vtkTexturedSphereSource"),
+    #: class for RegularPolygonSource
+    "RegularPolygonSource": ("vtkFiltersSources", "vtkRegularPolygonSource"),
+    ##############################################################
+    #  vtkCommonDataModel Module
+    #: class for PolyData
+    "PolyData": ("vtkCommonDataModel", "vtkPolyData"),
+    #: class for ImageData
+    "ImageData": ("vtkCommonDataModel", "vtkImageData"),
+    #: class for DataObject
+    "DataObject": ("vtkCommonDataModel", "vtkDataObject"),
+    #: class for CellArray
+    "CellArray": ("vtkCommonDataModel", "vtkCellArray"),
+    #: class for PolyVertex
+    "PolyVertex": ("vtkCommonDataModel", "vtkPolyVertex"),
+    #: class for UnstructuredGrid
+    "UnstructuredGrid": ("vtkCommonDataModel", "vtkUnstructuredGrid"),
+    #: class for Polygon
+    "Polygon": ("vtkCommonDataModel", "vtkPolygon"),
+    #: class for Molecule
+    "Molecule": ("vtkCommonDataModel", "vtkMolecule"),
+    #: class for DataSetAttributes
+    "DataSetAttributes": ("vtkCommonDataModel", "vtkDataSetAttributes"),
+    ##############################################################
+    #  vtkCommonTransforms Module
+    #: class for Transform
+    "Transform": ("vtkCommonTransforms", "vtkTransform"),
+    ##############################################################
+    #  vtkCommonTransforms Module
+    #: class for Matrix4x4
+    "Matrix4x4": ("vtkCommonMath", "vtkMatrix4x4"),
+    #: class for Matrix3x3
+    "Matrix3x3": ("vtkCommonMath", "vtkMatrix3x3"),
+    ##############################################################
+    #  vtkImagingCore Module
+    #: class for ImageFlip
+    "ImageFlip": ("vtkImagingCore", "vtkImageFlip"),
+    #: class for ImageReslice
+    "ImageReslice": ("vtkImagingCore", "vtkImageReslice"),
+    #: class for ImageMapToColors
+    "ImageMapToColors": ("vtkImagingCore", "vtkImageMapToColors"),
+    ##############################################################
+    #  vtkIOImage vtkIOLegacy, vtkIOPLY, vtkIOGeometry,
+    # vtkIOMINC Modules
+    #: class for ImageReader2Factory
+    "ImageReader2Factory": ("vtkIOImage", "vtkImageReader2Factory"),
+    #: class for PNGReader
+    "PNGReader": ("vtkIOImage", "vtkPNGReader"),
+    #: class for BMPReader
+    "BMPReader": ("vtkIOImage", "vtkBMPReader"),
+    #: class for JPEGReader
+    "JPEGReader": ("vtkIOImage", "vtkJPEGReader"),
+    #: class for TIFFReader
+    "TIFFReader": ("vtkIOImage", "vtkTIFFReader"),
+    #: class for PLYReader
+    "PLYReader": ("vtkIOPLY", "vtkPLYReader"),
+    #: class for STLReader
+    "STLReader": ("vtkIOGeometry", "vtkSTLReader"),
+    #: class for OBJReader
+    "OBJReader": ("vtkIOGeometry", "vtkOBJReader"),
+    #: class for MNIObjectReader
+    "MNIObjectReader": ("vtkIOMINC", "vtkMNIObjectReader"),
+    #: class for PolyDataReader
+    "PolyDataReader": ("vtkIOLegacy", "vtkPolyDataReader"),
+    #: class for XMLPolyDataReader
+    "XMLPolyDataReader": ("vtkIOXML", "vtkXMLPolyDataReader"),
+    #: class for PNGWriter
+    "PNGWriter": ("vtkIOImage", "vtkPNGWriter"),
+    #: class for BMPWriter
+    "BMPWriter": ("vtkIOImage", "vtkBMPWriter"),
+    #: class for JPEGWriter
+    "JPEGWriter": ("vtkIOImage", "vtkJPEGWriter"),
+    #: class for TIFFWriter
+    "TIFFWriter": ("vtkIOImage", "vtkTIFFWriter"),
+    #: class for PLYWriter
+    "PLYWriter": ("vtkIOPLY", "vtkPLYWriter"),
+    #: class for STLWriter
+    "STLWriter": ("vtkIOGeometry", "vtkSTLWriter"),
+    #: class for MNIObjectWriter
+    "MNIObjectWriter": ("vtkIOMINC", "vtkMNIObjectWriter"),
+    #: class for PolyDataWriter
+    "PolyDataWriter": ("vtkIOLegacy", "vtkPolyDataWriter"),
+    #: class for XMLPolyDataWriter
+    "XMLPolyDataWriter": ("vtkIOXML", "vtkXMLPolyDataWriter"),
+    ##############################################################
+    #  vtkDomainsChemistry  and vtkDomainsChemistryOpenGL2 Module
+    #: class for SimpleBondPerceiver
+    "SimpleBondPerceiver": ("vtkDomainsChemistry", "vtkSimpleBondPerceiver"),
+    #: class for PointSetToMoleculeFilter
+    "PointSetToMoleculeFilter": ("vtkDomainsChemistry", "vtkPointSetToMoleculeFilter"),
+    #: class for ProteinRibbonFilter
+    "ProteinRibbonFilter": ("vtkDomainsChemistry", "vtkProteinRibbonFilter"),
+    #: class for PeriodicTable
+    "PeriodicTable": ("vtkDomainsChemistry", "vtkPeriodicTable"),
+    #: class for OpenGLMoleculeMapper
+    "OpenGLMoleculeMapper": ("vtkDomainsChemistryOpenGL2", "vtkOpenGLMoleculeMapper"),
+}
 
-##############################################################
-#  vtkRenderingAnnotation Module
-#: class for ScalarBarActor
-ScalarBarActor = ravtk.vtkScalarBarActor
+__all__ = sorted(["VTK_VERSION", *_VTK_UTILS, *_VTK_CLASSES])
 
-##############################################################
-#  vtkRenderingOpenGL2 Module
-#: class for OpenGLRenderer
-OpenGLRenderer = roglvtk.vtkOpenGLRenderer
-#: class for Shader
-Shader = roglvtk.vtkShader
 
-##############################################################
-#  vtkInteractionStyle Module
-#: class for InteractorStyleImage
-InteractorStyleImage = isvtk.vtkInteractorStyleImage
-#: class for InteractorStyleTrackballActor
-InteractorStyleTrackballActor = isvtk.vtkInteractorStyleTrackballActor
-#: class for InteractorStyleTrackballCamera
-InteractorStyleTrackballCamera = isvtk.vtkInteractorStyleTrackballCamera
-#: class for InteractorStyleUser
-InteractorStyleUser = isvtk.vtkInteractorStyleUser
+def _import_vtk_module(name):
+    """Import ``vtkmodules.<name>`` and the factories it may depend on."""
+    module = importlib.import_module(f"vtkmodules.{name}")
+    if name in _RENDERING_MODULES:
+        for factory in _RENDERING_FACTORIES:
+            importlib.import_module(f"vtkmodules.{factory}")
+        if name == "vtkDomainsChemistryOpenGL2":
+            importlib.import_module("vtkmodules.vtkDomainsChemistry")
+    return module
 
-##############################################################
-#  vtkFiltersCore Module
-#: class for CleanPolyData
-CleanPolyData = fcvtk.vtkCleanPolyData
-#: class for PolyDataNormals
-PolyDataNormals = fcvtk.vtkPolyDataNormals
-#: class for ContourFilter
-ContourFilter = fcvtk.vtkContourFilter
-#: class for TubeFilter
-TubeFilter = fcvtk.vtkTubeFilter
-#: class for Glyph3D
-Glyph3D = fcvtk.vtkGlyph3D
-#: class for TriangleFilter
-TriangleFilter = fcvtk.vtkTriangleFilter
 
-##############################################################
-#  vtkFiltersGeneral Module
-#: class for SplineFilter
-SplineFilter = fgvtk.vtkSplineFilter
-#: class for TransformPolyDataFilter
-TransformPolyDataFilter = fgvtk.vtkTransformPolyDataFilter
+def __getattr__(name):
+    if name in _VTK_CLASSES:
+        module_name, attr = _VTK_CLASSES[name]
+        value = getattr(_import_vtk_module(module_name), attr)
+    elif name in _VTK_UTILS:
+        module_name, attr = _VTK_UTILS[name]
+        value = importlib.import_module(module_name)
+        if attr is not None:
+            value = getattr(value, attr)
+    elif name == "VTK_VERSION":
+        value = __getattr__("Version").GetVTKVersion()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-##############################################################
-#  vtkFiltersHybrid Module
-#: class for RenderLargeImage
-RenderLargeImage = fhvtk.vtkRenderLargeImage
 
-##############################################################
-#  vtkFiltersModeling Module
-#: class for LoopSubdivisionFilter
-LoopSubdivisionFilter = fmvtk.vtkLoopSubdivisionFilter
-#: class for ButterflySubdivisionFilter
-ButterflySubdivisionFilter = fmvtk.vtkButterflySubdivisionFilter
-#: class for OutlineFilter
-OutlineFilter = fmvtk.vtkOutlineFilter
-#: class for LinearExtrusionFilter
-LinearExtrusionFilter = fmvtk.vtkLinearExtrusionFilter
-
-##############################################################
-#  vtkFiltersTexture Module
-#: class for TextureMapToPlane
-TextureMapToPlane = ftvtk.vtkTextureMapToPlane
-
-##############################################################
-#  vtkFiltersSource Module
-#: class for SphereSource
-SphereSource = fsvtk.vtkSphereSource
-#: class for CylinderSource
-CylinderSource = fsvtk.vtkCylinderSource
-#: class for ArrowSource
-ArrowSource = fsvtk.vtkArrowSource
-#: class for ConeSource
-ConeSource = fsvtk.vtkConeSource
-#: class for DiskSource
-DiskSource = fsvtk.vtkDiskSource
-#: class for TexturedSphereSource
-TexturedSphereSource = fsvtk.vtkTexturedSphereSource
-#: class for RegularPolygonSource
-RegularPolygonSource = fsvtk.vtkRegularPolygonSource
-
-##############################################################
-#  vtkCommonDataModel Module
-#: class for PolyData
-PolyData = cdmvtk.vtkPolyData
-#: class for ImageData
-ImageData = cdmvtk.vtkImageData
-#: class for DataObject
-DataObject = cdmvtk.vtkDataObject
-#: class for CellArray
-CellArray = cdmvtk.vtkCellArray
-#: class for PolyVertex
-PolyVertex = cdmvtk.vtkPolyVertex
-#: class for UnstructuredGrid
-UnstructuredGrid = cdmvtk.vtkUnstructuredGrid
-#: class for Polygon
-Polygon = cdmvtk.vtkPolygon
-
-#: class for Molecule
-Molecule = cdmvtk.vtkMolecule
-#: class for DataSetAttributes
-DataSetAttributes = cdmvtk.vtkDataSetAttributes
-
-##############################################################
-#  vtkCommonTransforms Module
-#: class for Transform
-Transform = ctvtk.vtkTransform
-
-##############################################################
-#  vtkCommonTransforms Module
-#: class for Matrix4x4
-Matrix4x4 = cmvtk.vtkMatrix4x4
-#: class for Matrix3x3
-Matrix3x3 = cmvtk.vtkMatrix3x3
-
-##############################################################
-#  vtkImagingCore Module
-#: class for ImageFlip
-ImageFlip = icvtk.vtkImageFlip
-#: class for ImageReslice
-ImageReslice = icvtk.vtkImageReslice
-#: class for ImageMapToColors
-ImageMapToColors = icvtk.vtkImageMapToColors
-
-##############################################################
-#  vtkIOImage vtkIOLegacy, vtkIOPLY, vtkIOGeometry,
-# vtkIOMINC Modules
-#: class for ImageReader2Factory
-ImageReader2Factory = ioivtk.vtkImageReader2Factory
-#: class for PNGReader
-PNGReader = ioivtk.vtkPNGReader
-#: class for BMPReader
-BMPReader = ioivtk.vtkBMPReader
-#: class for JPEGReader
-JPEGReader = ioivtk.vtkJPEGReader
-#: class for TIFFReader
-TIFFReader = ioivtk.vtkTIFFReader
-#: class for PLYReader
-PLYReader = ioplyvtk.vtkPLYReader
-#: class for STLReader
-STLReader = iogvtk.vtkSTLReader
-#: class for OBJReader
-OBJReader = iogvtk.vtkOBJReader
-#: class for MNIObjectReader
-MNIObjectReader = iomincvtk.vtkMNIObjectReader
-#: class for PolyDataReader
-PolyDataReader = iolvtk.vtkPolyDataReader
-#: class for XMLPolyDataReader
-XMLPolyDataReader = ioxmlvtk.vtkXMLPolyDataReader
-#: class for PNGWriter
-PNGWriter = ioivtk.vtkPNGWriter
-#: class for BMPWriter
-BMPWriter = ioivtk.vtkBMPWriter
-#: class for JPEGWriter
-JPEGWriter = ioivtk.vtkJPEGWriter
-#: class for TIFFWriter
-TIFFWriter = ioivtk.vtkTIFFWriter
-#: class for PLYWriter
-PLYWriter = ioplyvtk.vtkPLYWriter
-#: class for STLWriter
-STLWriter = iogvtk.vtkSTLWriter
-#: class for MNIObjectWriter
-MNIObjectWriter = iomincvtk.vtkMNIObjectWriter
-#: class for PolyDataWriter
-PolyDataWriter = iolvtk.vtkPolyDataWriter
-#: class for XMLPolyDataWriter
-XMLPolyDataWriter = ioxmlvtk.vtkXMLPolyDataWriter
-
-##############################################################
-#  vtkDomainsChemistry  and vtkDomainsChemistryOpenGL2 Module
-#: class for SimpleBondPerceiver
-SimpleBondPerceiver = dcvtk.vtkSimpleBondPerceiver
-#: class for ProteinRibbonFilter
-ProteinRibbonFilter = dcvtk.vtkProteinRibbonFilter
-#: class for PeriodicTable
-PeriodicTable = dcvtk.vtkPeriodicTable
-#: class for OpenGLMoleculeMapper
-OpenGLMoleculeMapper = dcovtk.vtkOpenGLMoleculeMapper
+def __dir__():
+    return __all__
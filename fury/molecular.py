@@ -1,10 +1,12 @@
 """Module that provides molecular visualization tools."""
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import warnings
 
 import numpy as np
 
 from fury.actor import streamtube
+from fury.animation.animation import Animation
 from fury.decorators import warn_on_args_to_kwargs
 from fury.lib import (
     VTK_FLOAT,
@@ -17,14 +19,14 @@ from fury.lib import (
     Molecule as Mol,
     OpenGLMoleculeMapper,
     PeriodicTable,
+    PointSetToMoleculeFilter,
     PolyData,
     PolyDataMapper,
     ProteinRibbonFilter,
-    SimpleBondPerceiver,
     StringArray,
     numpy_support as nps,
 )
-from fury.utils import numpy_to_vtk_points
+from fury.utils import numpy_to_vtk_cells, numpy_to_vtk_points
 
 
 class Molecule(Mol):
@@ -347,31 +349,165 @@ def deep_copy_molecule(molecule1, molecule2):
     molecule1.DeepCopyStructure(molecule2)
 
 
-def compute_bonding(molecule):
-    """Uses `vtkSimpleBondPerceiver` to generate bonding information for a
-    molecule.
-    `vtkSimpleBondPerceiver` performs a simple check of all interatomic
-    distances and adds a single bond between atoms that are reasonably
-    close. If the interatomic distance is less than the sum of the two
-    atom's covalent radii plus a tolerance, a single bond is added.
+def _slab_bonds(positions, radii, n_slab, tolerance, box):
+    """Find the bonds of a slab of atoms.
+
+    Parameters
+    ----------
+    positions : ndarray, shape (N, 3)
+        Positions of the atoms of the slab, followed by the atoms of other
+        slabs they can be bonded to.
+    radii : ndarray, shape (N, )
+        Covalent radii of the atoms.
+    n_slab : int
+        Number of atoms of the slab.
+    tolerance : float
+        Distance added to the sum of the covalent radii of two atoms.
+    box : ndarray, shape (3, ) or None
+        Lengths of the periodic box, the positions are inside it.
+
+    Returns
+    -------
+    bonds : ndarray, shape (B, 2)
+        Bonded pairs of atoms, at least one of them belongs to the slab.
+
+    """
+    # scipy.spatial is slow to import and only needed here.
+    from scipy.spatial import cKDTree
+
+    tree = cKDTree(positions, boxsize=box, balanced_tree=False, compact_nodes=False)
+    pairs = tree.query_pairs(2 * radii.max() + tolerance, output_type="ndarray")
+    pairs = pairs[pairs[:, 0] < n_slab]
+    vectors = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+    if box is not None:
+        vectors -= box * np.round(vectors / box)
+    max_lengths = radii[pairs[:, 0]] + radii[pairs[:, 1]] + tolerance
+    return pairs[np.einsum("ij,ij->i", vectors, vectors) < max_lengths**2]
+
+
+@warn_on_args_to_kwargs()
+def compute_bonding(
+    molecule, *, tolerance=0.1, box=None, chunk_size=2**16, n_workers=1
+):
+    """Add a single bond between the atoms of a molecule that are close.
+
+    If the interatomic distance is less than the sum of the two atom's
+    covalent radii plus a tolerance, a single bond is added. The atoms are
+    split in slabs along the X axis whose neighbors are searched with a k-d
+    tree, and the bonds are written in the molecule in place.
 
     Parameters
     ----------
     molecule : Molecule
         The molecule for which bonding information is to be generated.
+    tolerance : float, optional
+        Distance added to the sum of the covalent radii. Default: 0.1
+    box : tuple (3,) or ndarray of shape (3,), optional
+        Lengths of the periodic box of the molecule along the X, Y and Z
+        axes. Atoms are bonded across its faces, as needed by molecular
+        dynamics trajectories with periodic boundary conditions. Default is
+        no periodic boundary.
+    chunk_size : int, optional
+        Number of atoms of a slab.
+    n_workers : int, optional
+        Number of processes searching the slabs.
 
     Notes
     -----
     This algorithm does not consider valences, hybridization, aromaticity,
     or anything other than atomic separations. It will not produce anything
-    other than single bonds.
+    other than single bonds. The bonds already present in the molecule are
+    kept and the atoms they join are not bonded again.
 
     """
-    bonder = SimpleBondPerceiver()
-    bonder.SetInputData(molecule)
-    bonder.SetTolerance(0.1)
+    num_total_atoms = molecule.total_num_atoms
+    if num_total_atoms == 0:
+        return
+
+    atomic_numbers = get_all_atomic_numbers(molecule)
+    table = PTable()
+    elements, element_ids = np.unique(atomic_numbers, return_inverse=True)
+    element_radii = np.array(
+        [table.atomic_radius(element, radius_type="Covalent") for element in elements]
+    )
+    radii = element_radii[element_ids].ravel()
+    positions = get_all_atomic_positions(molecule)
+    if box is not None:
+        box = np.asarray(box, dtype=float)
+        positions = np.mod(positions, box)
+        positions = np.where(positions >= box, positions - box, positions)
+    cutoff = 2 * radii.max() + tolerance
+
+    # Slabs of `chunk_size` atoms along the X axis, each one with the atoms of
+    # the next slabs and, across the periodic boundary, of the previous ones
+    # that are closer than the largest bond length.
+    order = np.argsort(positions[:, 0], kind="stable")
+    sorted_x = positions[order, 0]
+    slabs = []
+    for start in range(0, num_total_atoms, chunk_size):
+        stop = min(start + chunk_size, num_total_atoms)
+        slab = order[start : np.searchsorted(sorted_x, sorted_x[stop - 1] + cutoff)]
+        if box is not None:
+            wrap_stop = np.searchsorted(sorted_x, sorted_x[stop - 1] + cutoff - box[0])
+            slab = np.concatenate((slab, order[: min(wrap_stop, start)]))
+        slabs.append((slab, stop - start))
+
+    args = (
+        (positions[slab], radii[slab], n_slab, tolerance, box) for slab, n_slab in slabs
+    )
+
+    def encode_bonds(slab_bonds):
+        # Each bond is encoded as one integer, sorted by atoms
+        keys = []
+        for (slab, _), bonds in zip(slabs, slab_bonds):
+            first, second = slab[bonds[:, 0]], slab[bonds[:, 1]]
+            keys.append(np.minimum(first, second) * num_total_atoms)
+            keys[-1] += np.maximum(first, second)
+        return keys
+
+    if n_workers > 1 and len(slabs) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            keys = encode_bonds(executor.map(_slab_bonds, *zip(*args)))
+    else:
+        keys = encode_bonds(_slab_bonds(*slab_args) for slab_args in args)
+    keys = np.concatenate(keys)
+    keys.sort()
+    if box is not None:
+        # Small periodic boxes can give a bond from both sides
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    bonds = np.column_stack(np.divmod(keys, num_total_atoms))
+    del keys
+
+    # Keep the existing bonds first, with their order
+    existing_bonds = np.array(
+        [
+            sorted((bond.GetBeginAtomId(), bond.GetEndAtomId()))
+            for bond in map(molecule.GetBond, range(molecule.total_num_bonds))
+        ],
+        dtype=np.int64,
+    ).reshape((-1, 2))
+    if len(existing_bonds):
+        keys = bonds[:, 0] * num_total_atoms + bonds[:, 1]
+        existing_keys = existing_bonds[:, 0] * num_total_atoms + existing_bonds[:, 1]
+        bonds = np.concatenate((existing_bonds, bonds[~np.isin(keys, existing_keys)]))
+    bond_orders = np.ones(len(bonds), dtype=np.uint16)
+    bond_orders[: len(existing_bonds)] = get_all_bond_orders(molecule)
+
+    # The bonds are given as lines to a filter building the molecule in bulk,
+    # the new molecule shares the atoms of `molecule`.
+    atoms = PolyData()
+    atoms.SetPoints(molecule.GetAtomicPositionArray())
+    atoms.GetPointData().ShallowCopy(molecule.GetAtomData())
+    atoms.GetPointData().SetScalars(molecule.GetAtomicNumberArray())
+    atoms.SetLines(numpy_to_vtk_cells(bonds, is_coords=False))
+    vtk_bond_orders = nps.numpy_to_vtk(bond_orders, deep=True)
+    vtk_bond_orders.SetName(molecule.GetBondOrdersArrayName())
+    atoms.GetCellData().SetScalars(vtk_bond_orders)
+
+    bonder = PointSetToMoleculeFilter()
+    bonder.SetInputData(atoms)
     bonder.Update()
-    deep_copy_molecule(molecule, bonder.GetOutput())
+    molecule.ShallowCopyStructure(bonder.GetOutput())
 
 
 class PTable(PeriodicTable):
@@ -671,6 +807,54 @@ def stick(molecule, *, colormode="discrete", bond_thickness=0.1):
     return molecule_actor
 
 
+def _residues_in_ranges(chain, residue_seq, ranges):
+    """Find the atoms whose residue is inside one of the ranges of residues.
+
+    Parameters
+    ----------
+    chain : ndarray of integers, shape (N, )
+        Chain number of each atom.
+    residue_seq : ndarray of integers, shape (N, )
+        Residue sequence number of each atom.
+    ranges : ndarray of integers, shape (R, 4)
+        Ranges of residues given like the sheets and helices of a molecule:
+        the chain number, the first and the last (inclusive) residue are in
+        the first, second and fourth columns.
+
+    Returns
+    -------
+    in_ranges : ndarray of bools, shape (N, )
+        Whether each atom belongs to one of the ranges.
+
+    """
+    in_ranges = np.zeros(len(chain), dtype=bool)
+    if ranges is None or len(ranges) == 0 or len(chain) == 0:
+        return in_ranges
+
+    chain = np.asarray(chain, dtype=np.int64)
+    residue_seq = np.asarray(residue_seq, dtype=np.int64)
+    ranges = np.asarray(ranges, dtype=np.int64)
+
+    # Encode the (chain, residue) pairs as integers sorted by chain first
+    first_chain = min(chain.min(), ranges[:, 0].min())
+    first_residue = min(residue_seq.min(), ranges[:, 1].min())
+    span = max(residue_seq.max(), ranges[:, 3].max()) - first_residue + 1
+    atom_keys = (chain - first_chain) * span + residue_seq - first_residue
+    range_keys = (ranges[:, 0, None] - first_chain) * span + ranges[:, [1, 3]]
+    range_keys -= first_residue
+
+    order = np.argsort(range_keys[:, 0], kind="stable")
+    starts = range_keys[order, 0]
+    # Furthest end among the ranges starting before each one. The keys of
+    # the previous chains are all smaller than the keys of a chain.
+    ends = np.maximum.accumulate(range_keys[order, 1])
+
+    last_range = np.searchsorted(starts, atom_keys, side="right") - 1
+    in_ranges[:] = last_range >= 0
+    in_ranges[in_ranges] = ends[last_range[in_ranges]] >= atom_keys[in_ranges]
+    return in_ranges
+
+
 def ribbon(molecule):
     """Create an actor for ribbon molecular representation.
 
@@ -695,29 +879,13 @@ def ribbon(molecule):
     coords = get_all_atomic_positions(molecule)
     all_atomic_numbers = get_all_atomic_numbers(molecule)
     num_total_atoms = molecule.total_num_atoms
-    secondary_structures = np.ones(num_total_atoms)
-    for i in range(num_total_atoms):
-        secondary_structures[i] = ord("c")
-        resi = molecule.residue_seq[i]
-        for j, _ in enumerate(molecule.sheet):
-            sheet = molecule.sheet[j]
-            if (
-                (molecule.chain[i] != sheet[0])
-                or (resi < sheet[1])
-                or (resi > sheet[3])
-            ):
-                continue
-            secondary_structures[i] = ord("s")
-
-        for j, _ in enumerate(molecule.helix):
-            helix = molecule.helix[j]
-            if (
-                (molecule.chain[i] != helix[0])
-                or (resi < helix[1])
-                or (resi > helix[3])
-            ):
-                continue
-            secondary_structures[i] = ord("h")
+    secondary_structures = np.full(num_total_atoms, ord("c"), dtype=np.uint8)
+    secondary_structures[
+        _residues_in_ranges(molecule.chain, molecule.residue_seq, molecule.sheet)
+    ] = ord("s")
+    secondary_structures[
+        _residues_in_ranges(molecule.chain, molecule.residue_seq, molecule.helix)
+    ] = ord("h")
 
     output = PolyData()
 
@@ -739,8 +907,9 @@ def ribbon(molecule):
     # the array to be named atom_types
     atom_names.SetName("atom_types")
     atom_names.SetNumberOfTuples(num_total_atoms)
-    for i in range(num_total_atoms):
-        atom_names.SetValue(i, molecule.atom_names[i])
+    set_atom_name = atom_names.SetValue
+    for i, atom_name in enumerate(np.asarray(molecule.atom_names).tolist()):
+        set_atom_name(i, atom_name)
 
     output.GetPointData().AddArray(atom_names)
 
@@ -801,16 +970,14 @@ def ribbon(molecule):
 
     table = PTable()
 
-    # for colors and radii of hetero-atoms
-    radii = np.ones((num_total_atoms, 3))
-    rgb = np.ones((num_total_atoms, 3))
-
-    for i in range(num_total_atoms):
-        radii[i] = np.repeat(
-            table.atomic_radius(all_atomic_numbers[i], radius_type="VDW"),
-            3,
-        )
-        rgb[i] = table.atom_color(all_atomic_numbers[i])
+    # for colors and radii of hetero-atoms, looked up once per element
+    elements, element_ids = np.unique(all_atomic_numbers, return_inverse=True)
+    element_radii = np.array(
+        [table.atomic_radius(element, radius_type="VDW") for element in elements]
+    )
+    element_rgb = np.array([table.atom_color(element) for element in elements])
+    radii = np.repeat(element_radii[element_ids, None], 3, axis=1)
+    rgb = element_rgb[element_ids].reshape((num_total_atoms, 3))
 
     Rgb = nps.numpy_to_vtk(
         num_array=rgb,
@@ -879,3 +1046,138 @@ def bounding_box(molecule, *, colors=(1, 1, 1), linewidth=0.3):
     )
 
     return streamtube(lines, colors=colors, linewidth=linewidth)
+
+
+class Trajectory(Animation):
+    """Playback of a molecular dynamics trajectory.
+
+    The frames are copied one at a time into the atomic positions of an
+    existing molecule, so the actors created from it with
+    :func:`sphere_cpk`, :func:`ball_stick` or :func:`stick` follow the
+    trajectory without being rebuilt. The frames can be memory-mapped from
+    a ``.npy`` file: only the frames that are played are read from disk, the
+    next ones being loaded in a background thread while the current one is
+    rendered. As an Animation, a Trajectory can be added to a ``Timeline``
+    to play, pause and seek through the frames.
+
+    Attributes
+    ----------
+    molecule : Molecule
+        The molecule whose atomic positions are updated.
+    frames : ndarray of shape (F, N, 3) or str
+        Coordinates of the N atoms of the molecule for each of the F frames,
+        or path of a ``.npy`` file holding them, which is memory-mapped.
+    actors : Actor or list[Actor], optional
+        Actors rendering the molecule, added to the scene with the animation.
+    fps : float, optional
+        Number of frames played per second.
+    read_ahead : int, optional
+        Number of frames loaded in advance after the current one. Set to 0
+        to load the frames only when they are displayed.
+    loop : bool, optional, default: True
+        Whether to loop the trajectory (True) or play it once (False).
+
+    Notes
+    -----
+    Only the atomic positions are updated. Bonds are kept as they are, and
+    actors that do not render the molecule directly, such as :func:`ribbon`
+    or :func:`bounding_box`, are not updated.
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(
+        self, molecule, frames, *, actors=None, fps=30, read_ahead=2, loop=True
+    ):
+        if isinstance(frames, str):
+            frames = np.load(frames, mmap_mode="r")
+        n_atoms = molecule.total_num_atoms
+        if frames.ndim != 3 or frames.shape[1:] != (n_atoms, 3):
+            raise ValueError(
+                f"frames should be an array of shape (F, {n_atoms}, 3), "
+                f"got {frames.shape}."
+            )
+        super(Trajectory, self).__init__(length=len(frames) / fps, loop=loop)
+        if actors is not None:
+            # The actors are not transformed, only their molecule is updated.
+            self.add_static_actor(actors)
+        self._molecule = molecule
+        self._frames = frames
+        self._fps = fps
+        self._read_ahead = read_ahead
+        self._positions = get_all_atomic_positions(molecule)
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(max_workers=1) if read_ahead else None
+        self._frame = None
+        self.add_update_callback(self._update_frame)
+
+    def _load_frame(self, index):
+        return np.array(self._frames[index], dtype=self._positions.dtype)
+
+    def _prefetch(self, index):
+        """Schedule the loading of the frames following ``index``."""
+        upcoming = range(index + 1, index + 1 + self._read_ahead)
+        if self._loop:
+            upcoming = [i % self.n_frames for i in upcoming]
+        else:
+            upcoming = [i for i in upcoming if i < self.n_frames]
+        for i in set(self._pending) - set(upcoming):
+            self._pending.pop(i).cancel()
+        for i in upcoming:
+            if i not in self._pending:
+                self._pending[i] = self._executor.submit(self._load_frame, i)
+
+    def _update_frame(self, time):
+        self.set_frame(int(time * self._fps))
+
+    def set_frame(self, index):
+        """Copy the coordinates of a frame into the molecule.
+
+        Parameters
+        ----------
+        index : int
+            Index of the frame, clipped to the range of the trajectory.
+
+        """
+        index = min(max(int(index), 0), self.n_frames - 1)
+        if index == self._frame:
+            return
+        future = self._pending.pop(index, None)
+        if future is not None and not future.cancel():
+            self._positions[:] = future.result()
+        else:
+            self._positions[:] = self._frames[index]
+        self._frame = index
+        if self._executor is not None:
+            self._prefetch(index)
+        self._molecule.GetAtomicPositionArray().Modified()
+        self._molecule.Modified()
+
+    def close(self):
+        """Stop loading the frames in the background."""
+        if self._executor is not None:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def molecule(self):
+        """Return the molecule updated by the trajectory."""
+        return self._molecule
+
+    @property
+    def n_frames(self):
+        """Return the number of frames of the trajectory."""
+        return len(self._frames)
+
+    @property
+    def frame(self):
+        """Return the index of the displayed frame, None before the first one."""
+        return self._frame
+
+    @property
+    def fps(self):
+        """Return the number of frames played per second."""
+        return self._fps
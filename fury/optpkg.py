@@ -1,15 +1,13 @@
 """Routines to support optional packages."""
 
 import importlib
+import importlib.util
 
 from fury.decorators import warn_on_args_to_kwargs
 
-try:
-    import pytest
-except ImportError:
-    have_pytest = False
-else:
-    have_pytest = True
+# pytest is only needed by the ``setup_module`` helpers, check for it without
+# paying its import cost on every ``import fury.*``.
+have_pytest = importlib.util.find_spec("pytest") is not None
 
 
 class TripWireError(AttributeError):
@@ -131,6 +129,8 @@ def optional_package(name, *, trip_msg=None):
 
     def setup_module():
         if have_pytest:
+            import pytest
+
             pytest.mark.skip("No {0} for these tests".format(name))
 
     return pkg, False, setup_module
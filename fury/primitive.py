@@ -5,7 +5,6 @@ from os.path import join as pjoin
 
 import numpy as np
 from packaging.version import parse
-from scipy.spatial import ConvexHull
 from scipy.version import short_version
 
 from fury.data import DATA_DIR
@@ -39,6 +38,8 @@ def faces_from_sphere_vertices(vertices):
         Indices into vertices; forms triangular faces.
 
     """
+    from scipy.spatial import ConvexHull
+
     hull = ConvexHull(vertices, qhull_options="Qbb Qc")
     faces = np.ascontiguousarray(hull.simplices)
     if len(vertices) < 2**16:
@@ -105,6 +106,44 @@ def repeat_primitive_function(
     )
 
 
+def _rotation_matrices_from_x(directions):
+    """Rotation matrices aligning the X axis with each direction.
+
+    Parameters
+    ----------
+    directions : ndarray, shape (N, 3)
+        Target directions, not necessarily normalized.
+
+    Returns
+    -------
+    rotation_matrices : ndarray, shape (N, 3, 3)
+        Rodrigues rotation matrices. Null directions give the identity.
+
+    """
+    directions = np.asarray(directions, dtype=np.float64)
+    norms = np.linalg.norm(directions, axis=1)
+    valid = norms > 0
+    dirs = np.zeros_like(directions)
+    np.divide(directions, norms[:, None], out=dirs, where=valid[:, None])
+
+    # Normal vector of the object.
+    v = np.cross(np.array([1.0, 0.0, 0.0]), dirs)
+    c = dirs[:, 0]
+    v1, v2, v3 = v.T
+    zeros = np.zeros_like(v1)
+    vmat = np.stack([zeros, -v3, v2, v3, zeros, -v1, -v2, v1, zeros], axis=-1).reshape(
+        (-1, 3, 3)
+    )
+
+    opposite = c == -1.0
+    h = np.zeros_like(c)
+    np.divide(1, 1 + c, out=h, where=~opposite)
+    rotation_matrices = np.eye(3) + vmat + np.matmul(vmat, vmat) * h[:, None, None]
+    rotation_matrices[opposite] = -np.eye(3)
+    rotation_matrices[~valid] = np.eye(3)
+    return rotation_matrices
+
+
 @warn_on_args_to_kwargs()
 def repeat_primitive(
     vertices,
@@ -149,32 +188,29 @@ def repeat_primitive(
         Expanded centers for all vertices/faces
 
     """
-    # duplicated vertices if needed
-    if not have_tiled_verts:
-        vertices = np.tile(vertices, (centers.shape[0], 1))
-    big_vertices = vertices
-    # Get unit shape
-    unit_verts_size = vertices.shape[0] // centers.shape[0]
-    unit_triangles_size = faces.shape[0]
+    n_centers = centers.shape[0]
+    # view the vertices as (N, V, 3) to process all the instances at once
+    if have_tiled_verts:
+        vertices = vertices.reshape((n_centers, -1, vertices.shape[-1]))
+    else:
+        vertices = vertices[None]
+    unit_verts_size = vertices.shape[1]
+    big_vertices = np.empty((n_centers,) + vertices.shape[1:], dtype=vertices.dtype)
 
     # scale them
-    if not isinstance(scales, np.ndarray):
-        scales = np.array(scales)
-    if scales.ndim == 1:
-        if scales.size == centers.shape[0]:
-            scales = np.repeat(scales, unit_verts_size, axis=0)
-            scales = scales.reshape((big_vertices.shape[0], 1))
+    scales = np.asarray(scales)
+    if scales.ndim == 1 and scales.size == n_centers:
+        scales = scales.reshape((n_centers, 1, 1))
     elif scales.ndim == 2:
-        scales = np.repeat(scales, unit_verts_size, axis=0)
-    big_vertices *= scales
+        scales = scales[:, None, :]
+    np.multiply(vertices, scales, out=big_vertices)
 
     # update triangles
-    big_triangles = np.array(np.tile(faces, (centers.shape[0], 1)), dtype=np.int32)
-    big_triangles += np.repeat(
-        np.arange(0, centers.shape[0] * unit_verts_size, step=unit_verts_size),
-        unit_triangles_size,
-        axis=0,
-    ).reshape((big_triangles.shape[0], 1))
+    offsets = np.arange(0, n_centers * unit_verts_size, step=unit_verts_size)
+    big_triangles = np.asarray(faces, dtype=np.int32)[None] + offsets.astype(
+        np.int32
+    ).reshape((n_centers, 1, 1))
+    big_triangles = big_triangles.reshape((-1, faces.shape[-1]))
 
     @warn_on_args_to_kwargs()
     def normalize_input(arr, *, arr_name=""):
@@ -183,9 +219,9 @@ def repeat_primitive(
             and len(arr) in [3, 4]
             and not all(isinstance(i, (list, tuple, np.ndarray)) for i in arr)
         ):
-            return np.array([arr] * centers.shape[0])
+            return np.broadcast_to(np.asarray(arr), (n_centers, len(arr)))
         elif isinstance(arr, np.ndarray) and len(arr) == 1:
-            return np.repeat(arr, centers.shape[0], axis=0)
+            return np.broadcast_to(arr, (n_centers,) + arr.shape[1:])
         elif arr is None:
             return np.array([])
         elif len(arr) != len(centers):
@@ -197,43 +233,31 @@ def repeat_primitive(
 
     # update colors
     colors = normalize_input(colors, arr_name="colors")
-    big_colors = np.repeat(colors, unit_verts_size, axis=0)
-    big_colors *= 255
+    big_colors = colors * 255
+    if big_colors.ndim == 2:
+        big_colors = np.broadcast_to(
+            big_colors[:, None], (n_centers, unit_verts_size, big_colors.shape[-1])
+        ).reshape((-1, big_colors.shape[-1]))
 
     # update orientations
     directions = normalize_input(directions, arr_name="directions")
-    for pts, dirs in enumerate(directions):
-        # Normal vector of the object.
-        dir_abs = np.linalg.norm(dirs)
-        if dir_abs:
-            normal = np.array([1.0, 0.0, 0.0])
-            dirs = dirs / dir_abs
-            v = np.cross(normal, dirs)
-            c = np.dot(normal, dirs)
-
-            v1, v2, v3 = v
-
-            Vmat = np.array([[0, -v3, v2], [v3, 0, -v1], [-v2, v1, 0]])
-
-            if c == -1.0:
-                rotation_matrix = -np.eye(3, dtype=np.float64)
-            else:
-                h = 1 / (1 + c)
-                rotation_matrix = (
-                    np.eye(3, dtype=np.float64) + Vmat + (Vmat.dot(Vmat) * h)
-                )
-
+    if directions.size:
+        if directions.strides[0] == 0:
+            # same orientation for all the instances, one matrix is enough
+            rotation_matrix = _rotation_matrices_from_x(directions[:1])[0]
+            np.matmul(big_vertices, rotation_matrix.T, out=big_vertices)
         else:
-            rotation_matrix = np.identity(3)
-
-        big_vertices[pts * unit_verts_size : (pts + 1) * unit_verts_size] = np.dot(
-            rotation_matrix[:3, :3],
-            big_vertices[pts * unit_verts_size : (pts + 1) * unit_verts_size].T,
-        ).T
+            rotation_matrices = _rotation_matrices_from_x(directions)
+            np.matmul(
+                big_vertices, rotation_matrices.transpose((0, 2, 1)), out=big_vertices
+            )
 
     # apply centers position
-    big_centers = np.repeat(centers, unit_verts_size, axis=0)
-    big_vertices += big_centers
+    big_vertices += centers[:, None]
+    big_vertices = big_vertices.reshape((-1, big_vertices.shape[-1]))
+    big_centers = np.broadcast_to(
+        centers[:, None], (n_centers, unit_verts_size, centers.shape[-1])
+    ).reshape((-1, centers.shape[-1]))
 
     return big_vertices, big_triangles, big_colors, big_centers
 
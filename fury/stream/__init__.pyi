@@ -1,13 +1,16 @@
 __all__ = [
     "FuryStreamClient",
     "FuryStreamInteraction",
+    "coalesce_interactions",
     "interaction_callback",
     "ArrayCircularQueue",
     "GenericCircularQueue",
+    "GenericFrameEncoder",
     "GenericImageBufferManager",
     "GenericMultiDimensionalBuffer",
     "IntervalTimer",
     "IntervalTimerThreading",
+    "JpegFrameEncoder",
     "RawArrayImageBufferManager",
     "RawArrayMultiDimensionalBuffer",
     "SharedMemCircularQueue",
@@ -27,14 +30,21 @@ from . import (
     tools,
     widget as widget,
 )
-from .client import FuryStreamClient, FuryStreamInteraction, interaction_callback
+from .client import (
+    FuryStreamClient,
+    FuryStreamInteraction,
+    coalesce_interactions,
+    interaction_callback,
+)
 from .tools import (
     ArrayCircularQueue,
     GenericCircularQueue,
+    GenericFrameEncoder,
     GenericImageBufferManager,
     GenericMultiDimensionalBuffer,
     IntervalTimer,
     IntervalTimerThreading,
+    JpegFrameEncoder,
     RawArrayImageBufferManager,
     RawArrayMultiDimensionalBuffer,
     SharedMemCircularQueue,
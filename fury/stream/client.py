@@ -57,6 +57,7 @@ class FuryStreamClient:
         use_raw_array=True,
         whithout_iren_start=False,
         num_buffers=2,
+        skip_unchanged=False,
     ):
         """A StreamClient extracts a framebuffer from the OpenGL context
         and writes into a shared memory resource.
@@ -77,6 +78,9 @@ class FuryStreamClient:
         num_buffers : int, optional
             Number of buffers to be used in the n-buffering
             technique.
+        skip_unchanged : bool, optional
+            Do not write a rendered frame identical to the previous one, so
+            that a static view is neither copied nor encoded again.
 
         """
         self._whithout_iren_start = whithout_iren_start
@@ -107,11 +111,15 @@ class FuryStreamClient:
 
         if use_raw_array:
             self.img_manager = RawArrayImageBufferManager(
-                max_window_size=max_window_size, num_buffers=num_buffers
+                max_window_size=max_window_size,
+                num_buffers=num_buffers,
+                skip_unchanged=skip_unchanged,
             )
         else:
             self.img_manager = SharedMemImageBufferManager(
-                max_window_size=max_window_size, num_buffers=num_buffers
+                max_window_size=max_window_size,
+                num_buffers=num_buffers,
+                skip_unchanged=skip_unchanged,
             )
 
         self._id_timer = None
@@ -211,25 +219,44 @@ class FuryStreamClient:
                 print(f"Shared Memory {name}(buffer image) File not found")
 
 
-def interaction_callback(circular_queue, showm, iren, render_after):
-    """This callback is used to invoke vtk interaction events
-    reading those events from the provided circular_queue instance
+def coalesce_interactions(interactions):
+    """Merge consecutive redundant interaction events.
+
+    Consecutive mouse move events with the same modifier keys are replaced
+    by the last one and consecutive mouse wheel events are summed.
 
     Parameters
     ----------
-    circular_queue : CircularQueue
-    showm : ShowmManager
-    iren : vtkInteractor
-    render_after : bool, optional
-        If the render method should be called after an
-        dequeue
+    interactions : ndarray
+        Array of shape (N, _CQUEUE.dimension) of events in FIFO order.
+
+    Returns
+    -------
+    interactions : ndarray
+        Array of shape (M, _CQUEUE.dimension) with M <= N.
 
     """
-    ts = time.time() * 1000
-    data = circular_queue.dequeue()
-    if data is None:
-        return
+    event_ids, index_info = _CQUEUE.event_ids, _CQUEUE.index_info
+    coalescable = (event_ids.mouse_move, event_ids.mouse_weel)
+    modifiers = [0, index_info.ctrl, index_info.shift]
+    coalesced = []
+    for data in interactions:
+        if (
+            coalesced
+            and data[0] in coalescable
+            and np.all(coalesced[-1][modifiers] == data[modifiers])
+        ):
+            weel = coalesced[-1][index_info.weel]
+            coalesced[-1] = data.copy()
+            if data[0] == event_ids.mouse_weel:
+                coalesced[-1][index_info.weel] += weel
+        else:
+            coalesced.append(data.copy())
+    return np.array(coalesced).reshape((-1, interactions.shape[1]))
+
 
+def _perform_interaction(data, showm, iren):
+    """Invoke the vtk interaction event stored in `data`."""
     user_event_id = data[0]
     user_timestamp = data[_CQUEUE.index_info.user_timestamp]
 
@@ -267,6 +294,35 @@ def interaction_callback(circular_queue, showm, iren, render_after):
         }
         mouse_actions[user_event_id]()
     logging.info("Interaction: time to perform event " + f"{ts-user_timestamp:.2f} ms")
+
+
+def interaction_callback(circular_queue, showm, iren, render_after, *, max_events=None):
+    """This callback is used to invoke vtk interaction events
+    reading those events from the provided circular_queue instance
+
+    All the waiting events are dequeued at once, consecutive redundant
+    events are coalesced and the scene is rendered once.
+
+    Parameters
+    ----------
+    circular_queue : CircularQueue
+    showm : ShowmManager
+    iren : vtkInteractor
+    render_after : bool, optional
+        If the render method should be called after an
+        dequeue
+    max_events : int, optional
+        Maximum number of events to dequeue per call. All the waiting
+        events by default.
+
+    """
+    interactions = circular_queue.dequeue_many(max_events=max_events)
+    if len(interactions) == 0:
+        return
+
+    for data in coalesce_interactions(interactions):
+        _perform_interaction(data, showm, iren)
+
     if render_after:
         showm.window.Render()
         showm.iren.Render()
@@ -299,11 +355,11 @@ class FuryStreamInteraction:
         self.iren = self.showm.iren
         if use_raw_array:
             self.circular_queue = ArrayCircularQueue(
-                max_size=max_queue_size, dimension=_CQUEUE.dimension
+                max_size=max_queue_size, dimension=_CQUEUE.dimension, coalesce=True
             )
         else:
             self.circular_queue = SharedMemCircularQueue(
-                max_size=max_queue_size, dimension=_CQUEUE.dimension
+                max_size=max_queue_size, dimension=_CQUEUE.dimension, coalesce=True
             )
 
         self._id_timer = None
@@ -7,6 +7,7 @@ from .async_app import (
     get_app as get_app,
     index as index,
     javascript as javascript,
+    metrics_handler as metrics_handler,
     mjpeg_handler as mjpeg_handler,
     offer as offer,
     on_shutdown as on_shutdown,
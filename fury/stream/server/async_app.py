@@ -49,11 +49,23 @@ async def mjpeg_handler(request):
     """This async function it's responsible
     to create the MJPEG streaming.
 
+    A frame is sent only when the frame id of the image buffer manager
+    changed. The encoded frames are shared by all the clients.
+
     Notes
     -----
     endpoint : /video/mjpeg
+    query parameters : scale, a downscaling factor in (0, 1]
 
     """
+    try:
+        scale = float(request.query.get("scale", 1))
+    except ValueError:
+        raise web.HTTPBadRequest(reason="scale must be a number") from None
+    if not 0 < scale <= 1:
+        raise web.HTTPBadRequest(reason="scale must be in (0, 1]")
+    ms_jpeg = request.app.get("ms_jpeg", 33)
+
     my_boundary = "image-boundary"
     response = web.StreamResponse(
         status=200,
@@ -64,8 +76,15 @@ async def mjpeg_handler(request):
     )
     await response.prepare(request)
     image_buffer_manager = request.app["image_buffer_manager"]
+    last_frame_id = None
     while True:
-        jpeg_bytes = await image_buffer_manager.async_get_jpeg()
+        frame_id = image_buffer_manager.frame_id
+        if frame_id == last_frame_id:
+            image_buffer_manager.encoder.count_skipped()
+            await asyncio.sleep(ms_jpeg / 1000)
+            continue
+        last_frame_id = frame_id
+        jpeg_bytes = await image_buffer_manager.async_get_jpeg(ms=ms_jpeg, scale=scale)
         with MultipartWriter("image/jpeg", boundary=my_boundary) as mpwriter:
             mpwriter.append(jpeg_bytes, {"Content-Type": "image/jpeg"})
             try:
@@ -76,6 +95,27 @@ async def mjpeg_handler(request):
         await response.write(b"\r\n")
 
 
+async def metrics_handler(request):
+    """Return the frame encoder and interaction queue metrics as JSON.
+
+    Notes
+    -----
+    endpoint : /metrics
+
+    """
+    image_buffer_manager = request.app["image_buffer_manager"]
+    metrics = image_buffer_manager.encoder.metrics
+    circular_queue = request.app.get("circular_queue")
+    if circular_queue is not None:
+        metrics["queue"] = {
+            "depth": circular_queue.depth,
+            "max_size": circular_queue.buffer.max_size,
+            "dropped": circular_queue.dropped,
+            "coalesced": circular_queue.coalesced,
+        }
+    return web.json_response(metrics)
+
+
 async def offer(request, **kwargs):
     video = kwargs["video"]
     if "broadcast" in kwargs and kwargs["broadcast"]:
@@ -226,6 +266,7 @@ def get_app(
     image_buffer_manager=None,
     provides_mjpeg=False,
     broadcast=True,
+    ms_jpeg=33,
 ):
     if folder is None:
         folder = f"{os.path.dirname(__file__)}/www/"
@@ -256,8 +297,11 @@ def get_app(
         app.router.add_get("/js/%s" % js, partial(javascript, folder=folder, js=js))
 
     app["image_buffer_manager"] = image_buffer_manager
+    app["ms_jpeg"] = ms_jpeg
+    app["circular_queue"] = circular_queue
     if provides_mjpeg:
         app.router.add_get("/video/mjpeg", mjpeg_handler)
+        app.router.add_get("/metrics", metrics_handler)
 
     if rtc_server is not None:
         app.router.add_post(
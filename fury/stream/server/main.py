@@ -9,6 +9,7 @@ from fury.stream.constants import PY_VERSION_8, _CQUEUE
 from fury.stream.server.async_app import get_app
 from fury.stream.tools import (
     ArrayCircularQueue,
+    JpegFrameEncoder,
     RawArrayImageBufferManager,
     SharedMemCircularQueue,
     SharedMemImageBufferManager,
@@ -124,6 +125,7 @@ def web_server_raw_array(
     provides_mjpeg=True,
     provides_webrtc=True,
     ms_jpeg=16,
+    jpeg_quality=75,
     run_app=True,
 ):
     """This will create a streaming webserver running on the
@@ -161,13 +163,17 @@ def web_server_raw_array(
         This it's used  only if the MJPEG will be used. The
         ms_jpeg represents the amount of milliseconds between to
         consecutive calls of the jpeg encoding.
+    jpeg_quality : int, optional
+        Quality of the MJPEG frames, from 1 (smallest) to 95 (best).
     run_app : bool, default True
         This will run the aiohttp application. The False condition
         is used just to be able to test the server.
 
     """
     image_buffer_manager = RawArrayImageBufferManager(
-        image_buffers=image_buffers, info_buffer=info_buffer
+        image_buffers=image_buffers,
+        info_buffer=info_buffer,
+        encoder=JpegFrameEncoder(quality=jpeg_quality),
     )
 
     rtc_server = None
@@ -183,6 +189,7 @@ def web_server_raw_array(
             dimension=_CQUEUE.dimension,
             head_tail_buffer=queue_head_tail_buffer,
             buffer=queue_buffer,
+            coalesce=True,
         )
 
     app_fury = get_app(
@@ -190,6 +197,7 @@ def web_server_raw_array(
         circular_queue=circular_queue,
         image_buffer_manager=image_buffer_manager,
         provides_mjpeg=provides_mjpeg,
+        ms_jpeg=ms_jpeg,
     )
 
     if run_app:
@@ -217,6 +225,7 @@ def web_server(
     provides_webrtc=True,
     avoid_unlink_shared_mem=True,
     ms_jpeg=16,
+    jpeg_quality=75,
     run_app=True,
 ):
     """This will create a streaming webserver running on the given port
@@ -257,6 +266,8 @@ def web_server(
         This it's used  only if the MJPEG will be used. The
         ms_jpeg represents the amount of milliseconds between to
         consecutive calls of the jpeg encoding.
+    jpeg_quality : int, optional
+        Quality of the MJPEG frames, from 1 (smallest) to 95 (best).
     run_app : bool, default True
         This will run the aiohttp application. The False condition
         is used just to be able to test the server.
@@ -266,7 +277,9 @@ def web_server(
         remove_shm_from_resource_tracker()
 
     image_buffer_manager = SharedMemImageBufferManager(
-        image_buffer_names=image_buffer_names, info_buffer_name=info_buffer_name
+        image_buffer_names=image_buffer_names,
+        info_buffer_name=info_buffer_name,
+        encoder=JpegFrameEncoder(quality=jpeg_quality),
     )
 
     rtc_server = None
@@ -282,6 +295,7 @@ def web_server(
             dimension=_CQUEUE.dimension,
             buffer_name=queue_buffer_name,
             head_tail_buffer_name=queue_head_tail_buffer_name,
+            coalesce=True,
         )
 
     app_fury = get_app(
@@ -289,6 +303,7 @@ def web_server(
         circular_queue=circular_queue,
         image_buffer_manager=image_buffer_manager,
         provides_mjpeg=provides_mjpeg,
+        ms_jpeg=ms_jpeg,
     )
 
     if run_app:
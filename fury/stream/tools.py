@@ -1,16 +1,16 @@
 from abc import ABC, abstractmethod
 import asyncio
+from collections import OrderedDict
 import io
 import logging
 import multiprocessing
 from threading import Timer
 import time
 
-from PIL import Image, ImageDraw
 import numpy as np
 
 from fury.decorators import warn_on_args_to_kwargs
-from fury.stream.constants import PY_VERSION_8
+from fury.stream.constants import PY_VERSION_8, _CQUEUE
 
 if PY_VERSION_8:
     from multiprocessing import resource_tracker, shared_memory
@@ -28,6 +28,9 @@ _INT_SIZE = np.dtype(_INT_ShM_TYPE).itemsize
 _UINT_SIZE = np.dtype(_UINT_ShM_TYPE).itemsize
 _BYTE_SIZE = np.dtype(_BYTE_ShM_TYPE).itemsize
 
+# Bytes of a frame compared at once when looking for unchanged frames.
+_COMPARE_CHUNK_SIZE = 256 * 1024
+
 
 def remove_shm_from_resource_tracker():
     """Monkey-patch multiprocessing.resource_tracker so SharedMemory won't
@@ -284,6 +287,7 @@ class GenericCircularQueue(ABC):
         use_shared_mem=False,
         buffer=None,
         buffer_name=None,
+        coalesce=False,
     ):
         """Initialize the circular queue.
 
@@ -300,8 +304,14 @@ class GenericCircularQueue(ABC):
             using SharedMemory or RawArrays
         buffer : RawArray, optional
         buffer_name: str, optional
+        coalesce : bool, default False
+            If True, a mouse move or a mouse wheel event is merged into the
+            last queued event when both have the same type and modifier
+            keys, instead of taking a new slot. Requires the
+            _CQUEUE.dimension layout.
 
         """
+        self.coalesce = coalesce
         self._created = False
         self.head_tail_buffer_name = None
         self.head_tail_buffer_repr = None
@@ -343,9 +353,54 @@ class GenericCircularQueue(ABC):
             _INT_ShM_TYPE
         )
 
+    @property
+    def depth(self):
+        """Return the number of events waiting in the queue."""
+        head, tail = int(self.head), int(self.tail)
+        if head == -1:
+            return 0
+        return (tail - head) % self.buffer.max_size + 1
+
+    @property
+    def dropped(self):
+        """Return the number of events rejected because the queue was full
+        or locked.
+        """
+        return int(self.head_tail_buffer_repr[3])
+
+    @property
+    def coalesced(self):
+        """Return the number of events merged into the last queued event."""
+        return int(self.head_tail_buffer_repr[4])
+
+    def _count_dropped(self):
+        self.head_tail_buffer_repr[3] += 1
+
+    def _coalesce_into_tail(self, data):
+        """Merge `data` into the last queued event if they are redundant."""
+        if not self.coalesce or self.head == -1:
+            return False
+        event_ids, index_info = _CQUEUE.event_ids, _CQUEUE.index_info
+        event_id = data[0]
+        if event_id not in (event_ids.mouse_move, event_ids.mouse_weel):
+            return False
+        last = self.buffer[self.tail]
+        modifiers = [index_info.ctrl, index_info.shift]
+        if last[0] != event_id or np.any(last[modifiers] != data[modifiers]):
+            return False
+        if event_id == event_ids.mouse_weel:
+            data = data.copy()
+            data[index_info.weel] += last[index_info.weel]
+        self.buffer[self.tail] = data
+        self.head_tail_buffer_repr[4] += 1
+        return True
+
     def _enqueue(self, data):
         ok = False
-        if (self.tail + 1) % self.buffer.max_size == self.head:
+        if self._coalesce_into_tail(data):
+            ok = True
+        elif (self.tail + 1) % self.buffer.max_size == self.head:
+            self._count_dropped()
             ok = False
         else:
             if self.head == -1:
@@ -369,6 +424,24 @@ class GenericCircularQueue(ABC):
                 self.set_head_tail(-1, -1, 1)
         return interactions
 
+    def _dequeue_many(self, max_events=None):
+        head, tail = int(self.head), int(self.tail)
+        if head == -1:
+            return np.empty((0, self.buffer.dimension))
+        max_size = self.buffer.max_size
+        num_events = (tail - head) % max_size + 1
+        if max_events is not None:
+            num_events = min(num_events, max_events)
+        rows = self.buffer._buffer_repr[: max_size * self.buffer.dimension].reshape(
+            (max_size, self.buffer.dimension)
+        )
+        interactions = rows[(head + np.arange(num_events)) % max_size]
+        if (head + num_events - 1) % max_size == tail:
+            self.set_head_tail(-1, -1, 1)
+        else:
+            self.head = (head + num_events) % max_size
+        return interactions
+
     @abstractmethod
     def enqueue(self, data):
         pass  # pragma: no cover
@@ -377,6 +450,25 @@ class GenericCircularQueue(ABC):
     def dequeue(self):
         pass  # pragma: no cover
 
+    @abstractmethod
+    def dequeue_many(self, *, max_events=None):
+        """Dequeue the waiting events at once.
+
+        Parameters
+        ----------
+        max_events : int, optional
+            Maximum number of events to dequeue. All the waiting events
+            by default.
+
+        Returns
+        -------
+        interactions : ndarray
+            Array of shape (N, dimension) in FIFO order. N is 0 when the
+            queue is empty.
+
+        """
+        pass  # pragma: no cover
+
     @abstractmethod
     def load_mem_resource(self):
         pass  # pragma: no cover
@@ -396,7 +488,15 @@ class ArrayCircularQueue(GenericCircularQueue):
     """
 
     @warn_on_args_to_kwargs()
-    def __init__(self, *, max_size=10, dimension=6, head_tail_buffer=None, buffer=None):
+    def __init__(
+        self,
+        *,
+        max_size=10,
+        dimension=6,
+        head_tail_buffer=None,
+        buffer=None,
+        coalesce=False,
+    ):
         """Stream system uses that to implement user interactions
 
         Parameters
@@ -415,6 +515,9 @@ class ArrayCircularQueue(GenericCircularQueue):
             If buffer  is not passed to __init__
             then the multidimensional buffer obj will create a new
             RawArray to store the data
+        coalesce : bool, default False
+            If True, redundant mouse move and wheel events are merged
+            into the last queued event.
 
         """
         super().__init__(
@@ -422,6 +525,7 @@ class ArrayCircularQueue(GenericCircularQueue):
             dimension=dimension,
             use_shared_mem=False,
             buffer=buffer,
+            coalesce=coalesce,
         )
 
         if head_tail_buffer is None:
@@ -442,7 +546,10 @@ class ArrayCircularQueue(GenericCircularQueue):
     def create_mem_resource(self):
         # head_tail_arr[0] int; head position
         # head_tail_arr[1] int; tail position
-        head_tail_arr = np.array([-1, -1, 0], dtype=_INT_ShM_TYPE)
+        # head_tail_arr[2] int; lock
+        # head_tail_arr[3] int; number of dropped events
+        # head_tail_arr[4] int; number of coalesced events
+        head_tail_arr = np.array([-1, -1, 0, 0, 0], dtype=_INT_ShM_TYPE)
         self.head_tail_buffer = multiprocessing.Array(
             _INT_ShM_TYPE,
             head_tail_arr,
@@ -459,6 +566,12 @@ class ArrayCircularQueue(GenericCircularQueue):
             interactions = self._dequeue()
         return interactions
 
+    @warn_on_args_to_kwargs()
+    def dequeue_many(self, *, max_events=None):
+        with self.head_tail_buffer.get_lock():
+            interactions = self._dequeue_many(max_events)
+        return interactions
+
     def cleanup(self):
         pass
 
@@ -470,7 +583,13 @@ class SharedMemCircularQueue(GenericCircularQueue):
 
     @warn_on_args_to_kwargs()
     def __init__(
-        self, *, max_size=10, dimension=6, head_tail_buffer_name=None, buffer_name=None
+        self,
+        *,
+        max_size=10,
+        dimension=6,
+        head_tail_buffer_name=None,
+        buffer_name=None,
+        coalesce=False,
     ):
         """Stream system uses that to implement user interactions
 
@@ -489,6 +608,9 @@ class SharedMemCircularQueue(GenericCircularQueue):
         buffer_name : str, optional
             if buffer_name is passed than this Obj will read a
             a already created SharedMemory to create the MultiDimensionalBuffer
+        coalesce : bool, default False
+            If True, redundant mouse move and wheel events are merged
+            into the last queued event.
 
         """
         super().__init__(
@@ -496,6 +618,7 @@ class SharedMemCircularQueue(GenericCircularQueue):
             dimension=dimension,
             use_shared_mem=True,
             buffer_name=buffer_name,
+            coalesce=coalesce,
         )
 
         if head_tail_buffer_name is None:
@@ -507,7 +630,7 @@ class SharedMemCircularQueue(GenericCircularQueue):
             self._created = False
 
         self.head_tail_buffer_repr = np.ndarray(
-            3, dtype=_INT_ShM_TYPE, buffer=self.head_tail_buffer.buf[0 : 3 * _INT_SIZE]
+            5, dtype=_INT_ShM_TYPE, buffer=self.head_tail_buffer.buf[0 : 5 * _INT_SIZE]
         )
         logging.info(
             [
@@ -520,6 +643,17 @@ class SharedMemCircularQueue(GenericCircularQueue):
         )
         if self._created:
             self.set_head_tail(-1, -1, 0)
+        # Events rejected because another process held the lock. They are
+        # counted by this process only, the shared counter can only be
+        # written while holding the lock.
+        self._locked_out = 0
+
+    @property
+    def dropped(self):
+        """Return the number of events rejected because the queue was full,
+        or because it was locked when this process tried to enqueue them.
+        """
+        return super().dropped + self._locked_out
 
     def load_mem_resource(self):
         self.head_tail_buffer = shared_memory.SharedMemory(self.head_tail_buffer_name)
@@ -527,7 +661,10 @@ class SharedMemCircularQueue(GenericCircularQueue):
     def create_mem_resource(self):
         # head_tail_arr[0] int; head position
         # head_tail_arr[1] int; tail position
-        head_tail_arr = np.array([-1, -1, 0], dtype=_INT_ShM_TYPE)
+        # head_tail_arr[2] int; lock
+        # head_tail_arr[3] int; number of dropped events
+        # head_tail_arr[4] int; number of coalesced events
+        head_tail_arr = np.array([-1, -1, 0, 0, 0], dtype=_INT_ShM_TYPE)
         self.head_tail_buffer = shared_memory.SharedMemory(
             create=True, size=head_tail_arr.nbytes
         )
@@ -548,6 +685,8 @@ class SharedMemCircularQueue(GenericCircularQueue):
             self.lock()
             ok = self._enqueue(data)
             self.unlock()
+        else:
+            self._locked_out += 1
         return ok
 
     def dequeue(self):
@@ -558,6 +697,15 @@ class SharedMemCircularQueue(GenericCircularQueue):
             self.unlock()
         return interactions
 
+    @warn_on_args_to_kwargs()
+    def dequeue_many(self, *, max_events=None):
+        interactions = np.empty((0, self.buffer.dimension))
+        if self.is_unlocked():
+            self.lock()
+            interactions = self._dequeue_many(max_events)
+            self.unlock()
+        return interactions
+
     def cleanup(self):
         self.buffer.cleanup()
         self.head_tail_buffer.close()
@@ -575,13 +723,165 @@ class SharedMemCircularQueue(GenericCircularQueue):
                 )
 
 
+class GenericFrameEncoder(ABC):
+    """This implements an abstract (generic) frame encoder.
+
+    The encoded frames are cached by key, usually the frame id of the image
+    buffer manager. Therefore, all the clients watching the same frame share
+    one encoding.
+    """
+
+    mime_type = None
+
+    @warn_on_args_to_kwargs()
+    def __init__(self, *, cache_size=4):
+        """Initialize the frame encoder.
+
+        Parameters
+        ----------
+        cache_size : int, optional
+            Number of encoded frames to keep. Each scale requested by the
+            clients takes an entry.
+
+        """
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        """Reset the encoder counters."""
+        self._metrics = {
+            "frames_encoded": 0,
+            "cache_hits": 0,
+            "frames_skipped": 0,
+            "encode_time": 0.0,
+            "bytes_encoded": 0,
+        }
+
+    @property
+    def metrics(self):
+        """Return the encoder counters and throughput.
+
+        Returns
+        -------
+        dict
+            Number of frames encoded, served from the cache or skipped
+            because they did not change, total encoding time in seconds,
+            total size of the encoded frames in bytes and the encoding
+            throughput in frames per second.
+
+        """
+        metrics = dict(self._metrics)
+        encode_time = metrics["encode_time"]
+        metrics["encode_fps"] = (
+            metrics["frames_encoded"] / encode_time if encode_time > 0 else 0.0
+        )
+        return metrics
+
+    def count_skipped(self):
+        """Count a frame which was not sent because it did not change."""
+        self._metrics["frames_skipped"] += 1
+
+    @warn_on_args_to_kwargs()
+    def encode(self, image, *, key=None, scale=1):
+        """Encode an image, or return the cached encoding of `key`.
+
+        Parameters
+        ----------
+        image : ndarray
+            Image of shape (height, width, 3) with the first row at the top.
+        key : hashable, optional
+            Identifies the content of `image`. If None, the encoding is not
+            cached.
+        scale : float, optional
+            Downscaling factor in (0, 1] applied before encoding.
+
+        Returns
+        -------
+        bytes
+            The encoded image.
+
+        """
+        cache_key = None if key is None else (key, scale)
+        if cache_key is not None and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            self._metrics["cache_hits"] += 1
+            return self._cache[cache_key]
+
+        start = time.perf_counter()
+        data = self._encode(image, scale=scale)
+        self._metrics["encode_time"] += time.perf_counter() - start
+        self._metrics["frames_encoded"] += 1
+        self._metrics["bytes_encoded"] += len(data)
+
+        if cache_key is not None and self.cache_size > 0:
+            self._cache[cache_key] = data
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return data
+
+    @abstractmethod
+    def _encode(self, image, *, scale=1):
+        pass  # pragma: no cover
+
+
+class JpegFrameEncoder(GenericFrameEncoder):
+    """This implements a JPEG frame encoder using Pillow."""
+
+    mime_type = "image/jpeg"
+
+    @warn_on_args_to_kwargs()
+    def __init__(self, *, quality=75, optimize=False, cache_size=4):
+        """Initialize the JPEG frame encoder.
+
+        Parameters
+        ----------
+        quality : int, optional
+            JPEG quality from 1 (smallest) to 95 (best).
+        optimize : bool, optional
+            If True, Pillow makes an extra pass to optimize the Huffman
+            tables. Smaller frames but slower encoding.
+        cache_size : int, optional
+            Number of encoded frames to keep.
+
+        """
+        super().__init__(cache_size=cache_size)
+        self.quality = quality
+        self.optimize = optimize
+
+    def _encode(self, image, *, scale=1):
+        from PIL import Image
+
+        image_encoded = Image.fromarray(np.ascontiguousarray(image), mode="RGB")
+        if scale != 1:
+            width, height = image_encoded.size
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            image_encoded = image_encoded.resize(size, Image.BILINEAR)
+        bytes_img_data = io.BytesIO()
+        image_encoded.save(
+            bytes_img_data,
+            format="jpeg",
+            quality=self.quality,
+            optimize=self.optimize,
+        )
+        return bytes_img_data.getvalue()
+
+
 class GenericImageBufferManager(ABC):
     """This implements a abstract (generic) ImageBufferManager with
     the n-buffer technique.
     """
 
     @warn_on_args_to_kwargs()
-    def __init__(self, *, max_window_size=None, num_buffers=2, use_shared_mem=False):
+    def __init__(
+        self,
+        *,
+        max_window_size=None,
+        num_buffers=2,
+        use_shared_mem=False,
+        encoder=None,
+        skip_unchanged=False,
+    ):
         """Initialize the ImageBufferManager.
 
         Parameters
@@ -593,11 +893,20 @@ class GenericImageBufferManager(ABC):
             Number of buffers to be used in the n-buffering
             technique.
         use_shared_mem: bool, default False
+        encoder : GenericFrameEncoder, optional
+            Encoder used by get_jpeg. Default is a JpegFrameEncoder.
+        skip_unchanged : bool, optional
+            Do not write a frame identical to the current one. Its frame id
+            is kept, so the encoder and the viewers skip it as well.
 
         """
         self.max_window_size = np.array(max_window_size)
         self.num_buffers = num_buffers
-        self.info_buffer_size = num_buffers * 2 + 2
+        self.skip_unchanged = skip_unchanged
+        # number of components, buffer id, (width, height) of each buffer
+        # and the frame id
+        self.info_buffer_size = num_buffers * 2 + 3
+        self.encoder = JpegFrameEncoder() if encoder is None else encoder
         self._use_shared_mem = use_shared_mem
         self.max_size = None  # int
         self.num_components = 3
@@ -609,6 +918,8 @@ class GenericImageBufferManager(ABC):
         self.info_buffer_repr = None
         self._created = False
 
+        from PIL import Image, ImageDraw
+
         size = (self.max_window_size[0], self.max_window_size[1])
         img = Image.new("RGB", size, color=(0, 0, 0))
 
@@ -631,7 +942,27 @@ class GenericImageBufferManager(ABC):
         return index
 
     def write_into(self, w, h, np_arr):
-        buffer_size = buffer_size = int(h * w * 3)
+        """Write a frame into the next buffer.
+
+        Parameters
+        ----------
+        w : int
+            Width of the frame.
+        h : int
+            Height of the frame.
+        np_arr : ndarray
+            Flat uint8 RGB frame with the first row at the bottom.
+
+        Returns
+        -------
+        bool
+            False if the frame was skipped because it is identical to the
+            current one (``skip_unchanged`` only), True otherwise.
+
+        """
+        buffer_size = int(h * w * 3)
+        if self.skip_unchanged and self._is_current_frame(w, h, np_arr):
+            return False
         next_buffer_index = self.next_buffer_index
 
         if buffer_size == self.max_size:
@@ -646,6 +977,40 @@ class GenericImageBufferManager(ABC):
         self.info_buffer_repr[2 + next_buffer_index * 2] = w
         self.info_buffer_repr[2 + next_buffer_index * 2 + 1] = h
         self.info_buffer_repr[1] = next_buffer_index
+        self.info_buffer_repr[-1] = (int(self.info_buffer_repr[-1]) + 1) % 2**32
+        return True
+
+    def _is_current_frame(self, w, h, np_arr):
+        """Check if a frame is identical to the one in the current buffer."""
+        buffer_size = int(h * w * 3)
+        buffer_index = int(self.info_buffer_repr[1])
+        if (
+            buffer_size > self.max_size
+            or self.info_buffer_repr[2 + buffer_index * 2] != w
+            or self.info_buffer_repr[2 + buffer_index * 2 + 1] != h
+        ):
+            return False
+        # Compare machine words, by chunks to stop at the first difference.
+        word = np.dtype(f"u{np.gcd(buffer_size, 8)}")
+        new = np.asarray(np_arr[:buffer_size]).view(word)
+        current = self.image_reprs[buffer_index][:buffer_size].view(word)
+        chunk = _COMPARE_CHUNK_SIZE // word.itemsize
+        return all(
+            np.array_equal(new[i : i + chunk], current[i : i + chunk])
+            for i in range(0, len(new), chunk)
+        )
+
+    @property
+    def frame_id(self):
+        """Return the id of the last frame written into the buffers.
+
+        The id is incremented (modulo 2**32) by each call to write_into.
+        """
+        if not self._use_shared_mem:
+            image_info = np.frombuffer(self.info_buffer, _UINT_ShM_TYPE)
+        else:
+            image_info = self.info_buffer_repr
+        return int(image_info[-1])
 
     def get_current_frame(self):
         """Get the current frame from the buffer."""
@@ -664,14 +1029,24 @@ class GenericImageBufferManager(ABC):
 
         return self.width, self.height, image
 
-    def get_jpeg(self):
+    @warn_on_args_to_kwargs()
+    def get_jpeg(self, *, scale=1):
         """Returns a jpeg image from the buffer.
 
+        The encoding is cached by frame id, therefore the current frame is
+        encoded only once for all the clients requesting the same scale.
+
+        Parameters
+        ----------
+        scale : float, optional
+            Downscaling factor in (0, 1] applied before encoding.
+
         Returns
         -------
             bytes: jpeg image.
 
         """
+        frame_id = self.frame_id
         width, height, image = self.get_current_frame()
 
         if self._use_shared_mem:
@@ -679,16 +1054,12 @@ class GenericImageBufferManager(ABC):
 
         image = image[0 : width * height * 3].reshape((height, width, 3))
         image = np.flipud(image)
-        image_encoded = Image.fromarray(image, mode="RGB")
-        bytes_img_data = io.BytesIO()
-        image_encoded.save(bytes_img_data, format="jpeg")
-        bytes_img = bytes_img_data.getvalue()
 
-        return bytes_img
+        return self.encoder.encode(image, key=(frame_id, width, height), scale=scale)
 
     @warn_on_args_to_kwargs()
-    async def async_get_jpeg(self, *, ms=33):
-        jpeg = self.get_jpeg()
+    async def async_get_jpeg(self, *, ms=33, scale=1):
+        jpeg = self.get_jpeg(scale=scale)
         await asyncio.sleep(ms / 1000)
         return jpeg
 
@@ -716,6 +1087,8 @@ class RawArrayImageBufferManager(GenericImageBufferManager):
         num_buffers=2,
         image_buffers=None,
         info_buffer=None,
+        encoder=None,
+        skip_unchanged=False,
     ):
         """Initialize the ImageBufferManager.
 
@@ -732,12 +1105,19 @@ class RawArrayImageBufferManager(GenericImageBufferManager):
             frame to be streamed and the respective sizes
         image_buffers : list of buffers, optional
             A list of buffers with each one containing a frame.
+        encoder : GenericFrameEncoder, optional
+            Encoder used by get_jpeg. Default is a JpegFrameEncoder.
+        skip_unchanged : bool, optional
+            Writer side only. Do not write a frame identical to the current
+            one.
 
         """
         super().__init__(
             max_window_size=max_window_size,
             num_buffers=num_buffers,
             use_shared_mem=False,
+            encoder=encoder,
+            skip_unchanged=skip_unchanged,
         )
         if image_buffers is None or info_buffer is None:
             self.create_mem_resource()
@@ -766,10 +1146,12 @@ class RawArrayImageBufferManager(GenericImageBufferManager):
         # 1 id buffer
         # 2, 3, width first buffer, height first buffer
         # 4, 5, width second buffer , height second buffer
+        # -1 frame id
         info_list = [3, 0]
         for _ in range(self.num_buffers):
             info_list += [self.max_window_size[0]]
             info_list += [self.max_window_size[1]]
+        info_list += [0]
         info_list = np.array(info_list, dtype=_UINT_ShM_TYPE)
         self.info_buffer = multiprocessing.RawArray(
             _UINT_ShM_TYPE, np.ctypeslib.as_ctypes(np.array(info_list))
@@ -799,6 +1181,8 @@ class SharedMemImageBufferManager(GenericImageBufferManager):
         num_buffers=2,
         image_buffer_names=None,
         info_buffer_name=None,
+        encoder=None,
+        skip_unchanged=False,
     ):
         """Initialize the ImageBufferManager.
 
@@ -815,6 +1199,11 @@ class SharedMemImageBufferManager(GenericImageBufferManager):
             frame to be streamed and the respective sizes
         image_buffer_names : list of str, optional
             a list of buffer names. Each buffer contains a frame
+        encoder : GenericFrameEncoder, optional
+            Encoder used by get_jpeg. Default is a JpegFrameEncoder.
+        skip_unchanged : bool, optional
+            Writer side only. Do not write a frame identical to the current
+            one.
 
         Notes
         -----
@@ -825,6 +1214,8 @@ class SharedMemImageBufferManager(GenericImageBufferManager):
             max_window_size=max_window_size,
             num_buffers=num_buffers,
             use_shared_mem=True,
+            encoder=encoder,
+            skip_unchanged=skip_unchanged,
         )
         if image_buffer_names is None or info_buffer_name is None:
             self.create_mem_resource()
@@ -847,10 +1238,11 @@ class SharedMemImageBufferManager(GenericImageBufferManager):
             )
             self.image_buffer_names.append(buffer.name)
 
-        info_list = [2 + self.num_buffers * 2, 1, 3, 0]
+        info_list = [self.info_buffer_size, 1, 3, 0]
         for _ in range(self.num_buffers):
             info_list += [self.max_window_size[0]]
             info_list += [self.max_window_size[1]]
+        info_list += [0]
         info_list = np.array(info_list, dtype=_UINT_ShM_TYPE)
 
         self.info_buffer = shared_memory.SharedMemory(
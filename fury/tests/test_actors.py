@@ -10,6 +10,7 @@ from scipy.ndimage import center_of_mass
 from fury import actor, primitive as fp, shaders, window
 from fury.actor import grid
 from fury.decorators import skip_linux, skip_osx, skip_win
+from fury.lib import RenderWindow, numpy_support
 
 # Allow import, but disable doctests if we don't have dipy
 from fury.optpkg import optional_package
@@ -19,7 +20,15 @@ from fury.testing import (
     assert_greater_equal,
     assert_not_equal,
 )
-from fury.utils import primitives_count_from_actor, rotate, shallow_copy
+from fury.utils import (
+    get_polydata_colors,
+    get_polydata_triangles,
+    get_polydata_vertices,
+    primitives_count_from_actor,
+    rotate,
+    shallow_copy,
+    vertices_from_actor,
+)
 
 # dipy, have_dipy, _ = optional_package('dipy')
 matplotlib, have_matplotlib, _ = optional_package("matplotlib")
@@ -311,6 +320,49 @@ def test_contour_from_label(interactive=False):
     actor.contour_from_label(data)
 
 
+def test_contour_from_label_cells():
+    data = np.zeros((20, 20, 20), dtype=np.int16)
+    data[2:6, 2:6, 2:6] = 4
+    data[10:15, 3:8, 8:12] = 7
+    data[12:18, 12:18, 12:18] = 9
+    color = np.array([[1, 0, 0, 0.5], [0, 1, 0, 1], [0, 0, 1, 1]])
+    affine = np.diag([2.0, 1, 1, 1])
+
+    surface = actor.contour_from_label(data, affine=affine, color=color)
+    surface.GetMapper().Update()
+    polydata = surface.GetMapper().GetInput()
+    labels = numpy_support.vtk_to_numpy(polydata.GetCellData().GetArray("labels"))
+    npt.assert_array_equal(np.unique(labels), [4, 7, 9])
+
+    triangles = get_polydata_triangles(polydata)
+    vertices = get_polydata_vertices(polydata)
+    colors = get_polydata_colors(polydata)
+    for roi_id, roi_color in zip([4, 7, 9], color):
+        roi = actor.contour_from_roi(data == roi_id, affine=affine)
+        roi.GetMapper().Update()
+        roi_vertices = vertices_from_actor(roi)
+        roi_points = np.unique(triangles[labels == roi_id])
+        npt.assert_almost_equal(
+            vertices[roi_points].min(axis=0), roi_vertices.min(axis=0), decimal=5
+        )
+        npt.assert_almost_equal(
+            vertices[roi_points].max(axis=0), roi_vertices.max(axis=0), decimal=5
+        )
+        npt.assert_equal(
+            np.unique(colors[roi_points], axis=0), [np.round(roi_color * 255)]
+        )
+
+    parallel = actor.contour_from_label(data, affine=affine, color=color, n_workers=2)
+    parallel.GetMapper().Update()
+    npt.assert_array_equal(vertices_from_actor(parallel), vertices_from_actor(surface))
+
+    # A volume without labels gives an empty actor.
+    empty = actor.contour_from_label(np.zeros((5, 5, 5)))
+    empty.GetMapper().Update()
+    npt.assert_equal(empty.GetMapper().GetInput().GetNumberOfPoints(), 0)
+    npt.assert_equal(empty.GetMapper().GetInput().GetNumberOfCells(), 0)
+
+
 def test_streamtube_and_line_actors():
     scene = window.Scene()
 
@@ -601,6 +653,224 @@ def test_odf_slicer(interactive=False):
     del odfs
 
 
+def test_odf_slicer_cache():
+    # default sphere of odf_slicer
+    vertices, faces = prim_sphere(name="repulsion100")
+    rng = np.random.default_rng(0)
+    n_coeffs = 15
+    odfs = rng.random((5, 6, 7, n_coeffs))
+    B = rng.random((n_coeffs, len(vertices)))
+    odf_actor = actor.odf_slicer(odfs, B_matrix=B, cache_size=2)
+    npt.assert_equal(len(odf_actor._slice_cache), 1)
+
+    odf_actor.display(x=2)
+    polydata_x = odf_actor.GetMapper().GetInput()
+    sf = odfs[2].reshape(-1, n_coeffs).dot(B)
+    sf /= np.abs(sf).max(axis=-1, keepdims=True)
+    offsets = np.argwhere(np.ones((6, 7)))
+    offsets = np.column_stack([np.full(len(offsets), 2), offsets])
+    expected = (vertices[None] * 0.5 * sf[..., None] + offsets[:, None]).reshape(-1, 3)
+    # vertices are stored in float32
+    npt.assert_almost_equal(vertices_from_actor(odf_actor), expected, decimal=5)
+    npt.assert_equal(
+        odf_actor.GetMapper().GetInput().GetNumberOfPolys(), 6 * 7 * len(faces)
+    )
+
+    # Displaying a cached slice again swaps the polydata back.
+    odf_actor.display(y=1)
+    odf_actor.display(x=2)
+    npt.assert_equal(odf_actor.GetMapper().GetInput() is polydata_x, True)
+    npt.assert_equal(len(odf_actor._slice_cache), 2)
+
+    # The least recently used slice (y=1) is evicted.
+    odf_actor.display(z=3)
+    odf_actor.display(x=2)
+    npt.assert_equal(odf_actor.GetMapper().GetInput() is polydata_x, True)
+    npt.assert_equal(len(odf_actor._slice_cache), 2)
+    npt.assert_equal((0, 4, 1, 1, 0, 6) in odf_actor._slice_cache, False)
+
+    # Slices share the faces tiled for the largest slice.
+    odf_actor.display(z=3)
+    npt.assert_equal(
+        odf_actor.GetMapper().GetInput().GetNumberOfPolys(), 5 * 6 * len(faces)
+    )
+    npt.assert_equal(len(odf_actor._all_faces[0]), 6 * 7 * len(faces))
+
+    # Changing the sphere invalidates the cache.
+    vertices2, faces2 = prim_sphere(name="repulsion200", gen_faces=True)
+    B2 = rng.random((n_coeffs, len(vertices2)))
+    odf_actor.update_sphere(vertices2, faces2, B2)
+    npt.assert_equal(len(odf_actor._slice_cache), 1)
+    npt.assert_equal(len(vertices_from_actor(odf_actor)), 5 * 6 * len(vertices2))
+
+    odf_actor = actor.odf_slicer(odfs, B_matrix=B, cache_size=0)
+    odf_actor.display(x=2)
+    npt.assert_equal(len(odf_actor._slice_cache), 0)
+
+
+def test_odf_slicer_blocks():
+    rng = np.random.default_rng(0)
+    n_coeffs = 15
+    odfs = rng.random((5, 6, 7, n_coeffs)) - 0.2
+    B = rng.random((n_coeffs, 100))
+
+    for colormap, global_cm in [(None, False), ("plasma", False), ("plasma", True)]:
+        polydatas = []
+        # A single block, blocks of a few voxels and blocks built by threads
+        for memory_budget, n_workers in [(None, 1), (50_000, 1), (50_000, 3)]:
+            odf_actor = actor.odf_slicer(
+                odfs,
+                B_matrix=B,
+                colormap=colormap,
+                global_cm=global_cm,
+                memory_budget=memory_budget,
+                n_workers=n_workers,
+            )
+            odf_actor.display(x=2)
+            polydatas.append(odf_actor.GetMapper().GetInput())
+
+        for polydata in polydatas:
+            npt.assert_equal(get_polydata_vertices(polydata).dtype, np.float32)
+            npt.assert_array_equal(
+                get_polydata_vertices(polydata), get_polydata_vertices(polydatas[0])
+            )
+            npt.assert_array_equal(
+                get_polydata_colors(polydata), get_polydata_colors(polydatas[0])
+            )
+            npt.assert_array_equal(
+                get_polydata_triangles(polydata),
+                get_polydata_triangles(polydatas[0]),
+            )
+
+
+def test_odf_slicer_lod():
+    rng = np.random.default_rng(0)
+    n_coeffs = 15
+    odfs = rng.random((10, 10, 1, n_coeffs))
+    B = rng.random((n_coeffs, 100))
+    B_coarse = rng.random((n_coeffs, 6))
+    octahedron = (
+        np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, 0, 0], [0, -1, 0], [0, 0, -1]]),
+        np.array(
+            [[0, 1, 2], [1, 3, 2], [3, 4, 2], [4, 0, 2], [1, 0, 5], [3, 1, 5]]
+            + [[4, 3, 5], [0, 4, 5]]
+        ),
+    )
+
+    odf_actor = actor.odf_slicer(
+        odfs,
+        B_matrix=B,
+        lod_spheres=[octahedron + (B_coarse,), "repulsion200"],
+        lod_thresholds=[25, 1000],
+    )
+    # The main sphere is used until the actor is rendered
+    npt.assert_equal(vertices_from_actor(odf_actor).shape, (100 * 100, 3))
+
+    scene = window.Scene()
+    render_window = RenderWindow()
+    render_window.AddRenderer(scene)
+    render_window.SetSize(300, 300)
+    scene.add(odf_actor)
+    camera = scene.GetActiveCamera()
+    camera.ParallelProjectionOn()
+
+    camera.SetParallelScale(50)
+    npt.assert_equal(odf_actor.update_lod(scene), True)
+    npt.assert_equal(vertices_from_actor(odf_actor).shape, (100 * 6, 3))
+    expected = odfs[..., 0, :].reshape(-1, n_coeffs).dot(B_coarse)
+    expected = 0.5 * expected / np.abs(expected).max(axis=-1, keepdims=True)
+    expected = octahedron[0] * expected[..., None]
+    expected += np.argwhere(np.ones((10, 10, 1)))[:, None]
+    npt.assert_almost_equal(
+        vertices_from_actor(odf_actor), expected.reshape(-1, 3), decimal=5
+    )
+    # The geometry is kept until a threshold is crossed
+    camera.SetParallelScale(20)
+    npt.assert_equal(odf_actor.update_lod(scene), False)
+    camera.SetParallelScale(5)
+    npt.assert_equal(odf_actor.update_lod(scene), True)
+    npt.assert_equal(vertices_from_actor(odf_actor).shape, (100 * 100, 3))
+
+    # With a perspective camera, the closest ODFs get the finer sphere
+    camera.ParallelProjectionOff()
+    camera.SetPosition(-15, 4.5, 3)
+    camera.SetFocalPoint(4.5, 4.5, 0)
+    npt.assert_equal(odf_actor.update_lod(scene), True)
+    levels = odf_actor._levels.reshape((10, 10))
+    npt.assert_equal(levels[0], 1)
+    npt.assert_equal(levels[-1], 0)
+    polydata = odf_actor.GetMapper().GetInput()
+    n_fine = np.count_nonzero(levels)
+    n_vertices = 6 * (100 - n_fine) + 100 * n_fine
+    npt.assert_equal(vertices_from_actor(odf_actor).shape, (n_vertices, 3))
+    npt.assert_equal(get_polydata_colors(polydata).shape, (n_vertices, 3))
+    npt.assert_equal(get_polydata_triangles(polydata).max(), n_vertices - 1)
+
+    # Adding the actor again must not stack another observer, and removing
+    # it must release the one it has.
+    scene.add(odf_actor)
+    npt.assert_equal(len(odf_actor._lod_observers), 1)
+    scene.rm(odf_actor)
+    scene.InvokeEvent("StartEvent")
+    npt.assert_equal(len(odf_actor._lod_observers), 0)
+    npt.assert_equal(scene.HasObserver("StartEvent"), False)
+
+    npt.assert_raises(
+        ValueError,
+        actor.odf_slicer,
+        odfs,
+        B_matrix=B,
+        lod_spheres=["repulsion200"],
+        lod_thresholds=[10, 20],
+    )
+
+
+def test_instanced_glyphs():
+    centers = np.array([[0, 0, 0], [10, 0, 0], [0, 10, 0.0]])
+    colors = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1.0]])
+    glyph_actor = actor.instanced_glyphs(
+        centers, geometry="box", colors=colors, scales=np.array([1, 2, 1])
+    )
+    npt.assert_equal(glyph_actor.n_instances, 3)
+
+    # Only the template is stored, the instances are drawn by the GPU.
+    mapper = glyph_actor.GetMapper()
+    npt.assert_equal(mapper.IsA("vtkGlyph3DMapper"), True)
+    npt.assert_equal(mapper.GetInput().GetNumberOfPoints(), 3)
+    npt.assert_equal(mapper.GetSource().GetNumberOfPoints(), 8)
+    npt.assert_equal(mapper.GetOrient(), False)
+    npt.assert_array_equal(
+        vertices_from_actor(glyph_actor), centers.astype(glyph_actor.centers.dtype)
+    )
+    npt.assert_array_equal(glyph_actor.colors[:, :3], 255 * colors)
+    npt.assert_array_almost_equal(mapper.GetBounds(), (-1, 11, -1, 11, -1, 1))
+
+    # The per-instance arrays are shared with VTK and updated in place.
+    glyph_actor.centers[1] = [20, 0, 0]
+    glyph_actor.update()
+    npt.assert_array_almost_equal(vertices_from_actor(glyph_actor)[1], [20, 0, 0])
+    npt.assert_array_almost_equal(mapper.GetBounds()[1], 21)
+    glyph_actor.scales = 4
+    npt.assert_array_almost_equal(mapper.GetBounds(), (-2, 22, -2, 12, -2, 2))
+    glyph_actor.colors = (1, 1, 1, 0.5)
+    npt.assert_array_equal(glyph_actor.colors, [[255, 255, 255, 127]] * 3)
+    glyph_actor.directions = (0, 0, 1)
+    npt.assert_equal(mapper.GetOrient(), True)
+
+    # Per-axis scales and custom template meshes.
+    vertices, faces = fp.prim_square()
+    glyph_actor = actor.instanced_glyphs(
+        centers,
+        vertices=vertices,
+        faces=faces,
+        directions=(0, 1, 0),
+        scales=[[1, 2, 3]],
+    )
+    npt.assert_equal(glyph_actor.scales.shape, (3, 3))
+    npt.assert_equal(glyph_actor.GetMapper().GetSource().GetNumberOfPoints(), 4)
+    npt.assert_raises(ValueError, actor.instanced_glyphs, centers, geometry="blob")
+
+
 def test_peak_slicer(interactive=False):
     _peak_dirs = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype="f4")
     # peak_dirs.shape = (1, 1, 1) + peak_dirs.shape
@@ -1,8 +1,11 @@
 """Function for testing decorator module."""
 
+from inspect import signature
+
 import numpy.testing as npt
 
 import fury
+from fury import decorators
 from fury.decorators import doctest_skip_parser, warn_on_args_to_kwargs
 from fury.testing import assert_true
 
@@ -93,3 +96,26 @@ def test_warn_on_args_to_kwargs():
     npt.assert_raises(TypeError, func, 1, 3)
 
     fury.__version__ = FURY_CURRENT_VERSION
+
+
+def test_warn_on_args_to_kwargs_signature_cached(monkeypatch):
+    calls = []
+
+    def counting_signature(func):
+        calls.append(func)
+        return signature(func)
+
+    monkeypatch.setattr(decorators, "signature", counting_signature)
+
+    @warn_on_args_to_kwargs()
+    def func(a, b, *, c, d=4, e=5):
+        return a + b + c + d + e
+
+    npt.assert_equal(len(calls), 1)
+    for _ in range(3):
+        npt.assert_equal(func(1, 2, c=3), 15)
+    fury.__version__ = "0.12.0"
+    with npt.assert_warns(UserWarning):
+        npt.assert_equal(func(1, 2, 3, 4, 5), 15)
+    fury.__version__ = FURY_CURRENT_VERSION
+    npt.assert_equal(len(calls), 1)
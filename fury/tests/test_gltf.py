@@ -1,15 +1,18 @@
+import base64
 import itertools
 import os
+from tempfile import TemporaryDirectory as InTemporaryDirectory
 
 from PIL import Image
 import numpy as np
 import numpy.testing as npt
 from packaging.version import parse
+import pygltflib as gltflib
 import pytest
 from scipy.ndimage import center_of_mass
 from scipy.version import short_version
 
-from fury import actor, utils, window
+from fury import actor, transform, utils, window
 from fury.animation import Timeline
 from fury.data import fetch_gltf, read_viz_gltf
 from fury.gltf import export_scene, glTF
@@ -184,6 +187,55 @@ def test_export_gltf():
     npt.assert_equal(res.colors_found, [True, True])
 
 
+def test_export_glb():
+    scene = window.Scene()
+    boxes = []
+    for i in range(3):
+        box = actor.box(np.zeros((1, 3)), colors=(1, 0, 0))
+        box.SetPosition(3 * i, 0, 0)
+        boxes.append(box)
+    sphere = actor.sphere(np.zeros((1, 3)), colors=(0, 1, 0), use_primitive=False)
+    image = np.random.default_rng(0).integers(0, 255, (8, 8, 3), dtype=np.uint8)
+    textured = actor.texture_on_sphere(image)
+    scene.add(*boxes, sphere, textured)
+
+    with InTemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "scene.glb")
+        export_scene(scene, filename=fname)
+        # A single file is written.
+        npt.assert_equal(os.listdir(tmpdir), ["scene.glb"])
+
+        model = gltflib.GLTF2().load(fname)
+        # The boxes share a mesh, placed by the transform of their node.
+        npt.assert_equal(len(model.meshes), 3)
+        npt.assert_equal(len(model.buffers), 1)
+        npt.assert_equal([node.mesh for node in model.nodes[:3]], [0, 0, 0])
+        npt.assert_equal(model.nodes[0].matrix, None)
+        npt.assert_equal(model.nodes[2].matrix[12:15], [6, 0, 0])
+        npt.assert_equal(len(model.images), 1)
+
+        gltf_obj = glTF(fname)
+        actors = gltf_obj.actors()
+        npt.assert_equal(len(actors), 5)
+        for expected, act in zip(scene.GetActors(), actors):
+            npt.assert_array_almost_equal(
+                utils.vertices_from_actor(act), utils.vertices_from_actor(expected)
+            )
+            npt.assert_array_almost_equal(
+                utils.vtk_matrix_to_numpy(act.GetMatrix()),
+                utils.vtk_matrix_to_numpy(expected.GetMatrix()),
+            )
+        texture = gltf_obj.materials[-1]["baseColorTexture"].GetInput()
+        expected = textured.GetTexture().GetInput()
+        npt.assert_array_equal(
+            utils.numpy_support.vtk_to_numpy(texture.GetPointData().GetScalars()),
+            utils.numpy_support.vtk_to_numpy(expected.GetPointData().GetScalars()),
+        )
+
+        export_scene(scene, filename=fname, deduplicate=False)
+        npt.assert_equal(len(gltflib.GLTF2().load(fname).meshes), 5)
+
+
 def test_simple_animation():
     fetch_gltf(name="BoxAnimated", mode="glTF")
     file = read_viz_gltf("BoxAnimated")
@@ -320,6 +372,144 @@ def test_skinning():
     showm.destroy_timer(timer_id)
 
 
+def test_skin_vertices():
+    rng = np.random.default_rng(0)
+    n_vertices, bones = 50, [3, 7, 11]
+    gltf_obj = glTF.__new__(glTF)
+    gltf_obj.bones = bones
+    gltf_obj.joints_0 = [rng.integers(0, len(bones), (n_vertices, 4))]
+    weights = rng.random((n_vertices, 4))
+    gltf_obj.weights_0 = [weights / weights.sum(axis=1, keepdims=True)]
+
+    joint_matrices = {}
+    for bone in bones:
+        joint_matrices[bone] = np.identity(4)
+        joint_matrices[bone][:3] = rng.random((3, 4))
+    vertices = rng.random((n_vertices, 3)).astype(np.float32)
+    transform_mat = np.identity(4)
+    transform_mat[:3] = rng.random((3, 4))
+
+    # Per-vertex reference
+    expected = np.copy(vertices)
+    for i, xyz in enumerate(vertices):
+        skin_mat = sum(
+            w * joint_matrices[bones[j]]
+            for w, j in zip(gltf_obj.weights_0[0][i], gltf_obj.joints_0[0][i])
+        )
+        expected[i] = np.dot(skin_mat, np.append(xyz, 1.0))[:3]
+
+    skinned = gltf_obj.apply_skin_matrix(vertices, joint_matrices)
+    npt.assert_equal(skinned.dtype, vertices.dtype)
+    npt.assert_array_almost_equal(skinned, expected, decimal=5)
+
+    out = np.zeros_like(vertices)
+    bone_matrices = gltf_obj.get_bone_matrices(joint_matrices)
+    res = gltf_obj.skin_vertices(
+        vertices, bone_matrices, transform_mat=transform_mat, out=out
+    )
+    npt.assert_equal(res is out, True)
+    expected = transform.apply_transformation(expected, transform_mat)
+    npt.assert_array_almost_equal(out, expected, decimal=5)
+
+
+def _write_interleaved_models(folder):
+    """Write a mesh in .gltf (.bin and data URI) and .glb files."""
+    rng = np.random.default_rng(0)
+    n_vertices = 24
+    vertices = rng.random((n_vertices, 3)).astype(np.float32)
+    normals = rng.random((n_vertices, 3)).astype(np.float32)
+    indices = rng.integers(0, n_vertices, 36).astype(np.uint32)
+    # Positions and normals are interleaved with a stride of 24 bytes.
+    blob = np.hstack([vertices, normals]).tobytes() + indices.tobytes()
+    model = gltflib.GLTF2(
+        scene=0,
+        scenes=[gltflib.Scene(nodes=[0])],
+        nodes=[gltflib.Node(mesh=0)],
+        meshes=[
+            gltflib.Mesh(
+                primitives=[
+                    gltflib.Primitive(
+                        attributes=gltflib.Attributes(POSITION=0, NORMAL=1),
+                        indices=2,
+                    )
+                ]
+            )
+        ],
+        accessors=[
+            gltflib.Accessor(
+                bufferView=0,
+                componentType=gltflib.FLOAT,
+                count=n_vertices,
+                type=gltflib.VEC3,
+            ),
+            gltflib.Accessor(
+                bufferView=0,
+                byteOffset=12,
+                componentType=gltflib.FLOAT,
+                count=n_vertices,
+                type=gltflib.VEC3,
+            ),
+            gltflib.Accessor(
+                bufferView=1,
+                componentType=gltflib.UNSIGNED_INT,
+                count=len(indices),
+                type=gltflib.SCALAR,
+            ),
+        ],
+        bufferViews=[
+            gltflib.BufferView(buffer=0, byteLength=24 * n_vertices, byteStride=24),
+            gltflib.BufferView(
+                buffer=0, byteOffset=24 * n_vertices, byteLength=indices.nbytes
+            ),
+        ],
+        buffers=[gltflib.Buffer(byteLength=len(blob), uri="model.bin")],
+    )
+    with open(os.path.join(folder, "model.bin"), "wb") as f:
+        f.write(blob)
+    model.save(os.path.join(folder, "model.gltf"))
+    model.buffers[0].uri = (
+        "data:application/octet-stream;base64," + base64.b64encode(blob).decode()
+    )
+    model.save(os.path.join(folder, "embedded.gltf"))
+    model.buffers[0].uri = None
+    model.set_binary_blob(blob)
+    model.save(os.path.join(folder, "model.glb"))
+    return vertices, normals, indices
+
+
+def test_buffer_views():
+    with InTemporaryDirectory() as tmpdir:
+        vertices, normals, indices = _write_interleaved_models(tmpdir)
+        for fname in ["model.gltf", "embedded.gltf", "model.glb"]:
+            gltf_obj = glTF(os.path.join(tmpdir, fname))
+            positions = gltf_obj.get_acc_data(0)
+            npt.assert_array_equal(positions, vertices)
+            npt.assert_array_equal(gltf_obj.get_acc_data(1), normals)
+            npt.assert_array_equal(gltf_obj.get_acc_data(2).ravel(), indices)
+            npt.assert_equal(gltf_obj.get_acc_data(2).dtype, np.uint32)
+
+            # Accessors are strided views of a single buffer, loaded once.
+            npt.assert_equal(positions.strides, (24, 4))
+            npt.assert_equal(positions.flags.writeable, False)
+            buffer = gltf_obj.get_buffer(0)
+            npt.assert_equal(gltf_obj.get_buffer(0) is buffer, True)
+            npt.assert_equal(np.shares_memory(positions, buffer), True)
+            if fname != "embedded.gltf":
+                npt.assert_equal(isinstance(buffer, np.memmap), True)
+
+            points = utils.numpy_support.vtk_to_numpy(
+                gltf_obj.polydatas[0].GetPoints().GetData()
+            )
+            npt.assert_array_equal(points, vertices)
+            del gltf_obj, positions, buffer
+
+        # Binary files are read directly, without conversion to .gltf
+        npt.assert_equal(
+            sorted(os.listdir(tmpdir)),
+            ["embedded.gltf", "model.bin", "model.glb", "model.gltf"],
+        )
+
+
 def test_morphing():
     fetch_gltf(name="MorphStressTest", mode="glTF")
     file = read_viz_gltf("MorphStressTest")
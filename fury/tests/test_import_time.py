@@ -0,0 +1,79 @@
+"""Startup-time regression tests for ``import fury``."""
+
+import os
+import subprocess
+import sys
+
+import numpy.testing as npt
+import pytest
+
+#: Modules that are slow to import and must only be loaded on first use.
+DEFERRED_MODULES = [
+    "matplotlib",
+    "pygltflib",
+    "pytest",
+    "scipy.interpolate",
+    "scipy.ndimage",
+    "scipy.spatial",
+    "vtkmodules.vtkDomainsChemistry",
+]
+
+#: Budget for ``import fury.actor``, as a multiple of the time needed to import
+#: numpy in the same interpreter so that the check holds on slow or busy
+#: machines. Can be overridden with the ``FURY_IMPORT_TIME_BUDGET`` environment
+#: variable.
+IMPORT_TIME_BUDGET = float(os.environ.get("FURY_IMPORT_TIME_BUDGET", 8))
+
+
+def _import_profile(module):
+    """Import ``module`` in a fresh interpreter with ``-X importtime``.
+
+    Returns
+    -------
+    cumulative : dict
+        Cumulative import time in microseconds of each imported module.
+
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumul, name = line.split("|")
+        cumulative[name.strip()] = int(cumul)
+    return cumulative
+
+
+@pytest.mark.parametrize("module", ["fury", "fury.actor", "fury.window"])
+def test_heavy_modules_are_deferred(module):
+    imported = _import_profile(module)
+    npt.assert_(module in imported)
+    for name in DEFERRED_MODULES:
+        npt.assert_(name not in imported, f"{module} eagerly imports {name}")
+
+
+def test_lib_resolves_on_access():
+    code = (
+        "import sys; import fury.lib as lib; "
+        "assert 'vtkmodules.vtkRenderingCore' not in sys.modules; "
+        "lib.Actor; "
+        "assert 'vtkmodules.vtkRenderingOpenGL2' in sys.modules; "
+        "assert 'vtkmodules.vtkIOMINC' not in sys.modules; "
+        "assert 'Actor' in vars(lib)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_time_budget():
+    imported = _import_profile("fury.actor")
+    ratio = imported["fury.actor"] / imported["numpy"]
+    npt.assert_(
+        ratio < IMPORT_TIME_BUDGET,
+        f"import fury.actor took {imported['fury.actor'] / 1000:.0f} ms, "
+        f"{ratio:.1f} times the import of numpy (budget {IMPORT_TIME_BUDGET})",
+    )
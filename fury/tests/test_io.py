@@ -1,6 +1,7 @@
 import os
 from os.path import join as pjoin
 from tempfile import TemporaryDirectory as InTemporaryDirectory
+import threading
 
 from PIL import Image
 import numpy as np
@@ -9,6 +10,7 @@ import pytest
 
 from fury.decorators import skip_osx
 from fury.io import (
+    FrameWriter,
     load_cubemap_texture,
     load_image,
     load_polydata,
@@ -335,3 +337,88 @@ def test_load_text():
         test_file.close()
 
         npt.assert_string_equal(load_text(test_fname), test_file_contents)
+
+
+def test_frame_writer():
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 255, size=(6, 20, 30, 3), dtype=np.uint8)
+
+    with InTemporaryDirectory() as odir:
+        # One image per frame
+        fname = pjoin(odir, "frame_.png")
+        with FrameWriter(fname, numbered=True, max_queue_size=2, n_workers=2) as writer:
+            for frame in frames:
+                writer.submit(frame)
+                # The caller can reuse its buffer once the frame is submitted.
+                frame[:] = 0
+        npt.assert_equal(writer.frames_written, 6)
+        npt.assert_equal(writer.queue_depth, 0)
+        npt.assert_equal(writer.frames_encoded, 6)
+        npt.assert_equal(writer.encode_latency > 0, True)
+        npt.assert_equal(writer.write_time >= 0, True)
+        npt.assert_equal(writer.write_fps > 0, True)
+        npt.assert_equal(sorted(os.listdir(odir))[-1], "frame_000005.png")
+        frames = rng.integers(0, 255, size=(6, 20, 30, 3), dtype=np.uint8)
+        with FrameWriter(fname, numbered=True) as writer:
+            for frame in frames:
+                writer.submit(frame)
+        for i, frame in enumerate(frames):
+            npt.assert_array_equal(load_image(pjoin(odir, "frame_%06d.png" % i)), frame)
+
+        # Without numbering, the last frame is kept, braces are not special
+        fname = pjoin(odir, "last{id}.png")
+        with FrameWriter(fname, n_workers=3) as writer:
+            for frame in frames:
+                writer.submit(frame)
+        npt.assert_array_equal(load_image(fname), frames[-1])
+
+        # GIF animation written frame by frame
+        fname = pjoin(odir, "anim{{0}}.gif")
+        colors = np.array([[255, 0, 0], [0, 255, 0], [0, 0, 255]], dtype=np.uint8)
+        with FrameWriter(fname, fps=20, n_workers=2) as writer:
+            for color in colors:
+                writer.submit(np.broadcast_to(color, (20, 30, 3)))
+        with Image.open(fname) as gif:
+            npt.assert_equal(gif.n_frames, 3)
+            npt.assert_equal(gif.size, (30, 20))
+            npt.assert_equal(gif.info["duration"], 50)
+            npt.assert_equal(gif.info["loop"], 0)
+            for i, color in enumerate(colors):
+                gif.seek(i)
+                npt.assert_array_equal(np.asarray(gif.convert("RGB"))[0, 0], color)
+
+        npt.assert_raises(ValueError, writer.submit, frames[0])
+        npt.assert_raises(ValueError, FrameWriter, fname, max_queue_size=0)
+
+
+def test_frame_writer_back_pressure():
+    encoding = threading.Event()
+    release = threading.Event()
+
+    class SlowFrameWriter(FrameWriter):
+        def _encode(self, index, frame):
+            encoding.set()
+            release.wait()
+            return super()._encode(index, frame)
+
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    with InTemporaryDirectory() as odir:
+        writer = SlowFrameWriter(pjoin(odir, "slow.png"), max_queue_size=2, n_workers=1)
+        writer.submit(frame)
+        writer.submit(frame)
+        encoding.wait()
+        # The writer is full, the third frame waits for a free slot.
+        blocked = threading.Thread(target=writer.submit, args=(frame,))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        npt.assert_equal(blocked.is_alive(), True)
+        npt.assert_equal(writer.queue_depth, 2)
+        release.set()
+        blocked.join()
+        writer.close()
+        npt.assert_equal(writer.frames_written, 3)
+
+        # Encoding errors are raised to the caller
+        writer = FrameWriter(pjoin(odir, "frame.unknown"), numbered=True)
+        writer.submit(frame)
+        npt.assert_raises(RuntimeError, writer.close)
@@ -1,7 +1,12 @@
+import os
+from tempfile import TemporaryDirectory as InTemporaryDirectory
+
 import numpy as np
 import numpy.testing as npt
 
 from fury import molecular as mol, window
+from fury.animation import Timeline
+from fury.lib import SimpleBondPerceiver
 
 
 def test_periodic_table():
@@ -168,6 +173,36 @@ def test_compute_bonding():
     mol.compute_bonding(molecule)
     npt.assert_equal(molecule.total_num_bonds, 7)
 
+    def bonds(molecule):
+        return sorted(
+            tuple(sorted((bond.GetBeginAtomId(), bond.GetEndAtomId())))
+            for bond in map(molecule.GetBond, range(molecule.GetNumberOfBonds()))
+        )
+
+    # Same bonds as vtkSimpleBondPerceiver, searched by slabs of atoms
+    rng = np.random.default_rng(0)
+    atomic_numbers = rng.choice([1, 6, 7, 8, 16], 2000)
+    atom_coords = rng.random((2000, 3)) * 20
+    expected = mol.Molecule(atomic_numbers=atomic_numbers, coords=atom_coords)
+    bonder = SimpleBondPerceiver()
+    bonder.SetInputData(expected)
+    bonder.SetTolerance(0.1)
+    bonder.Update()
+    for n_workers in [1, 2]:
+        molecule = mol.Molecule(atomic_numbers=atomic_numbers, coords=atom_coords)
+        mol.compute_bonding(molecule, chunk_size=300, n_workers=n_workers)
+        npt.assert_equal(bonds(molecule), bonds(bonder.GetOutput()))
+        npt.assert_array_equal(mol.get_all_atomic_numbers(molecule), atomic_numbers)
+
+    # Existing bonds are kept, bonds across the periodic boundary are added
+    atom_coords = np.array([[0.2, 5, 5], [9.5, 5, 5], [1.6, 5, 5], [5, 5, 5]])
+    molecule = mol.Molecule(atomic_numbers=np.full(4, 6), coords=atom_coords)
+    mol.add_bond(molecule, 0, 3, bond_order=2)
+    mol.add_bond(molecule, 2, 0, bond_order=3)
+    mol.compute_bonding(molecule, box=(10, 10, 10))
+    npt.assert_equal(bonds(molecule), [(0, 1), (0, 2), (0, 3)])
+    npt.assert_equal(mol.get_all_bond_orders(molecule), [2, 3, 1])
+
 
 def test_sphere_cpk(interactive=False):
     atomic_numbers, atom_coords = get_default_molecular_info()
@@ -414,6 +449,81 @@ def test_ribbon(interactive=False):
         scene.clear()
 
 
+def test_residues_in_ranges():
+    chain = np.array([65, 65, 65, 65, 65, 66, 66, 66, 67])
+    residue_seq = np.array([1, 2, 5, 9, 12, 2, 5, 9, 3])
+    # Overlapping ranges of chain A, a range of chain B, none of chain C
+    ranges = np.array([[65, 1, 65, 10], [65, 3, 65, 4], [66, 4, 66, 6], [65, 8, 65, 8]])
+    npt.assert_array_equal(
+        mol._residues_in_ranges(chain, residue_seq, ranges),
+        [True, True, True, True, False, False, True, False, False],
+    )
+    npt.assert_array_equal(
+        mol._residues_in_ranges(chain, residue_seq, np.zeros((0, 4))),
+        np.zeros(len(chain), dtype=bool),
+    )
+
+    rng = np.random.default_rng(0)
+    chain = rng.integers(65, 70, 500)
+    residue_seq = rng.integers(-10, 100, 500)
+    ranges = np.zeros((20, 4), dtype=int)
+    ranges[:, 0] = ranges[:, 2] = rng.integers(65, 70, 20)
+    ranges[:, 1] = rng.integers(-10, 100, 20)
+    ranges[:, 3] = ranges[:, 1] + rng.integers(0, 20, 20)
+    expected = [
+        any(c == r[0] and r[1] <= resi <= r[3] for r in ranges)
+        for c, resi in zip(chain, residue_seq)
+    ]
+    npt.assert_array_equal(
+        mol._residues_in_ranges(chain, residue_seq, ranges), expected
+    )
+
+
+def test_trajectory():
+    rng = np.random.default_rng(0)
+    atomic_numbers = np.array([6, 6, 8, 1])
+    frames = rng.random((10, 4, 3)) * 5
+    molecule = mol.Molecule(atomic_numbers=atomic_numbers, coords=frames[0])
+    positions = mol.get_all_atomic_positions(molecule)
+    molecule_actor = mol.sphere_cpk(molecule)
+
+    with InTemporaryDirectory() as tmpdir:
+        fname = os.path.join(tmpdir, "trajectory.npy")
+        np.save(fname, frames)
+        trajectory = mol.Trajectory(
+            molecule, fname, actors=molecule_actor, fps=5, loop=False
+        )
+        npt.assert_equal(trajectory.n_frames, 10)
+        npt.assert_equal(trajectory.frame, None)
+        npt.assert_almost_equal(trajectory.duration, 2)
+
+        timeline = Timeline(animations=trajectory)
+        npt.assert_equal(trajectory.static_actors, [molecule_actor])
+        for time, frame in [(0, 0), (0.5, 2), (0.6, 3), (0.3, 1), (5, 9)]:
+            timeline.seek(time)
+            timeline.update(force=True)
+            npt.assert_equal(trajectory.frame, frame)
+            npt.assert_array_almost_equal(positions, frames[frame])
+            npt.assert_array_almost_equal(
+                mol.get_atomic_position(molecule, 2), frames[frame][2]
+            )
+        # The coordinates are updated in place.
+        new_positions = mol.get_all_atomic_positions(molecule)
+        npt.assert_equal(new_positions.ctypes.data, positions.ctypes.data)
+        trajectory.close()
+
+    # Looping trajectory without read-ahead.
+    trajectory = mol.Trajectory(molecule, frames, fps=10, read_ahead=0)
+    trajectory.update_animation(time=1.25)
+    npt.assert_equal(trajectory.frame, 2)
+    npt.assert_array_almost_equal(positions, frames[2])
+    trajectory.set_frame(-3)
+    npt.assert_equal(trajectory.frame, 0)
+    trajectory.close()
+
+    npt.assert_raises(ValueError, mol.Trajectory, molecule, frames[:, :3])
+
+
 def test_bounding_box(interactive=False):
     scene = window.Scene()
     molecule = mol.Molecule()
@@ -260,6 +260,40 @@ def test_repeat_primitive():
         npt.assert_equal(np.mean(big_vert_origin), 0)
 
 
+def test_repeat_primitive_orientations():
+    verts, faces = fp.prim_arrow()
+    centers = np.array([[0, 0, 0], [5, 0, 0], [10, 0, 0], [15, 0, 0], [0, 5, 0]])
+    dirs = np.array([[0, 2, 0], [1, 0, 0], [-3, 0, 0], [0, 0, 0], [1, 1, 1]])
+    scales = np.array([1, 2, 3, 4, 5])
+
+    res = fp.repeat_primitive(
+        verts, faces, centers, directions=dirs, colors=(1, 0, 0), scales=scales
+    )
+    big_verts, big_faces, big_colors, big_centers = res
+
+    # each instance is the scaled shape with its X axis along its direction
+    n_verts = len(verts)
+    expected_x = [[0, 1, 0], [1, 0, 0], [-1, 0, 0], [1, 0, 0], [1, 1, 1]]
+    for i, x_axis in enumerate(expected_x):
+        instance = big_verts[i * n_verts : (i + 1) * n_verts] - centers[i]
+        x_axis = np.array(x_axis) / np.linalg.norm(x_axis)
+        npt.assert_array_almost_equal(instance @ x_axis, scales[i] * verts[:, 0])
+        npt.assert_array_almost_equal(
+            np.linalg.norm(instance, axis=1), scales[i] * np.linalg.norm(verts, axis=1)
+        )
+    npt.assert_array_equal(big_faces[-len(faces) :], faces + 4 * n_verts)
+    npt.assert_array_equal(big_colors, np.tile([255, 0, 0], (5 * n_verts, 1)))
+    npt.assert_array_equal(big_centers, np.repeat(centers, n_verts, axis=0))
+
+    # a single direction is applied to every instance
+    single = fp.repeat_primitive(verts, faces, centers, directions=(0, 2, 0))[0]
+    npt.assert_array_almost_equal(single[:n_verts], big_verts[:n_verts])
+    npt.assert_array_almost_equal(
+        single[n_verts:] - np.repeat(centers[1:], n_verts, axis=0),
+        np.tile(single[:n_verts], (4, 1)),
+    )
+
+
 def test_repeat_primitive_function():
     # init variables
     centers = np.array([[0, 0, 0], [5, 0, 0], [10, 0, 0]])
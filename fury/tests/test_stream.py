@@ -15,10 +15,15 @@ else:
 
 from fury import actor, window
 from fury.stream import tools
-from fury.stream.client import FuryStreamClient, FuryStreamInteraction
+from fury.stream.client import (
+    FuryStreamClient,
+    FuryStreamInteraction,
+    coalesce_interactions,
+)
 from fury.stream.constants import _CQUEUE
 from fury.stream.server.async_app import (
     WEBRTC_AVAILABLE,
+    get_app,
     set_mouse,
     set_mouse_click,
     set_weel,
@@ -263,6 +268,138 @@ def test_client_and_buffer_manager():
         test(False, 16)
 
 
+def test_frame_encoder(loop: asyncio.AbstractEventLoop):
+    def test(use_raw_array):
+        width, height = 20, 10
+        if use_raw_array:
+            img_manager = tools.RawArrayImageBufferManager(max_window_size=(40, 30))
+            img_buffer_manager = tools.RawArrayImageBufferManager(
+                info_buffer=img_manager.info_buffer,
+                image_buffers=img_manager.image_buffers,
+            )
+        else:
+            img_manager = tools.SharedMemImageBufferManager(max_window_size=(40, 30))
+            img_buffer_manager = tools.SharedMemImageBufferManager(
+                info_buffer_name=img_manager.info_buffer_name,
+                image_buffer_names=img_manager.image_buffer_names,
+            )
+        encoder = img_buffer_manager.encoder
+        npt.assert_equal(img_buffer_manager.frame_id, 0)
+
+        img_manager.write_into(
+            width, height, np.zeros(width * height * 3, dtype=np.uint8)
+        )
+        npt.assert_equal(img_buffer_manager.frame_id, 1)
+        jpeg = img_buffer_manager.get_jpeg()
+        # the same frame is encoded only once
+        npt.assert_equal(img_buffer_manager.get_jpeg() is jpeg, True)
+        small_jpeg = img_buffer_manager.get_jpeg(scale=0.5)
+        npt.assert_equal(len(small_jpeg) < len(jpeg), True)
+        metrics = encoder.metrics
+        npt.assert_equal(metrics["frames_encoded"], 2)
+        npt.assert_equal(metrics["cache_hits"], 1)
+        npt.assert_equal(metrics["bytes_encoded"], len(jpeg) + len(small_jpeg))
+        npt.assert_equal(metrics["encode_fps"] > 0, True)
+
+        img_manager.write_into(
+            width, height, np.full(width * height * 3, 255, dtype=np.uint8)
+        )
+        npt.assert_equal(img_buffer_manager.frame_id, 2)
+        npt.assert_equal(img_buffer_manager.get_jpeg() is jpeg, False)
+        npt.assert_equal(encoder.metrics["frames_encoded"], 3)
+
+        encoder.reset_metrics()
+        npt.assert_equal(encoder.metrics["frames_encoded"], 0)
+        img_buffer_manager.cleanup()
+        img_manager.cleanup()
+
+    test(True)
+    if PY_VERSION_8:
+        test(False)
+
+    encoder = tools.JpegFrameEncoder(quality=10, cache_size=0)
+    image = np.random.randint(0, 255, size=(16, 32, 3), dtype=np.uint8)
+    low = encoder.encode(image, key=0)
+    npt.assert_equal(encoder.encode(image, key=0) is low, False)
+    npt.assert_equal(len(low) < len(tools.JpegFrameEncoder().encode(image)), True)
+
+    async def get_metrics():
+        from aiohttp.test_utils import TestClient, TestServer
+
+        img_manager = tools.RawArrayImageBufferManager(max_window_size=(40, 30))
+        app = get_app(image_buffer_manager=img_manager, provides_mjpeg=True)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/video/mjpeg?scale=2")
+            npt.assert_equal(response.status, 400)
+            response = await client.get("/metrics")
+            npt.assert_equal(response.status, 200)
+            metrics = await response.json()
+        img_manager.cleanup()
+        return metrics
+
+    metrics = loop.run_until_complete(get_metrics())
+    npt.assert_equal(metrics["frames_encoded"], 0)
+
+
+def test_skip_unchanged_frames():
+    def test(use_raw_array, num_buffers):
+        if use_raw_array:
+            img_manager = tools.RawArrayImageBufferManager(
+                max_window_size=(80, 60), num_buffers=num_buffers, skip_unchanged=True
+            )
+            img_buffer_manager = tools.RawArrayImageBufferManager(
+                info_buffer=img_manager.info_buffer,
+                image_buffers=img_manager.image_buffers,
+            )
+        else:
+            img_manager = tools.SharedMemImageBufferManager(
+                max_window_size=(80, 60), num_buffers=num_buffers, skip_unchanged=True
+            )
+            img_buffer_manager = tools.SharedMemImageBufferManager(
+                info_buffer_name=img_manager.info_buffer_name,
+                image_buffer_names=img_manager.image_buffer_names,
+            )
+
+        rng = np.random.default_rng(42)
+        width, height = 50, 41
+        frame = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+        for i in range(6):
+            if i == 4:
+                # resize
+                width, height = 40, 30
+                frame = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+            frame = frame.copy()
+            frame[i, 2 * i] = 255 - frame[i, 2 * i]
+            npt.assert_equal(img_manager.write_into(width, height, frame.ravel()), True)
+
+            # an unchanged frame is skipped and keeps its frame id
+            frame_id = img_buffer_manager.frame_id
+            npt.assert_equal(
+                img_manager.write_into(width, height, frame.ravel()), False
+            )
+            npt.assert_equal(img_buffer_manager.frame_id, frame_id)
+
+            w, h, image = img_buffer_manager.get_current_frame()
+            image = np.frombuffer(image, "uint8")[0 : w * h * 3].reshape((h, w, 3))
+            npt.assert_equal((w, h), (width, height))
+            npt.assert_array_equal(image, frame)
+
+        img_buffer_manager.cleanup()
+        img_manager.cleanup()
+
+    for num_buffers in [2, 3]:
+        test(True, num_buffers)
+        if PY_VERSION_8:
+            test(False, num_buffers)
+
+    # without skip_unchanged every frame is written
+    img_manager = tools.RawArrayImageBufferManager(max_window_size=(10, 10))
+    frame = np.zeros(10 * 10 * 3, dtype=np.uint8)
+    npt.assert_equal(img_manager.write_into(10, 10, frame), True)
+    npt.assert_equal(img_manager.write_into(10, 10, frame), True)
+    npt.assert_equal(img_manager.frame_id, 2)
+
+
 def test_stream_client_conditions():
     def test(use_raw_array, ms_stream=16, whithout_iren_start=False):
         width_0 = 100
@@ -655,6 +792,13 @@ def test_circular_queue():
         arr = np.array([1.0, 2, 3, 4])
         ok = queue.enqueue(arr)
         assert ok
+        if not use_raw_array:
+            # events are dropped while the other side holds the lock
+            queue_sh.lock()
+            assert not queue.enqueue(arr)
+            queue_sh.unlock()
+            npt.assert_equal(queue.dropped, 1)
+            npt.assert_equal(queue_sh.dropped, 0)
         queue_sh.cleanup()
         queue.cleanup()
 
@@ -722,6 +866,86 @@ def test_queue_and_webserver():
     queue.cleanup()
 
 
+def test_queue_coalescing():
+    def test(use_raw_array):
+        max_size = 4
+        dimension = _CQUEUE.dimension
+        if use_raw_array:
+            queue = tools.ArrayCircularQueue(
+                max_size=max_size, dimension=dimension, coalesce=True
+            )
+        else:
+            queue = tools.SharedMemCircularQueue(
+                max_size=max_size, dimension=dimension, coalesce=True
+            )
+        npt.assert_equal(queue.depth, 0)
+        npt.assert_equal(queue.dequeue_many().shape, (0, dimension))
+
+        # a mouse drag takes a single slot
+        for i in range(10):
+            data = {"x": i, "y": 2, "ctrlKey": 0, "shiftKey": 0, "timestampInMs": i}
+            npt.assert_equal(set_mouse(data, queue), True)
+        npt.assert_equal(queue.depth, 1)
+        npt.assert_equal(queue.coalesced, 9)
+        # a different modifier key is not merged
+        data = {"x": 0, "y": 0, "ctrlKey": 1, "shiftKey": 0, "timestampInMs": 10}
+        set_mouse(data, queue)
+        npt.assert_equal(queue.depth, 2)
+        # wheel events are summed
+        set_weel({"deltaY": 0.2, "timestampInMs": 11}, queue)
+        set_weel({"deltaY": 0.3, "timestampInMs": 12}, queue)
+        npt.assert_equal(queue.depth, 3)
+
+        data = {
+            "mouseButton": 0,
+            "on": 1,
+            "x": 0,
+            "y": 0,
+            "ctrlKey": 0,
+            "shiftKey": 0,
+            "timestampInMs": 13,
+        }
+        set_mouse_click(data, queue)
+        npt.assert_equal(queue.depth, 4)
+        npt.assert_equal(set_mouse_click(data, queue), False)
+        npt.assert_equal(queue.dropped, 1)
+
+        interactions = queue.dequeue_many(max_events=3)
+        npt.assert_equal(queue.depth, 1)
+        npt.assert_equal(interactions[:, 0], [2, 2, 1])
+        npt.assert_equal(interactions[0, _CQUEUE.index_info.x], 9)
+        npt.assert_almost_equal(interactions[2, _CQUEUE.index_info.weel], 0.5)
+        npt.assert_equal(interactions[2, _CQUEUE.index_info.user_timestamp], 12)
+        npt.assert_equal(queue.dequeue_many()[:, 0], [3])
+        npt.assert_equal(queue.depth, 0)
+        npt.assert_equal(queue.head, -1)
+        queue.cleanup()
+
+    test(True)
+    if PY_VERSION_8:
+        test(False)
+
+    # draining coalesces the consecutive events of a queue without coalescing
+    event_ids = _CQUEUE.event_ids
+    interactions = np.zeros((6, _CQUEUE.dimension))
+    interactions[:, 0] = [2, 2, 3, 1, 1, 2]
+    interactions[:, _CQUEUE.index_info.x] = np.arange(6)
+    interactions[:, _CQUEUE.index_info.weel] = [0, 0, 0, 0.1, 0.2, 0]
+    coalesced = coalesce_interactions(interactions)
+    npt.assert_equal(
+        coalesced[:, 0],
+        [
+            event_ids.mouse_move,
+            event_ids.left_btn_press,
+            event_ids.mouse_weel,
+            event_ids.mouse_move,
+        ],
+    )
+    npt.assert_equal(coalesced[:, _CQUEUE.index_info.x], [1, 2, 4, 5])
+    npt.assert_almost_equal(coalesced[2, _CQUEUE.index_info.weel], 0.3)
+    npt.assert_equal(coalesce_interactions(interactions[:0]).shape, (0, 8))
+
+
 def test_webserver():
     def test(use_raw_array):
         width_0 = 100
@@ -4,7 +4,7 @@ import numpy as np
 import numpy.testing as npt
 import pytest
 
-from fury import actor, utils, window
+from fury import actor, colormap, utils, window
 from fury.lib import (
     VTK_DOUBLE,
     VTK_FLOAT,
@@ -148,6 +148,59 @@ def test_polydata_lines():
     npt.assert_equal(utils.get_polydata_colors(PolyData()), None)
 
 
+class _ArraySequence:
+    """Minimal (data, offsets, lengths) container mimicking ArraySequence."""
+
+    def __init__(self, data, offsets, lengths):
+        self._data = data
+        self._offsets = np.asarray(offsets)
+        self._lengths = np.asarray(lengths)
+
+    def __len__(self):
+        return len(self._lengths)
+
+
+def test_polydata_lines_array_sequence():
+    rng = np.random.default_rng(42)
+    lines = [rng.random((n, 3)).astype(np.float32) for n in (3, 5, 2, 4)]
+    lengths = [len(line) for line in lines]
+    packed = _ArraySequence(np.vstack(lines), np.cumsum(lengths) - lengths, lengths)
+
+    points, res_lengths = utils.lines_to_arrays(packed)
+    npt.assert_equal(np.shares_memory(points, packed._data), True)
+    npt.assert_array_equal(res_lengths, lengths)
+
+    # Shared buffer only when explicitly requested
+    pd_lines, _ = utils.lines_to_vtk_polydata(packed, deep=False)
+    vertices = utils.get_polydata_vertices(pd_lines)
+    npt.assert_equal(np.shares_memory(vertices, packed._data), True)
+    pd_lines, _ = utils.lines_to_vtk_polydata(packed)
+    vertices = utils.get_polydata_vertices(pd_lines)
+    npt.assert_equal(np.shares_memory(vertices, packed._data), False)
+    for res, line in zip(utils.get_polydata_lines(pd_lines), lines):
+        npt.assert_array_almost_equal(res, line)
+
+    # Lines stored out of order in the buffer are gathered back in order
+    data = np.vstack(lines[::-1])
+    offsets = (np.cumsum(lengths[::-1]) - lengths[::-1])[::-1]
+    unpacked = _ArraySequence(data, offsets, lengths)
+    pd_lines, is_cmap = utils.lines_to_vtk_polydata(
+        unpacked, colors=np.arange(len(lines)), deep=False
+    )
+    npt.assert_equal(is_cmap, True)
+    for res, line in zip(utils.get_polydata_lines(pd_lines), lines):
+        npt.assert_array_almost_equal(res, line)
+    npt.assert_array_equal(
+        utils.get_polydata_colors(pd_lines), np.repeat(np.arange(4), lengths)
+    )
+
+    # Default orientation colors are computed per line
+    pd_lines, _ = utils.lines_to_vtk_polydata(packed)
+    expected = np.vstack([colormap.orient2rgb(line[-1] - line[0]) for line in lines])
+    expected = np.repeat((255 * expected).astype(np.uint8), lengths, axis=0)
+    npt.assert_array_equal(utils.get_polydata_colors(pd_lines), expected)
+
+
 def test_polydata_polygon(interactive=False):
     # Create a cube
     my_triangles = np.array(
@@ -9,7 +9,7 @@ import pytest
 from fury import actor, io, shaders, window
 from fury.animation import Animation, Timeline
 from fury.decorators import skip_osx, skip_win
-from fury.lib import ImageData, Texture, numpy_support
+from fury.lib import ImageData, RenderWindow, Texture, numpy_support
 from fury.testing import assert_greater, assert_less_equal, assert_true, captured_output
 from fury.utils import remove_observer_from_actor
 
@@ -476,6 +476,11 @@ def test_record():
         test_content(filename + "000001.png")
         test_content(filename + "000002.png")
         npt.assert_equal(os.path.isfile(filename + "000003.png"), False)
+        # Braces are part of the name, not a format pattern.
+        window.record(scene, out_path="tmp{{0}}.gif", n_frames=2)
+        npt.assert_equal(os.path.isfile("tmp{{0}}.gif"), True)
+        window.record(scene, out_path="tmp{id}", path_numbering=True)
+        test_content("tmp{id}000000.png")
 
     # test verbose
     with captured_output() as (out, _):
@@ -642,3 +647,140 @@ def test_add_animation_to_show_manager():
     assert_true(cube not in showm.scene.GetActors())
     assert_true(showm.animations == [])
     assert_true(list(showm.scene.GetActors()) == [])
+
+
+def _sphere_scene(color=(1, 0, 0)):
+    scene = window.Scene()
+    scene.add(actor.sphere(np.zeros((1, 3)), colors=color, radii=2))
+    return scene
+
+
+def test_snapshot_renderer():
+    scene = _sphere_scene()
+    expected = window.snapshot(scene, size=(100, 80))
+
+    with InTemporaryDirectory() as odir:
+        with window.SnapshotRenderer(size=(100, 80)) as renderer:
+            arr = renderer.render(scene)
+            npt.assert_equal(arr.shape, (80, 100, 3))
+            npt.assert_array_equal(arr, expected)
+
+            # The window, its buffer and the output array are reused.
+            out = np.zeros_like(arr)
+            render_window = renderer.render_window
+            npt.assert_equal(renderer.render(scene, out=out) is out, True)
+            npt.assert_array_equal(out, expected)
+            npt.assert_equal(renderer.render_window is render_window, True)
+
+            # Scene factories, sizes, cameras and files
+            fname = os.path.join(odir, "green.png")
+            arr = renderer.render(
+                lambda: _sphere_scene(color=(0, 1, 0)), size=(50, 60), fname=fname
+            )
+            npt.assert_equal(arr.shape, (60, 50, 3))
+            report = window.analyze_snapshot(arr, colors=[(0, 255, 0)])
+            npt.assert_equal(report.colors_found, [True])
+            npt.assert_array_equal(io.load_image(fname), arr)
+
+            scene.reset_camera()
+            position = np.array(scene.GetActiveCamera().GetPosition())
+            arr = renderer.render(scene, camera={"position": 10 * position})
+            npt.assert_equal(arr.shape, (60, 50, 3))
+            npt.assert_array_almost_equal(
+                scene.GetActiveCamera().GetPosition(), 10 * position
+            )
+            # the sphere is smaller when seen from further away
+            red = np.all(arr == (255, 0, 0), axis=-1)
+            npt.assert_equal(0 < red.sum() < 0.2 * red.size, True)
+
+
+def test_snapshot_pool():
+    jobs = [(_sphere_scene, None, (40, 30)), {"scene": _sphere_scene, "size": (20, 10)}]
+    with InTemporaryDirectory() as odir:
+        fname = os.path.join(odir, "sphere.png")
+        jobs.append({"scene": _sphere_scene, "size": (40, 30), "fname": fname})
+        with window.SnapshotPool(n_workers=2, size=(40, 30)) as pool:
+            results = list(pool.map(jobs))
+        npt.assert_equal(results[0].shape, (30, 40, 3))
+        npt.assert_equal(results[1].shape, (10, 20, 3))
+        npt.assert_equal(results[2], fname)
+        npt.assert_array_equal(io.load_image(fname), results[0])
+
+
+def test_render_views_out_shape():
+    scene = window.Scene()
+    render_window = RenderWindow()
+    render_window.SetSize(60, 40)
+    renderer = window.SnapshotRenderer(render_window=render_window)
+    out = np.zeros((1, 40, 60, 3), dtype=np.uint8)
+    npt.assert_raises(
+        ValueError, renderer.render_views, scene, np.zeros((2, 3)), out=out
+    )
+    # The window is left untouched by invalid arguments.
+    npt.assert_equal(render_window.HasRenderer(scene), False)
+    npt.assert_equal(render_window.GetRenderers().GetNumberOfItems(), 0)
+
+    # The camera of the scene is restored when a render fails.
+    class FailingWindow(RenderWindow):
+        def Render(self):
+            raise RuntimeError("render failed")
+
+    scene.set_camera(position=(0, 0, 10), focal_point=(0, 0, 0))
+    renderer = window.SnapshotRenderer(render_window=FailingWindow())
+    npt.assert_raises(
+        RuntimeError, renderer.render_views, scene, [(5, 5, 5), (1, 2, 3)]
+    )
+    npt.assert_array_equal(scene.GetActiveCamera().GetPosition(), (0, 0, 10))
+
+
+def test_render_views():
+    scene = _sphere_scene()
+    scene.reset_camera()
+    camera = scene.GetActiveCamera()
+    focal_point = np.array(camera.GetFocalPoint())
+    distance = camera.GetDistance()
+    angles = np.linspace(0, 2 * np.pi, 5, endpoint=False)
+    positions = (
+        focal_point
+        + distance * np.c_[np.cos(angles), np.zeros_like(angles), np.sin(angles)]
+    )
+    initial_position = camera.GetPosition()
+
+    with window.SnapshotRenderer(size=(60, 40)) as renderer:
+        views = renderer.render_views(scene, positions, view_ups=(0, 1, 0))
+        npt.assert_equal(views.shape, (5, 40, 60, 3))
+        # The camera of the scene is restored.
+        npt.assert_array_almost_equal(camera.GetPosition(), initial_position)
+        for view in views:
+            report = window.analyze_snapshot(view, colors=[(255, 0, 0)])
+            npt.assert_equal(report.colors_found, [True])
+        # A sphere looks the same from every side.
+        npt.assert_array_equal(views, np.broadcast_to(views[0], views.shape))
+
+        single = renderer.render(
+            scene, camera={"position": positions[2], "view_up": (0, 1, 0)}
+        )
+        npt.assert_array_equal(views[2], single)
+
+        # Tiled views are cut from a single large render, the window and the
+        # scene are then restored.
+        out = np.zeros_like(views)
+        tiled = renderer.render_views(
+            scene, positions, view_ups=(0, 1, 0), out=out, tile=(2, 2)
+        )
+        npt.assert_equal(tiled is out, True)
+        npt.assert_equal(renderer.render_window.GetSize(), (60, 40))
+        npt.assert_equal(renderer.render_window.GetRenderers().GetNumberOfItems(), 1)
+        for view in tiled:
+            report = window.analyze_snapshot(view, colors=[(255, 0, 0)])
+            npt.assert_equal(report.colors_found, [True])
+
+        npt.assert_raises(
+            ValueError, renderer.render_views, scene, positions, out=out[:2]
+        )
+
+    showm = window.ShowManager(scene=scene, size=(60, 40))
+    views = showm.render_views(positions[:2], tile=(1, 2))
+    npt.assert_equal(views.shape, (2, 40, 60, 3))
+    npt.assert_equal(showm.window.GetSize(), (60, 40))
+    npt.assert_equal(showm.window.HasRenderer(scene), True)
@@ -1,7 +1,6 @@
 import math
 
 import numpy as np
-from scipy.spatial.transform import Rotation as Rot  # type: ignore
 
 from fury.decorators import warn_on_args_to_kwargs
 
@@ -290,6 +289,8 @@ def rotate(quat):
            [ 0.        ,  0.        ,  0.        ,  1.        ]])
 
     """
+    from scipy.spatial.transform import Rotation as Rot
+
     iden = np.identity(3)
     rotation_mat = Rot.from_quat(quat).as_matrix()
 
@@ -392,6 +393,8 @@ def transform_from_matrix(matrix):
     scale = np.array([sx, sy, sz])
 
     rot_matrix = temp / scale[None, :]
+    from scipy.spatial.transform import Rotation as Rot
+
     rotation = Rot.from_matrix(rot_matrix)
     rot_vec = rotation.as_rotvec()
     angle = np.linalg.norm(rot_vec)
@@ -2507,6 +2507,10 @@ class ComboBox2D(UI):
 class ListBox2D(UI):
     """UI component that allows the user to select items from a list.
 
+    Only the visible values are bound to the slots of the listbox, so
+    scrolling and selecting cost the same for a handful of values or for
+    hundreds of thousands of them.
+
     Attributes
     ----------
     on_change: function
@@ -2537,8 +2541,8 @@ class ListBox2D(UI):
         Parameters
         ----------
         values: list of objects
-            Values used to populate this listbox. Objects must be castable
-            to string.
+            Values used to populate this listbox. Objects must be hashable
+            and castable to string.
         position : (float, float)
             Absolute coordinates (x, y) of the lower-left corner of this
             UI component.
@@ -2562,7 +2566,10 @@ class ListBox2D(UI):
         """
         self.view_offset = 0
         self.slots = []
-        self.selected = []
+        # Selected values, a dict being an insertion ordered set.
+        self._selection = {}
+        # Clipped messages, keyed by (message, width, font size).
+        self._clip_cache = {}
 
         self.panel_size = size
         self.font_size = font_size
@@ -2692,7 +2699,7 @@ class ListBox2D(UI):
         """
         self.panel.add_to_scene(scene)
         for slot in self.slots:
-            clip_overflow(slot.textblock, self.slot_width)
+            self._clip_slot(slot)
 
     def _get_size(self):
         return self.panel.size
@@ -2832,24 +2839,72 @@ class ListBox2D(UI):
         i_ren.force_render()
         i_ren.event.abort()
 
+    @property
+    def values(self):
+        """Return the values displayed by this listbox."""
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self._value_index = None
+
+    @property
+    def selected(self):
+        """Return the selected values, in the order they were selected."""
+        return list(self._selection)
+
+    @selected.setter
+    def selected(self, values):
+        self._selection = dict.fromkeys(values)
+
+    def _index_of(self, value):
+        """Return the position of the first occurrence of a value.
+
+        The positions are looked up in a map from the values, which is rebuilt
+        when it is outdated, e.g. after values were appended to the list.
+        """
+        index = None if self._value_index is None else self._value_index.get(value)
+        if index is None or index >= len(self.values) or self.values[index] != value:
+            self._value_index = {}
+            for i, val in enumerate(self.values):
+                self._value_index.setdefault(val, i)
+            index = self._value_index.get(value)
+            if index is None:
+                raise ValueError(f"{value!r} is not in the listbox values")
+        return index
+
+    def _clip_slot(self, slot):
+        """Clip the message of a slot to the slot width."""
+        textblock = slot.textblock
+        key = (textblock.message, self.slot_width, textblock.font_size)
+        message = self._clip_cache.get(key)
+        if message is None:
+            self._clip_cache[key] = clip_overflow(textblock, self.slot_width)
+        else:
+            textblock.message = message
+
     def update(self):
         """Refresh listbox's content."""
         view_start = self.view_offset
         view_end = view_start + self.nb_slots
         values_to_show = self.values[view_start:view_end]
 
-        # Populate slots according to the view.
+        # Populate slots according to the view, only the slots showing a new
+        # value are rebound.
         for i, choice in enumerate(values_to_show):
             slot = self.slots[i]
-            slot.element = choice
-            if slot.textblock.scene is not None:
-                clip_overflow(slot.textblock, self.slot_width)
-            slot.set_visibility(True)
-            if slot.size[1] != self.slot_height:
-                slot.resize((self.slot_width, self.slot_height))
-            if slot.element in self.selected:
+            if slot.element is not choice or slot.size[1] != self.slot_height:
+                slot.element = choice
+                if slot.textblock.scene is not None:
+                    self._clip_slot(slot)
+                slot.set_visibility(True)
+                if slot.size[1] != self.slot_height:
+                    slot.resize((self.slot_width, self.slot_height))
+            is_selected = choice in self._selection
+            if is_selected and not slot.selected:
                 slot.select()
-            else:
+            elif not is_selected and slot.selected:
                 slot.deselect()
 
         # Flush remaining slots.
@@ -2882,7 +2937,7 @@ class ListBox2D(UI):
             self.scroll_bar.height = 0
 
     def clear_selection(self):
-        del self.selected[:]
+        self._selection.clear()
 
     @warn_on_args_to_kwargs()
     def select(self, item, *, multiselect=False, range_select=False):
@@ -2904,23 +2959,24 @@ class ListBox2D(UI):
             multi_select is True.
 
         """
-        selection_idx = self.values.index(item.element)
+        selection_idx = self._index_of(item.element)
         if self.multiselection and range_select:
-            self.clear_selection()
-            step = 1 if selection_idx >= self.last_selection_idx else -1
-            for i in range(self.last_selection_idx, selection_idx + step, step):
-                self.selected.append(self.values[i])
+            if selection_idx >= self.last_selection_idx:
+                values = self.values[self.last_selection_idx : selection_idx + 1]
+            else:
+                values = self.values[selection_idx : self.last_selection_idx + 1]
+                values = values[::-1]
+            self.selected = values
 
         elif self.multiselection and multiselect:
-            if item.element in self.selected:
-                self.selected.remove(item.element)
+            if item.element in self._selection:
+                del self._selection[item.element]
             else:
-                self.selected.append(item.element)
+                self._selection[item.element] = None
             self.last_selection_idx = selection_idx
 
         else:
-            self.clear_selection()
-            self.selected.append(item.element)
+            self.selected = [item.element]
             self.last_selection_idx = selection_idx
 
         self.on_change()  # Call hook.
@@ -937,6 +937,54 @@ Text Overflow of List Box 2D"
     assert_arrays_equal(selected_values, expected)
 
 
+def test_ui_listbox_2d_selection():
+    values = [f"value_{i:05d}" for i in range(10000)]
+    listbox = ui.ListBox2D(values=values, size=(300, 300))
+    selected_values = []
+    listbox.on_change = lambda: selected_values.append(listbox.selected)
+
+    def slot_showing(value):
+        listbox.view_offset = min(values.index(value), len(values) - 5)
+        listbox.update()
+        return next(s for s in listbox.slots if s.element == value)
+
+    listbox.select(slot_showing("value_00001"))
+    listbox.select(slot_showing("value_00002"), multiselect=True)
+    listbox.select(slot_showing("value_09999"), multiselect=True)
+    listbox.select(slot_showing("value_00002"), multiselect=True)
+    listbox.select(slot_showing("value_05000"), range_select=True)
+    listbox.select(slot_showing("value_09000"))
+    listbox.select(slot_showing("value_04998"), range_select=True)
+    npt.assert_equal(
+        selected_values,
+        [
+            ["value_00001"],
+            ["value_00001", "value_00002"],
+            ["value_00001", "value_00002", "value_09999"],
+            ["value_00001", "value_09999"],
+            values[2:5001],
+            ["value_09000"],
+            values[9000:4997:-1],
+        ],
+    )
+
+    # Only the slots showing selected values are selected.
+    listbox.view_offset = 4995
+    listbox.update()
+    npt.assert_equal(
+        [slot.selected for slot in listbox.slots],
+        [slot.element in values[4998:9001] for slot in listbox.slots],
+    )
+
+    # Appended values can be selected.
+    values.append("appended")
+    listbox.select(slot_showing("appended"))
+    npt.assert_equal(listbox.selected, ["appended"])
+    listbox.clear_selection()
+    npt.assert_equal(listbox.selected, [])
+    npt.assert_raises(ValueError, listbox._index_of, "missing")
+
+
 def test_ui_listbox_2d_visibility():
     l1 = ui.ListBox2D(
         values=["Violet", "Indigo", "Blue", "Yellow"],
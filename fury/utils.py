@@ -1,7 +1,6 @@
 import numpy as np
-from scipy.ndimage import map_coordinates
 
-from fury.colormap import line_colors
+from fury.colormap import orient2rgb
 from fury.decorators import warn_on_args_to_kwargs
 from fury.lib import (
     VTK_DOUBLE,
@@ -71,12 +70,16 @@ def set_input(vtk_object, inp):
     return vtk_object
 
 
-def numpy_to_vtk_points(points):
+def numpy_to_vtk_points(points, *, deep=True):
     """Convert Numpy points array to a vtk points array.
 
     Parameters
     ----------
     points : ndarray
+    deep : bool, optional
+        If False, the vtk array wraps the numpy buffer without copying it.
+        The numpy array is kept alive by the returned object, but any later
+        modification of its content is shared with VTK.
 
     Returns
     -------
@@ -84,16 +87,19 @@ def numpy_to_vtk_points(points):
 
     """
     vtk_points = Points()
-    vtk_points.SetData(numpy_support.numpy_to_vtk(np.asarray(points), deep=True))
+    vtk_points.SetData(numpy_support.numpy_to_vtk(np.asarray(points), deep=deep))
     return vtk_points
 
 
-def numpy_to_vtk_colors(colors):
+def numpy_to_vtk_colors(colors, *, deep=True):
     """Convert Numpy color array to a vtk color array.
 
     Parameters
     ----------
     colors: ndarray
+    deep : bool, optional
+        If False and ``colors`` is already a contiguous uint8 array, the vtk
+        array wraps the numpy buffer without copying it.
 
     Returns
     -------
@@ -112,11 +118,72 @@ def numpy_to_vtk_colors(colors):
 
     """
     vtk_colors = numpy_support.numpy_to_vtk(
-        np.asarray(colors), deep=True, array_type=VTK_UNSIGNED_CHAR
+        np.asarray(colors), deep=deep, array_type=VTK_UNSIGNED_CHAR
     )
     return vtk_colors
 
 
+def is_array_sequence(lines):
+    """Check whether ``lines`` is an ArraySequence-like object.
+
+    Parameters
+    ----------
+    lines : object
+
+    Returns
+    -------
+    bool
+        True if ``lines`` exposes the ``_data``, ``_offsets`` and ``_lengths``
+        arrays of a nibabel/dipy ``ArraySequence``.
+
+    """
+    return all(hasattr(lines, attr) for attr in ("_data", "_offsets", "_lengths"))
+
+
+def lines_to_arrays(lines):
+    """Get the stacked points and the number of points of each line.
+
+    Parameters
+    ----------
+    lines : list or ArraySequence
+        list of N curves represented as 2D ndarrays, or an ArraySequence-like
+        object storing the (data, offsets, lengths) triple directly.
+
+    Returns
+    -------
+    points : ndarray (K, 3)
+        Points of all lines, stored line after line. When ``lines`` is an
+        ArraySequence whose lines are stored contiguously and in order, this is
+        its ``_data`` buffer itself (no copy).
+    lengths : ndarray (N,)
+        Number of points of each line.
+
+    """
+    if is_array_sequence(lines):
+        data = np.asarray(lines._data)
+        offsets = np.asarray(lines._offsets, dtype=np.intp)
+        lengths = np.asarray(lines._lengths, dtype=np.intp)
+        nb_points = int(lengths.sum())
+        starts = np.cumsum(lengths) - lengths
+        if len(data) == nb_points and np.array_equal(offsets, starts):
+            return data, lengths
+        # Lines are not packed (e.g. sliced sequence): gather them in order.
+        indices = np.repeat(offsets - starts, lengths) + np.arange(nb_points)
+        return data[indices], lengths
+
+    lengths = np.fromiter(
+        (len(line) for line in lines), dtype=np.intp, count=len(lines)
+    )
+    return np.vstack(lines), lengths
+
+
+def _lengths_to_offsets(lengths, dtype):
+    """Convert cell lengths to a (N + 1,) vtk offsets array."""
+    offsets = np.zeros(len(lengths) + 1, dtype=dtype)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
 @warn_on_args_to_kwargs()
 def numpy_to_vtk_cells(data, *, is_coords=True):
     """Convert numpy array to a vtk cell array.
@@ -134,40 +201,39 @@ def numpy_to_vtk_cells(data, *, is_coords=True):
         connectivity + offset information
 
     """
-    if isinstance(data, (list, np.ndarray)):
-        offsets_dtype = np.int64
-    else:
+    offsets_dtype = np.dtype(np.int64)
+    is_regular = isinstance(data, np.ndarray) and data.dtype != object
+    if is_array_sequence(data):
         offsets_dtype = np.dtype(data._offsets.dtype)
         if offsets_dtype.kind == "u":
             offsets_dtype = np.dtype(offsets_dtype.name[1:])
-    data = np.array(data, dtype=object)
-    nb_cells = len(data)
-
-    # Get lines_array in vtk input format
-    connectivity = data.flatten() if not is_coords else []
-    offset = [
-        0,
-    ]
-    current_position = 0
-
-    cell_array = CellArray()
-
-    for i in range(nb_cells):
-        current_len = len(data[i])
-        offset.append(offset[-1] + current_len)
+        lengths = np.asarray(data._lengths)
+    elif is_regular and data.ndim > 1:
+        lengths = np.full(len(data), data.shape[1], dtype=np.intp)
+    else:
+        lengths = np.fromiter(
+            (len(cell) for cell in data), dtype=np.intp, count=len(data)
+        )
 
-        if is_coords:
-            end_position = current_position + current_len
-            connectivity += list(range(current_position, end_position))
-            current_position = end_position
+    nb_cells = len(lengths)
+    offset = _lengths_to_offsets(lengths, offsets_dtype)
 
-    connectivity = np.array(connectivity, offsets_dtype)
-    offset = np.array(offset, dtype=offsets_dtype)
+    if is_coords:
+        connectivity = np.arange(offset[-1], dtype=offsets_dtype)
+    elif nb_cells and is_regular:
+        connectivity = np.ascontiguousarray(data, dtype=offsets_dtype).ravel()
+    elif nb_cells:
+        connectivity = np.concatenate(
+            [np.asarray(cell, dtype=offsets_dtype).ravel() for cell in data]
+        )
+    else:
+        connectivity = np.zeros(0, dtype=offsets_dtype)
 
+    cell_array = CellArray()
     vtk_array_type = numpy_support.get_vtk_array_type(offsets_dtype)
     cell_array.SetData(
-        numpy_support.numpy_to_vtk(offset, deep=True, array_type=vtk_array_type),
-        numpy_support.numpy_to_vtk(connectivity, deep=True, array_type=vtk_array_type),
+        numpy_support.numpy_to_vtk(offset, deep=False, array_type=vtk_array_type),
+        numpy_support.numpy_to_vtk(connectivity, deep=False, array_type=vtk_array_type),
     )
 
     cell_array.SetNumberOfCells(nb_cells)
@@ -235,6 +301,9 @@ def map_coordinates_3d_4d(input_array, indices):
     if input_array.ndim <= 2 or input_array.ndim >= 5:
         raise ValueError("Input array can only be 3d or 4d")
 
+    # scipy.ndimage is slow to import and only needed here.
+    from scipy.ndimage import map_coordinates
+
     if input_array.ndim == 3:
         return map_coordinates(input_array, indices.T, order=1)
 
@@ -247,13 +316,15 @@ def map_coordinates_3d_4d(input_array, indices):
 
 
 @warn_on_args_to_kwargs()
-def lines_to_vtk_polydata(lines, *, colors=None):
+def lines_to_vtk_polydata(lines, *, colors=None, deep=True):
     """Create a vtkPolyData with lines and colors.
 
     Parameters
     ----------
-    lines : list
-        list of N curves represented as 2D ndarrays
+    lines : list or ArraySequence
+        list of N curves represented as 2D ndarrays. An ArraySequence (e.g.
+        dipy ``Streamlines``) is ingested directly from its (data, offsets,
+        lengths) buffers without iterating over its lines.
     colors : array (N, 3), list of arrays, tuple (3,), array (K,)
         If None or False, a standard orientation colormap is used for every
         line.
@@ -273,6 +344,10 @@ def lines_to_vtk_polydata(lines, *, colors=None):
         streamline.
         If an array (X, Y, Z) or (X, Y, Z, 3) is given then the values for the
         colormap are interpolated automatically using trilinear interpolation.
+    deep : bool, optional
+        If False, the points buffer of an ArraySequence is shared with VTK
+        instead of being copied. Points stacked from a list of lines are never
+        copied a second time. Default is True.
 
     Returns
     -------
@@ -283,19 +358,25 @@ def lines_to_vtk_polydata(lines, *, colors=None):
 
     """
     # Get the 3d points_array
-    if lines.__class__.__name__ == "ArraySequence":
-        points_array = lines._data
-    else:
-        points_array = np.vstack(lines)
+    points_array, points_per_line = lines_to_arrays(lines)
 
     if points_array.size == 0:
         raise ValueError("Empty lines/streamlines data.")
 
-    # Set Points to vtk array format
-    vtk_points = numpy_to_vtk_points(points_array)
+    # Set Points to vtk array format. Arrays built here are owned by us and
+    # can be wrapped without a copy.
+    share_points = not deep or points_array is not getattr(lines, "_data", None)
+    vtk_points = numpy_to_vtk_points(points_array, deep=not share_points)
 
     # Set Lines to vtk array format
-    vtk_cell_array = numpy_to_vtk_cells(lines)
+    nb_points = len(points_array)
+    nb_lines = len(points_per_line)
+    offsets = _lengths_to_offsets(points_per_line, np.int64)
+    vtk_cell_array = CellArray()
+    vtk_cell_array.SetData(
+        numpy_support.numpy_to_vtk(offsets, deep=False),
+        numpy_support.numpy_to_vtk(np.arange(nb_points, dtype=np.int64), deep=False),
+    )
 
     # Create the poly_data
     poly_data = PolyData()
@@ -304,55 +385,54 @@ def lines_to_vtk_polydata(lines, *, colors=None):
 
     # Get colors_array (reformat to have colors for each points)
     #           - if/else tested and work in normal simple case
-    nb_points = len(points_array)
-    nb_lines = len(lines)
-    lines_range = range(nb_lines)
-    points_per_line = [len(lines[i]) for i in lines_range]
-    points_per_line = np.array(points_per_line, np.intp)
-
     color_is_scalar = False
-    if points_array.size:
-        if colors is None or colors is False:
-            # set automatic rgb colors
-            cols_arr = line_colors(lines)
-            colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
-            vtk_colors = numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
-        else:
+    if colors is None or colors is False:
+        # set automatic rgb colors from the orientation of each line
+        first = np.minimum(offsets[:-1], nb_points - 1)
+        last = np.clip(offsets[1:] - 1, 0, nb_points - 1)
+        cols_arr = orient2rgb(points_array[last] - points_array[first])
+        cols_arr = (255 * cols_arr).astype(np.uint8)
+        vtk_colors = numpy_to_vtk_colors(
+            np.repeat(cols_arr, points_per_line, axis=0), deep=False
+        )
+    else:
+        try:
             cols_arr = np.asarray(colors)
-            if cols_arr.dtype == object:  # colors is a list of colors
-                vtk_colors = numpy_to_vtk_colors(255 * np.vstack(colors))
-            else:
-                if len(cols_arr) == nb_points:
-                    if cols_arr.ndim == 1:  # values for every point
-                        vtk_colors = numpy_support.numpy_to_vtk(cols_arr, deep=True)
-                        color_is_scalar = True
-                    elif cols_arr.ndim == 2:  # map color to each point
-                        vtk_colors = numpy_to_vtk_colors(255 * cols_arr)
-
-                elif cols_arr.ndim == 1:
-                    if len(cols_arr) == nb_lines:  # values for every streamline
-                        cols_arrx = []
-                        for i, value in enumerate(colors):
-                            cols_arrx += lines[i].shape[0] * [value]
-                        cols_arrx = np.array(cols_arrx)
-                        vtk_colors = numpy_support.numpy_to_vtk(cols_arrx, deep=True)
-                        color_is_scalar = True
-                    else:  # the same colors for all points
-                        vtk_colors = numpy_to_vtk_colors(
-                            np.tile(255 * cols_arr, (nb_points, 1))
-                        )
-
-                elif cols_arr.ndim == 2:  # map color to each line
-                    colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
-                    vtk_colors = numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
-                else:  # colormap
-                    #  get colors for each vertex
-                    cols_arr = map_coordinates_3d_4d(cols_arr, points_array)
+        except ValueError:  # list of arrays with different lengths
+            cols_arr = np.asarray(colors, dtype=object)
+        if cols_arr.dtype == object:  # colors is a list of colors
+            vtk_colors = numpy_to_vtk_colors(255 * np.vstack(colors), deep=False)
+        else:
+            if len(cols_arr) == nb_points:
+                if cols_arr.ndim == 1:  # values for every point
                     vtk_colors = numpy_support.numpy_to_vtk(cols_arr, deep=True)
                     color_is_scalar = True
+                elif cols_arr.ndim == 2:  # map color to each point
+                    vtk_colors = numpy_to_vtk_colors(255 * cols_arr, deep=False)
 
-        vtk_colors.SetName("colors")
-        poly_data.GetPointData().SetScalars(vtk_colors)
+            elif cols_arr.ndim == 1:
+                if len(cols_arr) == nb_lines:  # values for every streamline
+                    cols_arrx = np.repeat(cols_arr, points_per_line)
+                    vtk_colors = numpy_support.numpy_to_vtk(cols_arrx, deep=False)
+                    color_is_scalar = True
+                else:  # the same colors for all points
+                    cols_arrx = np.empty((nb_points, len(cols_arr)), dtype=np.uint8)
+                    cols_arrx[:] = (255 * cols_arr).astype(np.uint8)
+                    vtk_colors = numpy_to_vtk_colors(cols_arrx, deep=False)
+
+            elif cols_arr.ndim == 2:  # map color to each line
+                cols_arrx = (255 * cols_arr).astype(np.uint8)
+                vtk_colors = numpy_to_vtk_colors(
+                    np.repeat(cols_arrx, points_per_line, axis=0), deep=False
+                )
+            else:  # colormap
+                #  get colors for each vertex
+                cols_arr = map_coordinates_3d_4d(cols_arr, points_array)
+                vtk_colors = numpy_support.numpy_to_vtk(cols_arr, deep=False)
+                color_is_scalar = True
+
+    vtk_colors.SetName("colors")
+    poly_data.GetPointData().SetScalars(vtk_colors)
 
     return poly_data, color_is_scalar
 
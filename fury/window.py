@@ -1,20 +1,24 @@
 # -*- coding: utf-8 -*-
+import atexit
+from concurrent.futures import ProcessPoolExecutor
 import gzip
+import multiprocessing
+import os
 from tempfile import TemporaryDirectory as InTemporaryDirectory
 from threading import Lock
 import time
 from warnings import warn
 
 import numpy as np
-from scipy import ndimage
 
 from fury import __version__ as fury_version
 import fury.animation as anim
 from fury.decorators import warn_on_args_to_kwargs
 from fury.interactor import CustomInteractorStyle
-from fury.io import load_image, save_image
+from fury.io import FrameWriter, load_image, save_image
 from fury.lib import (
     Actor2D,
+    Camera,
     Command,
     InteractorEventRecorder,
     InteractorStyleImage,
@@ -426,6 +430,7 @@ class ShowManager:
         self._timelines = []
         self._animations = []
         self._animation_callback = None
+        self._view_renderer = None
 
     def initialize(self):
         """Initialize interaction."""
@@ -791,6 +796,50 @@ class ShowManager:
         self.destroy_timers()
         self.timers.clear()
 
+    @warn_on_args_to_kwargs()
+    def render_views(
+        self, positions, *, focal_points=None, view_ups=None, out=None, tile=None
+    ):
+        """Render the scene from many camera poses with the window of the manager.
+
+        Parameters
+        ----------
+        positions : ndarray, shape (K, 3)
+            Positions of the camera.
+        focal_points : ndarray, shape (K, 3) or (3,), optional
+            Focal points of the camera. Default keeps the current one.
+        view_ups : ndarray, shape (K, 3) or (3,), optional
+            View up vectors of the camera. Default keeps the current one.
+        out : ndarray, optional
+            Array of shape (K, height, width, 3) and dtype uint8 receiving the
+            views, where ``(width, height)`` is the size of the window.
+        tile : (int, int), optional
+            ``(rows, columns)`` of a grid of views drawn in a single render.
+            The window is enlarged during the call.
+
+        Returns
+        -------
+        out : ndarray
+            Array of shape (K, height, width, 3) holding the views.
+
+        See Also
+        --------
+        SnapshotRenderer.render_views
+
+        """
+        if self._view_renderer is None:
+            self._view_renderer = SnapshotRenderer(
+                order_transparent=self.order_transparent, render_window=self.window
+            )
+        return self._view_renderer.render_views(
+            self.scene,
+            positions,
+            focal_points=focal_points,
+            view_ups=view_ups,
+            out=out,
+            tile=tile,
+        )
+
     @warn_on_args_to_kwargs()
     def save_screenshot(self, fname, *, magnification=1, size=None, stereo=None):
         """Save a screenshot of the current window in the specified filename.
@@ -946,11 +995,14 @@ def record(
     screen_clip=False,
     stereo="off",
     verbose=False,
+    fps=30,
+    max_queue_size=8,
+    n_workers=None,
 ):
     """Record a video of your scene.
 
-    Records a video as a series of ``.png`` files of your scene by rotating the
-    azimuth angle az_angle in every frame.
+    Records a video as a series of ``.png`` files, a GIF or a MP4 video of
+    your scene by rotating the azimuth angle az_angle in every frame.
 
     Parameters
     ----------
@@ -966,6 +1018,8 @@ def record(
         vector is used.
     out_path : str, optional
         Output path for the frames. If None a default fury.png is created.
+        If it ends with '.gif' or '.mp4' (requires OpenCV) all the frames are
+        saved in a single animation.
     path_numbering : bool
         When recording it changes out_path to out_path + str(frame number)
     n_frames : int, optional
@@ -998,7 +1052,16 @@ def record(
         * 'horizontal': Side-by-side.
 
     verbose : bool
-        print information about the camera. Default is False.
+        print information about the camera and the recording speed.
+        Default is False.
+    fps : int, optional
+        Frames per second of a GIF or MP4 animation.
+    max_queue_size : int, optional
+        Maximum number of rendered frames waiting to be written. Rendering
+        pauses when it is reached, which bounds the memory used.
+    n_workers : int, optional
+        Number of threads encoding and writing the frames.
+        See :class:`fury.io.FrameWriter`.
 
     Examples
     --------
@@ -1052,34 +1115,45 @@ def record(
         print("Camera Focal Point (%.2f, %.2f, %.2f)" % cam.GetFocalPoint())
         print("Camera View Up (%.2f, %.2f, %.2f)" % cam.GetViewUp())
 
-    for i in range(n_frames):
-        scene.GetActiveCamera().Azimuth(ang)
-        renderLarge = RenderLargeImage()
-        renderLarge.SetInput(scene)
-        renderLarge.SetMagnification(magnification)
-        renderLarge.Update()
+    fname = "fury.png" if out_path is None else out_path
+    extension = os.path.splitext(fname)[1].lower()
+    numbered = path_numbering and extension not in (".gif", ".mp4")
+    if numbered:
+        # The frame writer adds the frame number before the extension.
+        fname = ("" if out_path is None else out_path) + ".png"
+
+    # Frames are encoded and written by background threads while the next
+    # ones are rendered.
+    writer = FrameWriter(
+        fname,
+        fps=fps,
+        numbered=numbered,
+        max_queue_size=max_queue_size,
+        n_workers=n_workers,
+    )
+    try:
+        for _ in range(n_frames):
+            scene.GetActiveCamera().Azimuth(ang)
+            renderLarge.Modified()
+            renderLarge.Update()
+
+            arr = numpy_support.vtk_to_numpy(
+                renderLarge.GetOutput().GetPointData().GetScalars()
+            )
+            w, h, _ = renderLarge.GetOutput().GetDimensions()
+            components = renderLarge.GetOutput().GetNumberOfScalarComponents()
+            arr = arr.reshape((h, w, components))
+            writer.submit(np.flipud(arr))
 
-        if path_numbering:
-            if out_path is None:
-                filename = str(i).zfill(6) + ".png"
-            else:
-                filename = out_path + str(i).zfill(6) + ".png"
-        else:
-            if out_path is None:
-                filename = "fury.png"
-            else:
-                filename = out_path
+            ang = +az_ang
+    finally:
+        writer.close()
 
-        arr = numpy_support.vtk_to_numpy(
-            renderLarge.GetOutput().GetPointData().GetScalars()
+    if verbose:
+        print(
+            "Recorded %d frames at %.2f fps (mean encoding latency %.3f s)"
+            % (writer.frames_written, writer.write_fps, writer.encode_latency)
         )
-        w, h, _ = renderLarge.GetOutput().GetDimensions()
-        components = renderLarge.GetOutput().GetNumberOfScalarComponents()
-        arr = arr.reshape((h, w, components))
-        arr = np.flipud(arr)
-        save_image(arr, filename)
-
-        ang = +az_ang
 
     renWin.RemoveRenderer(scene)
     renWin.Finalize()
@@ -1235,6 +1309,433 @@ def snapshot(
     return arr
 
 
+class SnapshotRenderer:
+    """Render many snapshots with a single offscreen window.
+
+    :func:`snapshot` creates and configures a new render window for every
+    call. This class keeps one offscreen window (and its OpenGL context)
+    alive, swaps the scenes rendered in it and reads the pixels directly into
+    a preallocated buffer.
+
+    Parameters
+    ----------
+    size : (int, int), optional
+        ``(width, height)`` of the window. Default is (300, 300).
+    order_transparent : bool, optional
+        Use depth peeling to sort transparent objects. If True also enables
+        anti-aliasing.
+    multi_samples : int, optional
+        Number of samples for anti-aliasing (Default 8).
+        For no anti-aliasing use 0.
+    max_peels : int, optional
+        Maximum number of peels for depth peeling (Default 4).
+    occlusion_ratio : float, optional
+        Occlusion ratio for depth peeling (Default 0 - exact image).
+    render_window : RenderWindow, optional
+        Existing window to render into, e.g. the window of a
+        :class:`ShowManager`. It is left open by :meth:`close` and the scenes
+        it already holds are kept. Default creates an offscreen window.
+
+    Examples
+    --------
+    >>> from fury import window, actor
+    >>> renderer = window.SnapshotRenderer(size=(64, 64))
+    >>> scene = window.Scene()
+    >>> scene.add(actor.axes())
+    >>> # thumbnails = [renderer.render(scene, camera={"position": (i, 0, 5)})
+    >>> #               for i in range(10)]
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(
+        self,
+        *,
+        size=(300, 300),
+        order_transparent=False,
+        multi_samples=8,
+        max_peels=4,
+        occlusion_ratio=0.0,
+        render_window=None,
+    ):
+        self.order_transparent = order_transparent
+        self.multi_samples = multi_samples
+        self.max_peels = max_peels
+        self.occlusion_ratio = occlusion_ratio
+        self._own_window = render_window is None
+        if self._own_window:
+            render_window = RenderWindow()
+            render_window.SetOffScreenRendering(1)
+            render_window.SetSize(*size)
+        self.render_window = render_window
+        self.scene = None
+        self._scene_added = False
+        self._tiles = []
+        self._hidden_renderers = []
+        self._buffer = None
+        self._vtk_buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _set_scene(self, scene):
+        if scene is self.scene:
+            return
+        self._remove_scene()
+        # Only the scenes added here are removed later on.
+        self._scene_added = not self.render_window.HasRenderer(scene)
+        if self._scene_added:
+            self.render_window.AddRenderer(scene)
+            self._set_transparency(scene)
+        self.scene = scene
+
+    def _remove_scene(self):
+        if self.scene is not None and self._scene_added:
+            self.render_window.RemoveRenderer(self.scene)
+        self.scene = None
+        self._scene_added = False
+
+    def _set_transparency(self, scene):
+        if self.order_transparent:
+            antialiasing(
+                scene,
+                self.render_window,
+                multi_samples=self.multi_samples,
+                max_peels=self.max_peels,
+                occlusion_ratio=self.occlusion_ratio,
+            )
+
+    def _set_size(self, size):
+        if size is not None and tuple(size) != self.render_window.GetSize():
+            self.render_window.SetSize(*size)
+
+    def _read_pixels(self):
+        """Return a top-first view of the pixels of the last render."""
+        width, height = self.render_window.GetSize()
+        if self._buffer is None or self._buffer.shape[:2] != (height, width):
+            self._buffer = np.empty((height, width, 3), dtype=np.uint8)
+            self._vtk_buffer = numpy_support.numpy_to_vtk(
+                self._buffer.reshape((-1, 3)), deep=False
+            )
+        # The pixels are read straight into the numpy buffer, bottom row first.
+        self.render_window.GetPixelData(
+            0, 0, width - 1, height - 1, 1, self._vtk_buffer, 0
+        )
+        return np.flipud(self._buffer)
+
+    @warn_on_args_to_kwargs()
+    def render(self, scene, *, camera=None, size=None, fname=None, out=None, dpi=72):
+        """Render a snapshot of a scene.
+
+        Parameters
+        ----------
+        scene : Scene or callable
+            Scene to render, or a function without arguments returning it.
+        camera : dict or Camera, optional
+            Camera used for this snapshot. Either the keyword arguments of
+            :meth:`Scene.set_camera` (``position``, ``focal_point``,
+            ``view_up``) or a camera whose parameters are copied.
+        size : (int, int), optional
+            ``(width, height)`` of the snapshot. Default is the current size
+            of the window.
+        fname : str, optional
+            If given, also save the snapshot in this file.
+        out : ndarray, optional
+            Array of shape (height, width, 3) and dtype uint8 receiving the
+            snapshot. If None, a new array is returned.
+        dpi : float or (float, float), optional
+            Dots per inch (dpi) of the saved image.
+
+        Returns
+        -------
+        arr : ndarray
+            Color array of shape (height, width, 3) with the first row at the
+            top.
+
+        """
+        if callable(scene):
+            scene = scene()
+        self._set_scene(scene)
+        self._set_size(size)
+        if isinstance(camera, dict):
+            scene.set_camera(**camera)
+        elif camera is not None:
+            scene.GetActiveCamera().DeepCopy(camera)
+            scene.ResetCameraClippingRange()
+        self.render_window.Render()
+
+        arr = self._read_pixels()
+        if out is None:
+            out = arr.copy()
+        else:
+            np.copyto(out, arr)
+
+        if fname is not None:
+            save_image(out, fname, dpi=dpi)
+        return out
+
+    @warn_on_args_to_kwargs()
+    def render_views(
+        self,
+        scene,
+        positions,
+        *,
+        focal_points=None,
+        view_ups=None,
+        size=None,
+        out=None,
+        tile=None,
+    ):
+        """Render a scene from many camera poses in one call.
+
+        The window, the pixel buffer and the scene are set up once and only
+        the camera changes between two views. The camera of the scene is
+        restored afterwards.
+
+        Parameters
+        ----------
+        scene : Scene or callable
+            Scene to render, or a function without arguments returning it.
+        positions : ndarray, shape (K, 3)
+            Positions of the camera.
+        focal_points : ndarray, shape (K, 3) or (3,), optional
+            Focal points of the camera. Default keeps the current one.
+        view_ups : ndarray, shape (K, 3) or (3,), optional
+            View up vectors of the camera. Default keeps the current one.
+        size : (int, int), optional
+            ``(width, height)`` of each view. Default is the current size of
+            the window.
+        out : ndarray, optional
+            Array of shape (K, height, width, 3) and dtype uint8 receiving the
+            views. If None, a new array is allocated.
+        tile : (int, int), optional
+            ``(rows, columns)`` of a grid of views drawn together in a single
+            render of a larger window, the views are then cut out of it.
+            This reduces the number of renders and pixel transfers by
+            ``rows * columns``.
+
+        Returns
+        -------
+        out : ndarray
+            Array of shape (K, height, width, 3) holding the views.
+
+        """
+        if callable(scene):
+            scene = scene()
+        positions = np.asarray(positions, dtype=float).reshape((-1, 3))
+        n_views = len(positions)
+        camera = scene.GetActiveCamera()
+        if focal_points is None:
+            focal_points = camera.GetFocalPoint()
+        if view_ups is None:
+            view_ups = camera.GetViewUp()
+        focal_points = np.broadcast_to(focal_points, (n_views, 3))
+        view_ups = np.broadcast_to(view_ups, (n_views, 3))
+
+        width, height = self.render_window.GetSize() if size is None else size
+        if out is None:
+            out = np.empty((n_views, height, width, 3), dtype=np.uint8)
+        elif out.shape != (n_views, height, width, 3):
+            raise ValueError(
+                f"out should be of shape {(n_views, height, width, 3)}, not {out.shape}"
+            )
+        self._set_scene(scene)
+
+        if tile is None:
+            self._set_size((width, height))
+            saved_camera = Camera()
+            saved_camera.DeepCopy(camera)
+            try:
+                for i in range(n_views):
+                    camera.SetPosition(*positions[i])
+                    camera.SetFocalPoint(*focal_points[i])
+                    camera.SetViewUp(*view_ups[i])
+                    scene.ResetCameraClippingRange()
+                    self.render_window.Render()
+                    out[i] = self._read_pixels()
+            finally:
+                camera.DeepCopy(saved_camera)
+                scene.ResetCameraClippingRange()
+            return out
+
+        n_rows, n_cols = tile
+        previous_size = self.render_window.GetSize()
+        tiles = self._set_tiles(scene, n_rows, n_cols)
+        self._set_size((n_cols * width, n_rows * height))
+        try:
+            for start in range(0, n_views, len(tiles)):
+                for i, tile_scene in enumerate(tiles, start):
+                    tile_scene.SetDraw(i < n_views)
+                    if i < n_views:
+                        tile_scene.set_camera(
+                            position=positions[i],
+                            focal_point=focal_points[i],
+                            view_up=view_ups[i],
+                        )
+                self.render_window.Render()
+                image = self._read_pixels()
+                for i in range(start, min(start + len(tiles), n_views)):
+                    row, col = divmod(i - start, n_cols)
+                    out[i] = image[
+                        row * height : (row + 1) * height,
+                        col * width : (col + 1) * width,
+                    ]
+        finally:
+            self._remove_tiles()
+            self._set_size(previous_size)
+        return out
+
+    def _set_tiles(self, scene, n_rows, n_cols):
+        """Replace the renderers of the window by a grid sharing the props."""
+        if len(self._tiles) != n_rows * n_cols:
+            self._tiles = [Scene() for _ in range(n_rows * n_cols)]
+        self._hidden_renderers = []
+        renderers = self.render_window.GetRenderers()
+        renderers.InitTraversal()
+        for _ in range(renderers.GetNumberOfItems()):
+            self._hidden_renderers.append(renderers.GetNextItem())
+        for renderer in self._hidden_renderers:
+            self.render_window.RemoveRenderer(renderer)
+
+        props = scene.GetViewProps()
+        for i, tile_scene in enumerate(self._tiles):
+            row, col = divmod(i, n_cols)
+            # The first row of tiles is at the top of the window.
+            tile_scene.SetViewport(
+                col / n_cols,
+                1 - (row + 1) / n_rows,
+                (col + 1) / n_cols,
+                1 - row / n_rows,
+            )
+            tile_scene.SetBackground(scene.GetBackground())
+            # Same projection as the scene, only the pose changes per view.
+            tile_scene.GetActiveCamera().DeepCopy(scene.GetActiveCamera())
+            tile_scene.RemoveAllViewProps()
+            props.InitTraversal()
+            for _ in range(props.GetNumberOfItems()):
+                tile_scene.AddViewProp(props.GetNextProp())
+            tile_scene.SetDraw(True)
+            self.render_window.AddRenderer(tile_scene)
+            self._set_transparency(tile_scene)
+        return self._tiles
+
+    def _remove_tiles(self):
+        for tile_scene in self._tiles:
+            self.render_window.RemoveRenderer(tile_scene)
+            # The props stay referenced by the scene only.
+            tile_scene.RemoveAllViewProps()
+        for renderer in self._hidden_renderers:
+            self.render_window.AddRenderer(renderer)
+        self._hidden_renderers = []
+
+    def close(self):
+        """Release the render window and its OpenGL context.
+
+        A window given at creation is left open, only the scenes added by this
+        renderer are removed from it.
+        """
+        self._remove_scene()
+        self._tiles = []
+        if self._own_window:
+            self.render_window.Finalize()
+
+
+# Renderer of the current process, used by the SnapshotPool workers.
+_pool_renderer = None
+
+
+def _init_pool_renderer(renderer_kwargs):
+    global _pool_renderer
+    _pool_renderer = SnapshotRenderer(**renderer_kwargs)
+    atexit.register(_pool_renderer.close)
+
+
+def _render_pool_job(job):
+    if not isinstance(job, dict):
+        job = dict(zip(("scene", "camera", "size", "fname"), job))
+    arr = _pool_renderer.render(**job)
+    return arr if job.get("fname") is None else job["fname"]
+
+
+class SnapshotPool:
+    """Render a stream of snapshots with a pool of processes.
+
+    Each process keeps a :class:`SnapshotRenderer`, its offscreen window is
+    created once and reused for all the jobs of this process.
+
+    Parameters
+    ----------
+    n_workers : int, optional
+        Number of processes. Default is ``os.cpu_count()``.
+    mp_context : str, optional
+        Multiprocessing start method. 'spawn' avoids sharing the parent's
+        graphics state with the workers.
+    **renderer_kwargs
+        Parameters of the :class:`SnapshotRenderer` of each process.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> from fury import window
+    >>> def make_scene(path):  # doctest: +SKIP
+    ...     scene = window.Scene()
+    ...     scene.add(load_my_actor(path))
+    ...     return scene
+    >>> jobs = [{"scene": partial(make_scene, p), "fname": p + ".png"}
+    ...         for p in ["a", "b"]]
+    >>> # with window.SnapshotPool(n_workers=4, size=(128, 128)) as pool:
+    >>> #     for fname in pool.map(jobs):
+    >>> #         print(fname)
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(self, *, n_workers=None, mp_context="spawn", **renderer_kwargs):
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_pool_renderer,
+            initargs=(renderer_kwargs,),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @warn_on_args_to_kwargs()
+    def map(self, jobs, *, chunksize=1):
+        """Render the jobs and return their results in order.
+
+        Parameters
+        ----------
+        jobs : iterable
+            Each job is a dict of :meth:`SnapshotRenderer.render` arguments
+            or a tuple ``(scene, camera, size, fname)`` (trailing items can
+            be omitted). Jobs are sent to other processes, so the scene
+            should be a picklable factory (e.g. a module level function or a
+            ``functools.partial`` of one) rather than a Scene.
+        chunksize : int, optional
+            Number of jobs sent at once to a process.
+
+        Returns
+        -------
+        results : iterator
+            Iterator over the snapshots, or their file names for the jobs
+            having a ``fname``.
+
+        """
+        return self._executor.map(_render_pool_job, jobs, chunksize=chunksize)
+
+    def close(self):
+        """Wait for the pending jobs and stop the processes."""
+        self._executor.shutdown()
+
+
 def analyze_scene(scene):
     class ReportScene:
         bg_color = None
@@ -1320,6 +1821,8 @@ def analyze_snapshot(
         if strel is None:
             strel = np.array([[1, 1, 1], [1, 1, 1], [1, 1, 1]])
 
+        from scipy import ndimage
+
         labels, objects = ndimage.label(gray != background, strel)
         report.labels = labels
         report.objects = objects